@@ -1,35 +1,200 @@
 # Standard library imports
+import asyncio
+import base64
+import itertools
+import json
+from collections import OrderedDict
+from dataclasses import asdict
 from datetime import datetime
-from typing import List
-import uuid
+from email.utils import formatdate, parsedate_to_datetime
+from typing import AsyncIterator, Dict, FrozenSet, List, Optional, Tuple
 
 # Third-party imports
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from syft_core import Client
 
+from syft_datasets import Dataset as CatalogDataset
+from syft_datasets.events import CatalogEvent
+
 # Local imports
+from .concurrency import run_blocking
+from .config import get_settings
 from .models import (
+    SORT_PATTERN,
     Dataset,
-    ListDatasetsResponse,
-    SearchDatasetsRequest,
+    DatasiteStatus,
+    FacetsResponse,
     FilterByEmailRequest,
     HealthResponse,
+    ListDatasetsResponse,
+    PageRequest,
+    PreviewResponse,
+    RefreshResponse,
+    SearchDatasetsRequest,
+)
+from .preview import preview_body
+from .serialization import JSONBytesResponse, dataset_serializer, stream_message
+from .utils import (
+    app_status,
+    cached_client,
+    datasite_status,
+    get_datasets_collection,
+    load_client,
+    refresh_catalog,
+    subscribe_catalog,
 )
-from .utils import get_datasets_collection
 
 
-# Dependency for getting client
+# Dependency for getting client: loaded once per process, off the event loop
 async def get_client() -> Client:
+    client = cached_client()
+    if client is not None:
+        return client
     try:
-        return Client.load()
+        return await run_blocking(load_client)
     except Exception as e:
         logger.error(f"Failed to load client: {e}")
         raise HTTPException(status_code=500, detail="Failed to initialize client")
 
 
-api_router = APIRouter(prefix="/api", dependencies=[Depends(get_client)])
-v1_router = APIRouter(prefix="/v1", dependencies=[Depends(get_client)])
+api_router = APIRouter(prefix="/api")
+v1_router = APIRouter(prefix="/v1")
+
+# Seconds between keep-alive messages on idle catalog streams
+STREAM_HEARTBEAT_INTERVAL = 15.0
+
+# Recent live events and their serialization, shared by every stream so an event
+# is serialized once however many clients are subscribed
+_event_messages: "OrderedDict[int, Tuple[CatalogEvent, asyncio.Future]]" = OrderedDict()
+
+# --------------- Pagination Helpers ---------------
+
+
+def _encode_cursor(sort: str, after: Tuple[str, str]) -> str:
+    """Opaque cursor pointing just after the dataset ``after`` in ``sort`` order"""
+    payload = json.dumps({"sort": sort, "after": list(after)}).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def _decode_cursor(cursor: str, sort: str) -> Tuple[str, str]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        name, email = payload["after"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if payload.get("sort") != sort:
+        raise HTTPException(status_code=400, detail="Cursor was issued for a different sort order")
+    return str(name), str(email)
+
+
+def _selected_fields(fields: Optional[List[str]]) -> Optional[FrozenSet[str]]:
+    if fields is None:
+        return None
+    selected = {field.strip() for field in fields if field.strip()}
+    unknown = selected - set(Dataset.model_fields)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return frozenset(selected | {"id"})
+
+
+def _list_response(collection, page: PageRequest, headers: Dict[str, str]) -> JSONBytesResponse:
+    """One page of ``collection``, sorted, reduced to the requested fields and serialized"""
+    settings = get_settings()
+    limit = min(page.limit or settings.default_page_size, settings.max_page_size)
+    descending = page.sort.startswith("-")
+    sort = page.sort.lstrip("-")
+    fields = _selected_fields(page.fields)
+    after = _decode_cursor(page.cursor, page.sort) if page.cursor else None
+
+    datasets, next_after = collection.page(limit, after=after, sort=sort, descending=descending)
+    next_cursor = _encode_cursor(page.sort, next_after) if next_after else None
+    modified_at = datetime.fromtimestamp(collection.last_modified)
+    body = dataset_serializer.list_body(
+        datasets, len(collection), next_cursor, fields, modified_at=modified_at
+    )
+    return JSONBytesResponse(body, headers=headers)
+
+
+# --------------- Conditional Requests ---------------
+
+
+def _catalog_headers(collection) -> Dict[str, str]:
+    """Validators identifying the catalog generation ``collection`` was taken from
+
+    The build time is part of the ETag so that workers loading catalogs
+    independently never hand out the same tag for different content.
+    """
+    built_ms = int(collection.last_modified * 1000)
+    return {
+        "ETag": f'"{collection.generation}-{built_ms:x}"',
+        "Last-Modified": formatdate(collection.last_modified, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+
+
+def _not_modified(request: Request, headers: Dict[str, str]) -> Optional[Response]:
+    """A ``304`` response if the client's cached copy is still current"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        fresh = "*" in tags or headers["ETag"] in tags
+    else:
+        try:
+            since = parsedate_to_datetime(request.headers["if-modified-since"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return None
+        fresh = int(parsedate_to_datetime(headers["Last-Modified"]).timestamp()) <= since
+    return Response(status_code=304, headers=headers) if fresh else None
+
+
+def _catalog_page(page: PageRequest, request: Optional[Request] = None, select=None) -> Response:
+    """One page of the catalog, or of ``select(catalog)`` (blocking; run in the executor)
+
+    With a ``request``, answers ``304`` if the client's copy is still current.
+    """
+    collection = get_datasets_collection()
+    headers = _catalog_headers(collection)
+    if request is not None:
+        not_modified = _not_modified(request, headers)
+        if not_modified is not None:
+            return not_modified
+    if select is not None:
+        collection = select(collection)
+    return _list_response(collection, page, headers)
+
+
+def _ranked_search(search: SearchDatasetsRequest) -> Response:
+    """Best matches of ``search.keyword``, most relevant first (blocking; run in the executor)
+
+    Like every POST endpoint, never answers ``304``.
+    """
+    if search.cursor:
+        raise HTTPException(status_code=400, detail="Ranked search results are not paginated")
+    collection = get_datasets_collection()
+    headers = _catalog_headers(collection)
+
+    settings = get_settings()
+    limit = min(search.limit or settings.default_page_size, settings.max_page_size)
+    fields = _selected_fields(search.fields)
+    results = collection.search(search.keyword, ranked=True, limit=limit, fuzzy=search.fuzzy)
+    modified_at = datetime.fromtimestamp(collection.last_modified)
+    body = dataset_serializer.list_body(
+        results, len(results), None, fields, modified_at=modified_at
+    )
+    return JSONBytesResponse(body, headers=headers)
+
+
+def _catalog_json(request: Request, render) -> Response:
+    """``render(catalog)`` as a conditional JSON response (blocking; run in the executor)"""
+    collection = get_datasets_collection()
+    headers = _catalog_headers(collection)
+    not_modified = _not_modified(request, headers)
+    if not_modified is not None:
+        return not_modified
+    return JSONBytesResponse(json.dumps(render(collection)).encode(), headers=headers)
+
 
 # --------------- Dataset Endpoints ---------------
 
@@ -38,37 +203,32 @@ v1_router = APIRouter(prefix="/v1", dependencies=[Depends(get_client)])
     "/datasets",
     tags=["datasets"],
     summary="List all datasets",
-    description="Retrieve a list of all available datasets in the SyftBox ecosystem",
+    description="Retrieve a page of the datasets available in the SyftBox ecosystem; "
+    "follow next_cursor for the next page",
+    response_model=ListDatasetsResponse,
 )
 async def list_datasets(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, description="Datasets per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    sort: str = Query(
+        "name", pattern=SORT_PATTERN, description="name or email, '-' for descending"
+    ),
+    fields: Optional[str] = Query(None, description="Comma-separated dataset fields to return"),
+    tag: Optional[List[str]] = Query(None, description="Only datasets with one of these tags"),
     client: Client = Depends(get_client),
-) -> ListDatasetsResponse:
+) -> JSONBytesResponse:
     try:
-        datasets_collection = get_datasets_collection(client)
-        
-        # Convert to API models
-        api_datasets = []
-        for dataset in datasets_collection._datasets:
-            api_dataset = Dataset(
-                id=str(uuid.uuid4()),  # Generate unique ID for UI
-                name=dataset.name,
-                email=dataset.email,
-                syft_url=dataset.syft_url,
-                description=f"Dataset from {dataset.email}",
-                created_at=datetime.now(),  # TODO: Get actual creation time if available
-                updated_at=datetime.now(),  # TODO: Get actual update time if available
-                size="Unknown",  # TODO: Get actual size if available
-                type="dataset",  # TODO: Get actual type if available
-                tags=[dataset.email.split("@")[1] if "@" in dataset.email else dataset.email]
-            )
-            api_datasets.append(api_dataset)
-        
-        return ListDatasetsResponse(
-            datasets=api_datasets,
-            total_count=len(api_datasets),
-            unique_emails=datasets_collection.list_unique_emails(),
-            unique_names=datasets_collection.list_unique_names(),
+        page = PageRequest(
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
+            fields=fields.split(",") if fields is not None else None,
         )
+        select = (lambda catalog: catalog.filter_by_tag(tag)) if tag else None
+        return await run_blocking(_catalog_page, page, request, select)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing datasets: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -78,39 +238,22 @@ async def list_datasets(
     "/datasets/search",
     tags=["datasets"],
     summary="Search datasets",
-    description="Search for datasets containing a keyword in name or email",
+    description="Search for datasets containing a keyword in name or email; with ranked, "
+    "the limit best matches by relevance, tolerating typos",
+    response_model=ListDatasetsResponse,
 )
 async def search_datasets(
     request: SearchDatasetsRequest,
     client: Client = Depends(get_client),
-) -> ListDatasetsResponse:
+) -> JSONBytesResponse:
     try:
-        datasets_collection = get_datasets_collection(client)
-        search_results = datasets_collection.search(request.keyword)
-        
-        # Convert to API models
-        api_datasets = []
-        for dataset in search_results._datasets:
-            api_dataset = Dataset(
-                id=str(uuid.uuid4()),
-                name=dataset.name,
-                email=dataset.email,
-                syft_url=dataset.syft_url,
-                description=f"Dataset from {dataset.email}",
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
-                size="Unknown",
-                type="dataset",
-                tags=[dataset.email.split("@")[1] if "@" in dataset.email else dataset.email]
-            )
-            api_datasets.append(api_dataset)
-        
-        return ListDatasetsResponse(
-            datasets=api_datasets,
-            total_count=len(api_datasets),
-            unique_emails=search_results.list_unique_emails(),
-            unique_names=search_results.list_unique_names(),
+        if request.ranked:
+            return await run_blocking(_ranked_search, request)
+        return await run_blocking(
+            _catalog_page, request, select=lambda catalog: catalog.search(request.keyword)
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error searching datasets: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -121,55 +264,189 @@ async def search_datasets(
     tags=["datasets"],
     summary="Filter datasets by email",
     description="Filter datasets by email pattern",
+    response_model=ListDatasetsResponse,
 )
 async def filter_datasets_by_email(
     request: FilterByEmailRequest,
     client: Client = Depends(get_client),
-) -> ListDatasetsResponse:
+) -> JSONBytesResponse:
     try:
-        datasets_collection = get_datasets_collection(client)
-        filtered_results = datasets_collection.filter_by_email(request.email_pattern)
-        
-        # Convert to API models
-        api_datasets = []
-        for dataset in filtered_results._datasets:
-            api_dataset = Dataset(
-                id=str(uuid.uuid4()),
-                name=dataset.name,
-                email=dataset.email,
-                syft_url=dataset.syft_url,
-                description=f"Dataset from {dataset.email}",
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
-                size="Unknown",
-                type="dataset",
-                tags=[dataset.email.split("@")[1] if "@" in dataset.email else dataset.email]
-            )
-            api_datasets.append(api_dataset)
-        
-        return ListDatasetsResponse(
-            datasets=api_datasets,
-            total_count=len(api_datasets),
-            unique_emails=filtered_results.list_unique_emails(),
-            unique_names=filtered_results.list_unique_names(),
+        return await run_blocking(
+            _catalog_page,
+            request,
+            select=lambda catalog: catalog.filter_by_email(request.email_pattern),
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error filtering datasets: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@v1_router.post(
+    "/datasets/refresh",
+    tags=["datasets"],
+    summary="Refresh the catalog",
+    description="Re-query the datasites that changed on disk; concurrent requests share "
+    "one refresh",
+)
+async def refresh_datasets(
+    force: bool = Query(False, description="Ignore the catalog cache and query every datasite"),
+    client: Client = Depends(get_client),
+) -> RefreshResponse:
+    try:
+        collection = await refresh_catalog(force=force)
+        return RefreshResponse(generation=collection.generation, total_count=len(collection))
+    except Exception as e:
+        logger.error(f"Error refreshing datasets: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@v1_router.get(
+    "/datasets/stream",
+    tags=["datasets"],
+    summary="Stream the catalog",
+    description="Stream the datasets as NDJSON or Server-Sent Events: one 'add' event per "
+    "datasite known so far, a 'ready' event, then live 'add'/'remove' events as datasites "
+    "are queried or change, and a 'generation' event after each catalog update. A client "
+    "that falls too far behind gets a 'reset' event and is disconnected; it should reconnect",
+)
+async def stream_datasets(
+    request: Request,
+    format: Optional[str] = Query(
+        None, pattern="^(ndjson|sse)$", description="Defaults to sse for text/event-stream clients"
+    ),
+    client: Client = Depends(get_client),
+) -> StreamingResponse:
+    if format is None:
+        accepts_sse = "text/event-stream" in request.headers.get("accept", "")
+        format = "sse" if accepts_sse else "ndjson"
+    sse = format == "sse"
+    media_type = "text/event-stream" if sse else "application/x-ndjson"
+    return StreamingResponse(
+        _catalog_stream(sse),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _catalog_stream(sse: bool) -> AsyncIterator[bytes]:
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=get_settings().stream_queue_size)
+    overflowed = asyncio.Event()
+
+    def deliver(event: CatalogEvent):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Dropping events would leave the client with a wrong catalog; it resyncs instead
+            overflowed.set()
+
+    # Subscribe before reading the current catalog so no change falls in between;
+    # events are idempotent, so replaying one already reflected is harmless
+    unsubscribe = subscribe_catalog(lambda event: loop.call_soon_threadsafe(deliver, event))
+    try:
+        for message in await run_blocking(_initial_messages, sse):
+            yield message
+
+        while not overflowed.is_set():
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=STREAM_HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                yield b": heartbeat\n\n" if sse else b'{"type":"heartbeat"}\n'
+                continue
+            yield stream_message(event.kind, await _event_message(event), sse)
+        yield stream_message("reset", b'{"type":"reset"}', sse)
+    finally:
+        unsubscribe()
+
+
+def _initial_messages(sse: bool) -> List[bytes]:
+    """``add`` events for the catalog as it is now, then ``ready`` (blocking)"""
+    collection = get_datasets_collection()
+    modified_at = datetime.fromtimestamp(collection.last_modified)
+    messages = []
+    by_email = collection.sort_by("email")
+    for email, datasets in itertools.groupby(by_email, key=lambda dataset: dataset.email):
+        data = dataset_serializer.add_event(email, datasets, modified_at)
+        messages.append(stream_message("add", data, sse))
+    ready = {"type": "ready", "generation": collection.generation, "total_count": len(collection)}
+    messages.append(stream_message("ready", json.dumps(ready).encode(), sse))
+    return messages
+
+
+async def _event_message(event: CatalogEvent) -> bytes:
+    """``_event_json(event)``, computed off the event loop once per event"""
+    entry = _event_messages.get(id(event))
+    if entry is None or entry[0] is not event:
+        entry = (event, asyncio.ensure_future(run_blocking(_event_json, event)))
+        _event_messages[id(event)] = entry
+        # A stream is never further behind than its queue holds
+        while len(_event_messages) > get_settings().stream_queue_size + 1:
+            _event_messages.popitem(last=False)
+    return await asyncio.shield(entry[1])
+
+
+def _event_json(event: CatalogEvent) -> bytes:
+    """Stream message for a live event (blocking: ``add`` events read dataset metadata)"""
+    if event.kind == "add":
+        datasets = [CatalogDataset(event.email, name) for name in event.names]
+        return dataset_serializer.add_event(event.email, datasets)
+    if event.kind == "remove":
+        datasets = [CatalogDataset(event.email, name) for name in event.names]
+        payload = {
+            "type": "remove",
+            "email": event.email,
+            "ids": [dataset.id for dataset in datasets],
+            "names": list(event.names),
+        }
+    else:
+        payload = {
+            "type": event.kind,
+            "generation": event.generation,
+            "total_count": event.total_count,
+        }
+    return json.dumps(payload).encode()
+
+
+@v1_router.get(
+    "/datasets/facets",
+    tags=["datasets"],
+    summary="Catalog facets",
+    description="Dataset counts per email, domain and tag, and the distinct dataset names; "
+    "computed once per catalog update",
+    response_model=FacetsResponse,
+)
+async def get_facets(
+    request: Request,
+    client: Client = Depends(get_client),
+) -> JSONBytesResponse:
+    try:
+        return await run_blocking(
+            _catalog_json,
+            request,
+            lambda catalog: {**catalog.facets(), "tags": catalog.tag_counts()},
+        )
+    except Exception as e:
+        logger.error(f"Error computing facets: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @v1_router.get(
     "/datasets/emails",
     tags=["datasets"],
     summary="List unique emails",
     description="Get list of unique email addresses from all datasets",
+    response_model=List[str],
 )
 async def list_unique_emails(
+    request: Request,
     client: Client = Depends(get_client),
-) -> List[str]:
+) -> JSONBytesResponse:
     try:
-        datasets_collection = get_datasets_collection(client)
-        return datasets_collection.list_unique_emails()
+        return await run_blocking(
+            _catalog_json, request, lambda catalog: list(catalog.facets()["emails"])
+        )
     except Exception as e:
         logger.error(f"Error listing unique emails: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -180,33 +457,163 @@ async def list_unique_emails(
     tags=["datasets"],
     summary="List unique names",
     description="Get list of unique dataset names",
+    response_model=List[str],
 )
 async def list_unique_names(
+    request: Request,
     client: Client = Depends(get_client),
-) -> List[str]:
+) -> JSONBytesResponse:
     try:
-        datasets_collection = get_datasets_collection(client)
-        return datasets_collection.list_unique_names()
+        return await run_blocking(_catalog_json, request, lambda catalog: catalog.facets()["names"])
     except Exception as e:
         logger.error(f"Error listing unique names: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _dataset_response(dataset_id: str, fields: Optional[str], request: Request) -> Response:
+    """One dataset of the catalog by id (blocking; run in the executor)"""
+    collection = get_datasets_collection()
+    headers = _catalog_headers(collection)
+    not_modified = _not_modified(request, headers)
+    if not_modified is not None:
+        return not_modified
+    dataset = collection.get_by_id(dataset_id)
+    if dataset is None:
+        raise HTTPException(status_code=404, detail=f"Dataset {dataset_id} not found")
+    selected = _selected_fields(fields.split(",") if fields is not None else None)
+    modified_at = datetime.fromtimestamp(collection.last_modified)
+    body = dataset_serializer.to_json(dataset, selected, modified_at)
+    return JSONBytesResponse(body, headers=headers)
+
+
+def _preview_response(
+    dataset_id: str, n: int, sample: bool, seed: Optional[int], request: Request
+) -> Response:
+    """Preview or sample of a dataset's mock data (blocking; run in the executor)"""
+    collection = get_datasets_collection()
+    dataset = collection.get_by_id(dataset_id)
+    if dataset is None:
+        raise HTTPException(status_code=404, detail=f"Dataset {dataset_id} not found")
+    try:
+        body = preview_body(dataset, n, sample=sample, seed=seed)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except (ValueError, ImportError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return JSONBytesResponse(body)
+
+
+# Declared after the other /datasets/... routes so that they take precedence
+@v1_router.get(
+    "/datasets/{dataset_id}",
+    tags=["datasets"],
+    summary="Get a dataset",
+    description="Look up a dataset by its stable id",
+    response_model=Dataset,
+)
+async def get_dataset(
+    dataset_id: str,
+    request: Request,
+    fields: Optional[str] = Query(None, description="Comma-separated dataset fields to return"),
+    client: Client = Depends(get_client),
+) -> JSONBytesResponse:
+    try:
+        return await run_blocking(_dataset_response, dataset_id, fields, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting dataset: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@v1_router.get(
+    "/datasets/{dataset_id}/preview",
+    tags=["datasets"],
+    summary="Preview a dataset",
+    description="The first rows of a dataset's mock data, or a uniform random sample of "
+    "them; read in chunks and cached until the files change",
+    response_model=PreviewResponse,
+)
+async def preview_dataset(
+    dataset_id: str,
+    request: Request,
+    n: int = Query(10, ge=1, description="Number of rows"),
+    sample: bool = Query(False, description="Uniform random sample instead of the first rows"),
+    seed: Optional[int] = Query(
+        None, description="Seed of the sample; a random one is drawn (and returned) if omitted"
+    ),
+    client: Client = Depends(get_client),
+) -> JSONBytesResponse:
+    if n > get_settings().preview_max_rows:
+        raise HTTPException(
+            status_code=400, detail=f"n must be at most {get_settings().preview_max_rows}"
+        )
+    try:
+        return await run_blocking(_preview_response, dataset_id, n, sample, seed, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error previewing dataset: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# --------------- Datasite Endpoints ---------------
+
+
+@v1_router.get(
+    "/datasites/status",
+    tags=["datasites"],
+    summary="Datasite health",
+    description="Dataset count and health of each datasite; datasites that keep failing "
+    "are skipped (state 'open') until their backoff expires",
+)
+async def get_datasite_status(
+    client: Client = Depends(get_client),
+) -> List[DatasiteStatus]:
+    try:
+        statuses = await run_blocking(datasite_status)
+        return [
+            DatasiteStatus(
+                **{
+                    **asdict(status),
+                    "last_success": (
+                        datetime.fromtimestamp(status.last_success) if status.last_success else None
+                    ),
+                }
+            )
+            for status in statuses
+        ]
+    except Exception as e:
+        logger.error(f"Error reading datasite status: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # --------------- Health Check ---------------
 
 
 @api_router.get(
     "/health",
     summary="Health check endpoint",
-    description="Check if the API is running properly",
+    description="Check if the API is running properly, and whether the local SyftBox app "
+    "is reachable (checked in the background and cached)",
 )
 async def health_check() -> HealthResponse:
+    app = app_status()
+    if app is None:
+        status, message = "unknown", "Syft-Datasets API is running; SyftBox app not checked yet"
+    elif app.running:
+        status, message = "healthy", "Syft-Datasets API is running"
+    else:
+        status = "degraded"
+        message = f"Syft-Datasets API is running, but the SyftBox app is not reachable at {app.url}"
     return HealthResponse(
-        status="healthy",
-        message="Syft-Datasets API is running",
+        status=status,
+        message=message,
         timestamp=datetime.now(),
+        syftbox_app_running=None if app is None else app.running,
+        syftbox_app_checked_at=None if app is None else datetime.fromtimestamp(app.checked_at),
     )
 
 
 # Include v1 router
-api_router.include_router(v1_router) 
\ No newline at end of file
+api_router.include_router(v1_router)
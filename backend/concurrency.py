@@ -0,0 +1,63 @@
+# Standard library imports
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+# Local imports
+from .config import get_settings
+
+# Dedicated pool for blocking syft-core/syft-rds and catalog work, created on first use
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_settings().blocking_workers,
+                    thread_name_prefix="syd-backend",
+                )
+    return _executor
+
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking call in the dedicated executor without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one in-flight task
+
+    Callers arriving while a task for their key is running await that task's
+    result instead of starting another one. A caller being cancelled (e.g. a
+    client disconnecting) does not cancel the shared task.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable]) -> Any:
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(factory())
+
+            def forget(done):
+                if self._tasks.get(key) is done:
+                    del self._tasks[key]
+
+            task.add_done_callback(forget)
+        return await asyncio.shield(task)
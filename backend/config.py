@@ -15,6 +15,26 @@ class Settings(BaseSettings):
     # Client settings
     config_path: Optional[str] = None
 
+    # Catalog settings: with a snapshot dir, one worker discovers datasets and
+    # publishes memory-mapped snapshots that every other worker attaches to
+    snapshot_dir: Optional[str] = None
+    snapshot_check_interval: float = 1.0
+
+    # Catalog events buffered per stream client; a client falling further behind
+    # is sent a 'reset' event and disconnected
+    stream_queue_size: int = 1000
+
+    # Threads running blocking syft-core/syft-rds and catalog work off the event loop
+    blocking_workers: int = 8
+
+    # Pagination settings for dataset listings
+    default_page_size: int = 100
+    max_page_size: int = 1000
+
+    # Dataset previews: most rows per preview, and previews kept in memory
+    preview_max_rows: int = 1000
+    preview_cache_size: int = 256
+
     # File upload settings
     max_upload_size: int = 10 * 1024 * 1024  # 10MB
     allowed_file_types: list[str] = ["text/csv", "application/json", "text/plain"]
@@ -1,4 +1,6 @@
 # Standard library imports
+import asyncio
+from contextlib import asynccontextmanager
 from typing import Optional
 
 # Third-party imports
@@ -7,11 +9,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from loguru import logger
+from syft_datasets.monitor import app_monitor
 
 # Local imports
 from .api import api_router
 from .config import get_settings
-from .utils import get_datasets_collection
+from .concurrency import run_blocking, shutdown_executor
+from .metrics import MetricsMiddleware, metrics_router
+from .utils import get_datasets_collection, load_client, start_catalog
 
 
 class ErrorResponse(BaseModel):
@@ -19,27 +24,55 @@ class ErrorResponse(BaseModel):
     detail: Optional[str] = None
 
 
-# Initialize syft-datasets on module import to trigger logging
+def log_app_status(status):
+    (logger.info if status.running else logger.warning)(str(status))
+
+
+# Log SyftBox status on module import; datasets are loaded in the lifespan handler
 try:
-    from syft_core import Client
-    client = Client.load()
+    client = load_client()
     logger.info(f"✅ SyftBox filesystem accessible — logged in as: {client.email}")
-    logger.info(f"✅ SyftBox app running at {client.config.client_url}")
-    
-    # Trigger syft-datasets initialization to show status messages
-    datasets_collection = get_datasets_collection(client)
-    logger.info(f"📊 Loaded {len(datasets_collection._datasets)} datasets from SyftBox")
-    
+    # Probed in the background; /api/health serves the cached result from then on
+    app_monitor(client.config.client_url).probe_in_background(on_result=log_app_status)
+
 except Exception as e:
     logger.error(f"❌ Failed to initialize SyftBox connection: {e}")
     logger.error("    Make sure SyftBox is installed and you're logged in")
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the catalog (or attach to the shared snapshot) in the background, so the
+    # API is available while datasites are being queried, and keep it fresh
+    settings = get_settings()
+
+    async def load_catalog():
+        try:
+            role, stop_catalog = await run_blocking(
+                start_catalog, settings.snapshot_dir, settings.snapshot_check_interval
+            )
+        except Exception as e:
+            logger.warning(f"Dataset catalog will not auto-refresh: {e}")
+            return None
+        logger.info(f"📊 Serving {len(get_datasets_collection())} datasets from SyftBox ({role})")
+        return stop_catalog
+
+    loading = asyncio.create_task(load_catalog())
+
+    yield
+
+    stop_catalog = await loading
+    if stop_catalog is not None:
+        stop_catalog()
+    shutdown_executor()
+
+
 app = FastAPI(
     title="Syft-Datasets UI",
     description="API for browsing and managing datasets in the SyftBox ecosystem",
     version=get_settings().app_version,
     debug=get_settings().debug,
+    lifespan=lifespan,
     responses={
         500: {"model": ErrorResponse, "description": "Internal Server Error"},
         400: {"model": ErrorResponse, "description": "Bad Request"},
@@ -60,5 +93,9 @@ if get_settings().debug:
         allow_headers=["*"],
     )
 
+# Outermost, so the latency includes every other middleware
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(api_router)
+app.include_router(metrics_router)
 app.mount("/", StaticFiles(directory="frontend/out", html=True, check_dir=False)) 
\ No newline at end of file
@@ -0,0 +1,86 @@
+# Standard library imports
+import time
+
+# Third-party imports
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from syft_datasets import metrics
+from syft_datasets.metrics import SIZE_BUCKETS, Histogram
+
+# Local imports
+from .concurrency import run_blocking
+from .utils import get_datasets_collection
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REQUEST_SECONDS = Histogram(
+    "syd_http_request_seconds",
+    "Time to answer HTTP requests, by method, endpoint and status",
+    labels=["method", "endpoint", "status"],
+)
+RESPONSE_BYTES = Histogram(
+    "syd_http_response_bytes",
+    "Size of HTTP response bodies, by endpoint",
+    labels=["endpoint"],
+    buckets=SIZE_BUCKETS,
+)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording the latency and body size of every response
+
+    Requests are labelled with the name of the endpoint function that handled them
+    (e.g. ``list_datasets``), not the raw path, so the number of series stays
+    bounded. Streaming responses are observed when they end.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not metrics.enabled():
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status, size = 500, 0
+
+        async def send_and_measure(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            endpoint = getattr(scope.get("endpoint"), "__name__", "other")
+            REQUEST_SECONDS.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                endpoint=endpoint,
+                status=status,
+            )
+            RESPONSE_BYTES.observe(size, endpoint=endpoint)
+
+
+def _record_catalog():
+    """Set the catalog gauges from the catalog this worker serves (blocking)"""
+    metrics.record_catalog(get_datasets_collection())
+
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get(
+    "/metrics",
+    include_in_schema=False,
+    response_class=PlainTextResponse,
+)
+async def get_metrics() -> PlainTextResponse:
+    """Metrics of this worker in the Prometheus text format"""
+    await run_blocking(_record_catalog)
+    return PlainTextResponse(metrics.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
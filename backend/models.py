@@ -1,22 +1,27 @@
 # Standard library imports
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 # Third-party imports
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+# Sort keys accepted by dataset listings; a leading "-" sorts in descending order
+SORT_PATTERN = r"^-?(name|email)$"
 
 
 class Dataset(BaseModel):
-    """Dataset model for API responses"""
+    """Dataset model for API responses (only the requested fields are set)"""
     
     id: str
-    name: str
-    email: str
-    syft_url: str
+    name: Optional[str] = None
+    email: Optional[str] = None
+    syft_url: Optional[str] = None
     description: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     size: Optional[str] = None
+    size_bytes: Optional[int] = None
+    file_count: Optional[int] = None
     type: Optional[str] = None
     tags: List[str] = []
 
@@ -26,17 +31,72 @@ class ListDatasetsResponse(BaseModel):
     
     datasets: List[Dataset]
     total_count: int
-    unique_emails: List[str]
-    unique_names: List[str]
+    next_cursor: Optional[str] = None
+
+
+class FacetsResponse(BaseModel):
+    """Response model for aggregates over the whole catalog"""
+
+    total_count: int
+    emails: Dict[str, int]
+    domains: Dict[str, int]
+    tags: Dict[str, int] = {}
+    names: List[str]
+
+
+class PreviewResponse(BaseModel):
+    """Rows of a dataset's mock data"""
+
+    id: str
+    columns: List[str]
+    rows: List[List[Any]]
+    sampled: bool
+    # Seed the sample was drawn with (None for a preview of the first rows)
+    seed: Optional[int] = None
+
+
+class DatasiteStatus(BaseModel):
+    """Health of one datasite"""
+
+    email: str
+    state: str  # ok, degraded, open (skipped until retry) or half_open (retrying)
+    datasets: int
+    failures: int
+    last_error: Optional[str] = None
+    retry_in: Optional[float] = None
+    last_success: Optional[datetime] = None
+    elapsed: Optional[float] = None
+
+
+class RefreshResponse(BaseModel):
+    """Response model for a catalog refresh"""
+
+    generation: int
+    total_count: int
+
+
+class PageRequest(BaseModel):
+    """Pagination, sorting and field selection for dataset listings"""
+
+    limit: Optional[int] = Field(default=None, ge=1)
+    cursor: Optional[str] = None
+    sort: str = Field(default="name", pattern=SORT_PATTERN)
+    fields: Optional[List[str]] = None
+
 
+class SearchDatasetsRequest(PageRequest):
+    """Request model for searching datasets
 
-class SearchDatasetsRequest(BaseModel):
-    """Request model for searching datasets"""
+    With ``ranked``, ``limit`` is the number of best matches returned (in order
+    of relevance, without pagination) and ``sort`` and ``cursor`` do not apply.
+    """
     
     keyword: str
+    ranked: bool = False
+    fuzzy: bool = True
 
 
-class FilterByEmailRequest(BaseModel):
+class FilterByEmailRequest(PageRequest):
     """Request model for filtering datasets by email"""
     
     email_pattern: str
@@ -47,4 +107,6 @@ class HealthResponse(BaseModel):
     
     status: str
     message: str
-    timestamp: datetime 
\ No newline at end of file
+    timestamp: datetime
+    syftbox_app_running: Optional[bool] = None
+    syftbox_app_checked_at: Optional[datetime] = None 
\ No newline at end of file
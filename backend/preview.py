@@ -0,0 +1,91 @@
+# Standard library imports
+import json
+import secrets
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+# Third-party imports
+from syft_datasets.metadata import metadata_collector, mock_dir
+
+# Local imports
+from .config import get_settings
+from .utils import load_client
+
+
+class PreviewCache:
+    """Serialized previews and samples, least recently used first out
+
+    Entries are keyed on the state of the dataset's mock files (total size, file
+    count and latest modification time) as summarized by the metadata collector,
+    which caches each directory by its mtime. A preview is recomputed once a file
+    is added, removed or renamed; a file rewritten in place may be served stale
+    until then.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: Hashable, body: bytes):
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def preview_body(dataset, n: int, sample: bool = False, seed: Optional[int] = None) -> bytes:
+    """JSON ``PreviewResponse`` of ``dataset`` (blocking; run in the executor)
+
+    A sample without a ``seed`` is drawn with a fresh random one, returned in the
+    response so that it can be repeated; such samples are not cached.
+
+    Raises:
+        FileNotFoundError: The dataset's mock data is not on this machine
+        ValueError: It has no file that can be previewed
+    """
+    datasites = load_client().datasites
+    path = mock_dir(datasites, dataset.email, dataset.name)
+    stats = metadata_collector(datasites).path_stats(path)
+    if stats is None:
+        raise FileNotFoundError(f"No mock data for {dataset.syft_url} on this machine")
+
+    cached = not sample or seed is not None
+    if not cached:
+        seed = secrets.randbits(32)
+    key = (dataset.id, n, sample, seed, stats.size, stats.files, stats.modified_at)
+    body = preview_cache.get(key) if cached else None
+    if body is None:
+        from syft_datasets import preview
+
+        frame = preview.sample(path, n, seed=seed) if sample else preview.preview(path, n)
+        table = json.loads(frame.to_json(orient="split", index=False, date_format="iso"))
+        body = json.dumps(
+            {
+                "id": dataset.id,
+                "columns": table["columns"],
+                "rows": table["data"],
+                "sampled": sample,
+                "seed": seed if sample else None,
+            },
+            separators=(",", ":"),
+        ).encode()
+        if cached:
+            preview_cache.put(key, body)
+    return body
+
+
+preview_cache = PreviewCache(get_settings().preview_cache_size)
@@ -0,0 +1,151 @@
+# Standard library imports
+import json
+import weakref
+from datetime import datetime
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional
+
+# Third-party imports
+from fastapi.responses import Response
+
+from syft_datasets.metadata import DatasetMetadata, format_size
+
+# Local imports
+from .models import Dataset
+from .utils import dataset_metadata
+
+
+class JSONBytesResponse(Response):
+    """Response whose content is already serialized JSON"""
+
+    media_type = "application/json"
+
+
+class DatasetSerializer:
+    """Cached JSON representation of catalog datasets for API responses
+
+    Each dataset is converted to the API model and serialized once per field
+    selection. Entries are keyed weakly on the library's ``Dataset`` row views,
+    which live as long as their catalog generation, so a refreshed catalog
+    starts with an empty cache and stale entries are freed with it.
+
+    Sizes, timestamps and types come from ``metadata``, which is called once
+    per batch with the datasets that are not cached yet, so the filesystem
+    walks of a page run concurrently and each dataset is walked once per
+    catalog generation.
+    """
+
+    def __init__(
+        self, metadata: Optional[Callable[[List], Optional[List[DatasetMetadata]]]] = None
+    ):
+        self._models = weakref.WeakKeyDictionary()
+        self._json = weakref.WeakKeyDictionary()
+        self._metadata = metadata
+
+    def _prefetch(self, datasets: List) -> Dict[int, DatasetMetadata]:
+        """Metadata of the datasets in ``datasets`` that have no cached model, by ``id()``"""
+        if self._metadata is None:
+            return {}
+        missing = [dataset for dataset in datasets if dataset not in self._models]
+        if not missing:
+            return {}
+        found = self._metadata(missing) or []
+        return {id(dataset): metadata for dataset, metadata in zip(missing, found)}
+
+    def model(
+        self,
+        dataset,
+        modified_at: Optional[datetime] = None,
+        metadata: Optional[DatasetMetadata] = None,
+    ) -> Dataset:
+        model = self._models.get(dataset)
+        if model is None:
+            if metadata is None and self._metadata is not None:
+                metadata = (self._metadata([dataset]) or [None])[0]
+            email = dataset.email
+            now = modified_at or datetime.now()
+            created_at = updated_at = now
+            size, size_bytes, file_count, kind = "Unknown", None, None, "dataset"
+            if metadata is not None and metadata.available:
+                if metadata.created_at is not None:
+                    created_at = datetime.fromtimestamp(metadata.created_at)
+                updated_at = datetime.fromtimestamp(metadata.modified_at)
+                size_bytes, file_count = metadata.size, metadata.files
+                size = format_size(size_bytes)
+                kind = metadata.content_type or kind
+            model = self._models[dataset] = Dataset(
+                id=dataset.id,
+                name=dataset.name,
+                email=email,
+                syft_url=dataset.syft_url,
+                description=f"Dataset from {email}",
+                created_at=created_at,
+                updated_at=updated_at,
+                size=size,
+                size_bytes=size_bytes,
+                file_count=file_count,
+                type=kind,
+                tags=list(dataset.tags),
+            )
+        return model
+
+    def to_json(
+        self,
+        dataset,
+        fields: Optional[FrozenSet[str]] = None,
+        modified_at: Optional[datetime] = None,
+        metadata: Optional[DatasetMetadata] = None,
+    ) -> bytes:
+        """JSON of ``dataset``, restricted to ``fields`` if given"""
+        entries = self._json.get(dataset)
+        if entries is None:
+            entries = self._json[dataset] = {}
+        data = entries.get(fields)
+        if data is None:
+            model = self.model(dataset, modified_at, metadata)
+            data = entries[fields] = model.model_dump_json(include=fields).encode()
+        return data
+
+    def _rows(self, datasets: Iterable, fields, modified_at) -> bytes:
+        datasets = list(datasets)
+        metadata = self._prefetch(datasets)
+        return b",".join(
+            self.to_json(dataset, fields, modified_at, metadata.get(id(dataset)))
+            for dataset in datasets
+        )
+
+    def list_body(
+        self,
+        datasets: Iterable,
+        total_count: int,
+        next_cursor: Optional[str] = None,
+        fields: Optional[FrozenSet[str]] = None,
+        modified_at: Optional[datetime] = None,
+    ) -> bytes:
+        """Serialized ``ListDatasetsResponse`` assembled from the cached datasets
+
+        ``modified_at`` (the catalog generation's build time) is reported as the
+        creation and update time of datasets whose files are not on this machine.
+        """
+        rows = self._rows(datasets, fields, modified_at)
+        tail = json.dumps(
+            {"total_count": total_count, "next_cursor": next_cursor}, separators=(",", ":")
+        )
+        return b'{"datasets":[' + rows + b"]," + tail[1:].encode()
+
+    def add_event(
+        self, email: str, datasets: Iterable, modified_at: Optional[datetime] = None
+    ) -> bytes:
+        """Stream event adding ``datasets`` of datasite ``email``"""
+        rows = self._rows(datasets, None, modified_at)
+        head = json.dumps({"type": "add", "email": email}, separators=(",", ":"))
+        return head[:-1].encode() + b',"datasets":[' + rows + b"]}"
+
+
+def stream_message(kind: str, data: bytes, sse: bool) -> bytes:
+    """Frame a JSON event as a Server-Sent Event or as an NDJSON line"""
+    if sse:
+        return b"event: " + kind.encode() + b"\ndata: " + data + b"\n\n"
+    return data + b"\n"
+
+
+dataset_serializer = DatasetSerializer(metadata=dataset_metadata)
@@ -1,45 +1,81 @@
 # Standard library imports
-from typing import Optional
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 
 # Third-party imports
+import syft_datasets as syd
+from syft_datasets.metadata import metadata_collector
+from syft_datasets.monitor import app_monitor
+from syft_datasets.tagging import get_tagger
+
 try:
     from loguru import logger
     from syft_core import Client
-    import syft_datasets as syd
     SYFT_AVAILABLE = True
 except ImportError:
     SYFT_AVAILABLE = False
     logger = None
 
 
+# Local imports
+from .concurrency import SingleFlight, run_blocking
+
+# SyftBox client shared by every request of this process
+_client = None
+_client_lock = threading.Lock()
+
+# Set when this worker serves the catalog from shared snapshots
+_snapshot_catalog = None
+# Source of catalog change events when they come from published snapshots
+_catalog_events = None
+# Publishes snapshots when this worker is the snapshot builder
+_publisher = None
+# In-flight catalog refreshes, keyed by their ``force`` flag
+_refreshes = SingleFlight()
+
+# How long a worker waits for the builder to publish the first snapshot
+SNAPSHOT_WAIT_TIMEOUT = 300
+
+
+def cached_client():
+    """The process-wide SyftBox client, or None if it has not been loaded yet"""
+    return _client
+
+
+def load_client():
+    """Load the SyftBox client once per process (blocking)"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = Client.load()
+    return _client
+
+
 def get_datasets_collection(client=None):
     """Get the datasets collection from syft-datasets"""
+    if _snapshot_catalog is not None:
+        try:
+            return _snapshot_catalog.collection
+        except LookupError:
+            # Nothing published yet; serve the (empty) local collection meanwhile
+            pass
+
     if not SYFT_AVAILABLE:
         # Return a mock collection for demo purposes
-        class MockDataset:
-            def __init__(self, email, name):
-                self.email = email
-                self.name = name
-                self.syft_url = f"syft://{email}/private/datasets/{name}"
-        
-        class MockCollection:
-            def __init__(self):
-                self._datasets = [
-                    MockDataset("demo@example.com", "sample_dataset"),
-                    MockDataset("user@test.com", "test_data"),
-                ]
-            
-            def list_unique_emails(self):
-                return list(set(ds.email for ds in self._datasets))
-            
-            def list_unique_names(self):
-                return list(set(ds.name for ds in self._datasets))
-        
-        return MockCollection()
-    
+        return syd.DatasetCollection(
+            [
+                syd.Dataset("demo@example.com", "sample_dataset"),
+                syd.Dataset("user@test.com", "test_data"),
+            ]
+        )
+
     try:
-        # Use syft-datasets to get the collection
-        return syd.datasets
+        # Use syft-datasets to get the collection, as loaded so far (discovery runs
+        # in the background, see start_catalog), frozen so that a refresh cannot
+        # change it halfway through a request
+        return syd.datasets.current().frozen()
     except Exception as e:
         if logger:
             logger.error(f"Failed to get datasets collection: {e}")
@@ -47,6 +83,165 @@ def get_datasets_collection(client=None):
         return syd.DatasetCollection()
 
 
+def start_catalog(
+    snapshot_dir: Optional[str] = None, check_interval: float = 1.0
+) -> Tuple[str, Callable[[], None]]:
+    """Set up the catalog served by this worker
+
+    Without a snapshot dir, the worker discovers datasets itself and watches
+    datasites for changes. With one, the first worker to take the builder lock
+    does that and publishes each catalog generation as a memory-mapped snapshot;
+    every worker, the builder included, serves the catalog from the snapshots.
+
+    Returns:
+        Tuple[str, Callable[[], None]]: The worker's role and a function stopping it
+    """
+    global _snapshot_catalog, _catalog_events, _publisher
+
+    if not SYFT_AVAILABLE:
+        return "demo", lambda: None
+
+    if snapshot_dir is None:
+        watcher = syd.datasets.watch()
+        return f"local, {watcher.mode}", watcher.stop
+
+    from filelock import FileLock, Timeout
+
+    from syft_datasets.snapshot import SnapshotCatalog, SnapshotPublisher
+
+    Path(snapshot_dir).mkdir(parents=True, exist_ok=True)
+    lock = FileLock(str(Path(snapshot_dir) / "builder.lock"))
+    try:
+        lock.acquire(timeout=0)
+    except Timeout:
+        catalog = SnapshotCatalog(snapshot_dir, check_interval=check_interval)
+        _snapshot_catalog = _catalog_events = catalog
+        if not catalog.wait_until_published(timeout=SNAPSHOT_WAIT_TIMEOUT):
+            raise TimeoutError(f"No catalog snapshot was published in {snapshot_dir}")
+        return "snapshot reader", _poll_snapshots(catalog, check_interval)
+
+    publisher = _publisher = SnapshotPublisher(syd.datasets, snapshot_dir)
+    publisher.publish()
+    watcher = syd.datasets.watch(on_change=publisher.publish)
+    # Serve the snapshots too, events included, so every worker reports the same
+    # catalog generation
+    catalog = SnapshotCatalog(snapshot_dir, check_interval=check_interval)
+    _snapshot_catalog = _catalog_events = catalog
+    catalog.reload()
+    stop_polling = _poll_snapshots(catalog, check_interval)
+
+    def stop():
+        stop_polling()
+        watcher.stop()
+        lock.release()
+
+    return "snapshot builder", stop
+
+
+def _refresh_catalog(force: bool = False):
+    if _publisher is not None:
+        # Snapshot builder: refresh, publish, then serve what was published
+        syd.datasets.refresh(force=force)
+        _publisher.publish()
+        _snapshot_catalog.reload()
+    elif _snapshot_catalog is not None:
+        # Snapshot reader: the builder refreshes; pick up whatever it last published
+        _snapshot_catalog.reload()
+    elif SYFT_AVAILABLE and syd.datasets.loaded:
+        syd.datasets.refresh(force=force)
+    return get_datasets_collection()
+
+
+async def refresh_catalog(force: bool = False):
+    """Re-sync the catalog with the datasites on disk, off the event loop
+
+    Concurrent calls share a single in-flight refresh and all receive its result.
+
+    Returns:
+        The refreshed datasets collection
+    """
+    return await _refreshes.run(force, lambda: run_blocking(_refresh_catalog, force))
+
+
+def app_status():
+    """Cached status of the local SyftBox app (None until first probed)
+
+    Never blocks: a stale status is returned as is and refreshed in the background.
+    """
+    client = cached_client()
+    if client is None:
+        return None
+    return app_monitor(client.config.client_url).status(wait=False)
+
+
+def datasite_status():
+    """Health of each datasite (blocking)
+
+    Snapshot readers do not query datasites themselves; they report the health
+    the builder persisted in the catalog cache.
+    """
+    if not SYFT_AVAILABLE:
+        return []
+    if (_snapshot_catalog is None or _publisher is not None) and syd.datasets.loaded:
+        return syd.datasets.datasite_status()
+
+    from syft_datasets.cache import CatalogCache
+    from syft_datasets.health import HealthTracker
+
+    tracker = HealthTracker(cache=CatalogCache.for_client(load_client()))
+    return tracker.report(get_datasets_collection().facets()["emails"])
+
+
+def dataset_metadata(datasets: List) -> Optional[List]:
+    """Filesystem metadata of ``datasets``, walked concurrently (blocking)
+
+    Returns None until the SyftBox client has been loaded.
+    """
+    client = cached_client()
+    if client is None:
+        return None
+    pairs = ((dataset.email, dataset.name) for dataset in datasets)
+    return metadata_collector(client.datasites).collect(pairs)
+
+
+def _poll_snapshots(catalog, interval: float) -> Callable[[], None]:
+    """Check for new snapshot generations every ``interval`` seconds, in one thread
+
+    Snapshot readers only notice a new generation when they look for one; this
+    looks once per worker, so that stream clients get their events without each
+    polling the catalog. Returns a function stopping the thread.
+    """
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            try:
+                catalog.reload()
+            except Exception as e:
+                if logger:
+                    logger.warning(f"Could not check for a new catalog snapshot: {e}")
+
+    threading.Thread(target=run, name="snapshot-poller", daemon=True).start()
+    return stop.set
+
+
+def subscribe_catalog(callback: Callable) -> Callable[[], None]:
+    """Subscribe to change events of the catalog this worker serves
+
+    Workers that discover datasets themselves report each datasite as soon as it
+    has been queried; workers serving snapshots, the builder included, report the
+    differences between successive published generations.
+
+    Returns:
+        Callable[[], None]: Function cancelling the subscription
+    """
+    if _catalog_events is not None:
+        return _catalog_events.subscribe(callback)
+    if not SYFT_AVAILABLE:
+        return lambda: None
+    return syd.datasets.subscribe(callback)
+
+
 def format_syft_url(email: str, dataset_name: str) -> str:
     """Format a SyftBox URL for a dataset"""
     return f"syft://{email}/private/datasets/{dataset_name}"
@@ -61,22 +256,4 @@ def get_domain_from_email(email: str) -> str:
 
 def get_dataset_tags(email: str, dataset_name: str) -> list[str]:
     """Generate tags for a dataset based on email and name"""
-    tags = []
-    
-    # Add domain as tag
-    domain = get_domain_from_email(email)
-    if domain:
-        tags.append(domain)
-    
-    # Add common keywords as tags
-    name_lower = dataset_name.lower()
-    if any(keyword in name_lower for keyword in ["crop", "agriculture", "farming"]):
-        tags.append("agriculture")
-    if any(keyword in name_lower for keyword in ["financial", "finance", "money"]):
-        tags.append("finance")
-    if any(keyword in name_lower for keyword in ["health", "medical", "patient"]):
-        tags.append("healthcare")
-    if any(keyword in name_lower for keyword in ["education", "student", "school"]):
-        tags.append("education")
-    
-    return tags 
\ No newline at end of file
+    return list(get_tagger().tag(email, dataset_name))
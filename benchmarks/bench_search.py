@@ -0,0 +1,78 @@
+"""Micro-benchmark: indexed search vs. the linear scan it replaced
+
+Usage:
+    python benchmarks/bench_search.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import random
+import time
+
+from syft_datasets import Dataset
+from syft_datasets.index import SearchIndex
+
+QUERIES = ["crop", "alice", "@openmined", "health_records", "zz", "d"]
+
+
+def make_datasets(n, seed=0):
+    rng = random.Random(seed)
+    words = ["crop", "yield", "health", "census", "weather", "finance", "records", "survey"]
+    domains = ["example.com", "openmined.org", "university.edu", "hospital.org"]
+    users = ["alice", "bob", "carol", "dan", "erin", "frank"]
+    datasets = []
+    for i in range(n):
+        email = f"{rng.choice(users)}{i % 5000}@{rng.choice(domains)}"
+        name = "_".join(rng.sample(words, rng.randint(1, 3))) + f"_{i}"
+        datasets.append(Dataset(email, name))
+    return datasets
+
+
+def linear_search(datasets, keyword):
+    keyword = keyword.lower()
+    return [ds for ds in datasets if keyword in ds.name.lower() or keyword in ds.email.lower()]
+
+
+def linear_filter_by_email(datasets, pattern):
+    pattern = pattern.lower()
+    return [ds for ds in datasets if pattern in ds.email.lower()]
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'size':>9} {'query':>16} {'op':>8} {'linear ms':>10} {'index ms':>10} {'speedup':>8}")
+    for size in args.sizes:
+        datasets = make_datasets(size)
+        start = time.perf_counter()
+        index = SearchIndex([ds.name for ds in datasets], [ds.email for ds in datasets])
+        print(
+            f"{size:>9} {'(index build)':>16} {'':>8} {'':>10} {(time.perf_counter() - start) * 1e3:>10.1f}"
+        )
+
+        for query in QUERIES:
+            for op, linear, indexed in [
+                ("search", linear_search, index.search),
+                ("email", linear_filter_by_email, index.filter_by_email),
+            ]:
+                t_linear = best_of(lambda: linear(datasets, query), args.repeat)
+                t_index = best_of(lambda: [datasets[row] for row in indexed(query)], args.repeat)
+                print(
+                    f"{size:>9} {query:>16} {op:>8} {t_linear * 1e3:>10.2f} "
+                    f"{t_index * 1e3:>10.2f} {t_linear / t_index:>7.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
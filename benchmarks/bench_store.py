@@ -0,0 +1,63 @@
+"""Micro-benchmark: memory and filter cost of the columnar catalog store
+
+Compares a catalog held as a list of Dataset objects (what a collection used to
+keep, and copy on every filter) with a CatalogStore plus row-number views.
+
+Usage:
+    python benchmarks/bench_store.py --sizes 100000 1000000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from bench_search import make_datasets
+
+from syft_datasets import Dataset, DatasetCollection
+from syft_datasets.store import CatalogStore
+
+
+def measure(fn):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        raw = [(ds.email, ds.name) for ds in make_datasets(size)]
+        chunks = {}
+        for email, name in raw:
+            chunks.setdefault(email, []).append(name)
+
+        _, t_list, m_list = measure(lambda: [Dataset(email, name) for email, name in raw])
+        store, t_store, m_store = measure(
+            lambda: CatalogStore.from_datasites(
+                (email, names, None) for email, names in sorted(chunks.items())
+            )
+        )
+        print(f"{size:>9} datasets")
+        print(f"  list of Dataset  : {m_list / 2**20:8.1f} MiB  built in {t_list:.2f}s")
+        print(f"  CatalogStore     : {m_store / 2**20:8.1f} MiB  built in {t_store:.2f}s")
+
+        collection = DatasetCollection._view(store, range(len(store)))
+        collection._search_index()
+        result, t_filter, m_filter = measure(lambda: collection.filter_by_email("alice"))
+        print(
+            f"  filter_by_email  : {len(result)} rows in {t_filter * 1e3:.1f} ms,"
+            f" {m_filter / 2**20:.1f} MiB (row view)"
+        )
+
+
+if __name__ == "__main__":
+    main()
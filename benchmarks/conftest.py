@@ -0,0 +1,26 @@
+"""Shared fixtures for the benchmark suite.
+
+Run with ``pytest benchmarks`` (requires pytest-benchmark); results can be saved
+and compared across commits with ``--benchmark-autosave`` and
+``--benchmark-compare``.
+"""
+
+import pytest
+from federation import SCALES, Federation
+
+
+@pytest.fixture(scope="session", params=list(SCALES))
+def scale(request):
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def federation(scale, tmp_path_factory):
+    """Synthetic federation at each benchmark scale, built once per session."""
+    return Federation.at_scale(tmp_path_factory.mktemp(f"federation-{scale}"), scale)
+
+
+@pytest.fixture(scope="session")
+def collection(federation):
+    """In-memory collection over every dataset of the federation."""
+    return federation.collection()
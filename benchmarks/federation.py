@@ -0,0 +1,107 @@
+"""Synthetic SyftBox federation for offline benchmarks
+
+Builds a ``client.datasites`` tree on disk and stub ``init_session`` sessions
+answering for it, with optional per-datasite latency and failures, so discovery
+and everything downstream of it can be measured without a SyftBox install.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List
+from unittest.mock import Mock, patch
+
+from syft_datasets import DatasetCollection
+from syft_datasets.cache import RDS_DATASET_STORE
+from syft_datasets.monitor import AppMonitor
+from syft_datasets.store import CatalogStore
+
+# (datasites, datasets per datasite) of each benchmark scale
+SCALES = {
+    "10": (10, 1),
+    "1k": (100, 10),
+    "100k": (1_000, 100),
+}
+
+WORDS = ["crop", "yield", "health", "census", "weather", "finance", "records", "survey"]
+DOMAINS = ["example.com", "openmined.org", "university.edu", "hospital.org"]
+USERS = ["alice", "bob", "carol", "dan", "erin", "frank"]
+
+
+class Federation:
+    """Datasites on disk plus the sessions ``init_session`` would open for them
+
+    Args:
+        root: Directory to build the SyftBox workspace in
+        datasites: Number of datasites
+        datasets_per_site: Datasets published by each datasite
+        latency: Seconds each session takes to open
+        failure_rate: Share of datasites whose session raises
+        seed: Seed of the generated names, so runs are comparable
+    """
+
+    def __init__(
+        self,
+        root,
+        datasites: int,
+        datasets_per_site: int,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        rng = random.Random(seed)
+        self.root = Path(root)
+        self.datasites = self.root / "datasites"
+        self.latency = latency
+        self.names: Dict[str, List[str]] = {}
+        for i in range(datasites):
+            email = f"{rng.choice(USERS)}{i}@{rng.choice(DOMAINS)}"
+            self.names[email] = [
+                "_".join(rng.sample(WORDS, rng.randint(1, 3))) + f"_{j}"
+                for j in range(datasets_per_site)
+            ]
+        self.failing = set(rng.sample(sorted(self.names), int(failure_rate * datasites)))
+
+        for email, names in self.names.items():
+            manifest = self.datasites / email / RDS_DATASET_STORE
+            manifest.mkdir(parents=True)
+            (manifest / "datasets.yaml").write_text("\n".join(names))
+
+        self.client = Mock()
+        self.client.email = "me@example.com"
+        self.client.datasites = self.datasites
+        self.client.config.data_dir = self.root
+        self.client.config.client_url = "http://127.0.0.1:9"
+
+    @classmethod
+    def at_scale(cls, root, scale: str, **kwargs) -> "Federation":
+        datasites, datasets_per_site = SCALES[scale]
+        return cls(root, datasites, datasets_per_site, **kwargs)
+
+    def __len__(self):
+        return sum(len(names) for names in self.names.values())
+
+    def init_session(self, host):
+        if self.latency:
+            time.sleep(self.latency)
+        if host in self.failing:
+            raise ConnectionError(f"{host} is unreachable")
+        return SimpleNamespace(datasets=[SimpleNamespace(name=name) for name in self.names[host]])
+
+    @contextmanager
+    def patched(self):
+        """Route ``syft_datasets`` discovery to this federation"""
+        with patch("syft_datasets.Client") as client:
+            client.load.return_value = self.client
+            with patch("syft_datasets.init_session", self.init_session):
+                with patch.object(AppMonitor, "_request", return_value=False):
+                    yield self
+
+    def collection(self) -> DatasetCollection:
+        """Collection over every dataset, built in memory without discovery"""
+        store = CatalogStore.from_datasites(
+            (email, names, None) for email, names in sorted(self.names.items())
+        )
+        return DatasetCollection._view(store, range(len(store)))
@@ -0,0 +1,59 @@
+"""Latency of the backend endpoints, served from a synthetic federation's catalog."""
+
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def api(collection):
+    """Test client of the API, serving ``collection`` (the lifespan is not run)."""
+    from backend import api as endpoints
+    from backend import utils
+    from backend.main import app
+
+    app.dependency_overrides[endpoints.get_client] = lambda: None
+    with patch.object(endpoints, "get_datasets_collection", lambda: collection):
+        with patch.object(utils, "get_datasets_collection", lambda: collection):
+            yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_list_datasets(benchmark, api):
+    response = benchmark(api.get, "/api/v1/datasets", params={"limit": 100})
+    assert response.status_code == 200
+
+
+def test_list_datasets_not_modified(benchmark, api):
+    etag = api.get("/api/v1/datasets", params={"limit": 100}).headers["ETag"]
+    response = benchmark(
+        api.get, "/api/v1/datasets", params={"limit": 100}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+
+def test_search_datasets(benchmark, api):
+    response = benchmark(api.post, "/api/v1/datasets/search", json={"keyword": "crop"})
+    assert response.status_code == 200
+
+
+def test_filter_datasets_by_email(benchmark, api):
+    response = benchmark(
+        api.post, "/api/v1/datasets/filter-by-email", json={"email_pattern": "alice"}
+    )
+    assert response.status_code == 200
+
+
+def test_facets(benchmark, api):
+    response = benchmark(api.get, "/api/v1/datasets/facets")
+    assert response.status_code == 200
+
+
+def test_health(benchmark, api):
+    response = benchmark(api.get, "/api/health")
+    assert response.status_code == 200
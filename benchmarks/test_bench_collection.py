@@ -0,0 +1,82 @@
+"""Benchmarks of discovery and of the DatasetCollection API."""
+
+import subprocess
+import sys
+
+import pytest
+from federation import Federation
+
+from syft_datasets import DatasetCollection
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_import_time(benchmark):
+    """Fresh interpreter importing the package (includes interpreter start-up)."""
+    command = [sys.executable, "-c", "import syft_datasets"]
+    benchmark.pedantic(subprocess.check_call, args=(command,), rounds=5)
+
+
+def test_load_datasets_cold(benchmark, federation):
+    """Discovery querying every datasite, without the catalog cache."""
+    with federation.patched():
+        collection = benchmark.pedantic(DatasetCollection, kwargs={"use_cache": False}, rounds=3)
+    assert len(collection) == len(federation)
+
+
+def test_load_datasets_cached(benchmark, federation):
+    """Discovery restoring unchanged datasites from the catalog cache."""
+    with federation.patched():
+        DatasetCollection()
+        collection = benchmark.pedantic(DatasetCollection, rounds=3)
+    assert len(collection) == len(federation)
+
+
+@pytest.mark.parametrize(
+    "latency, failure_rate", [(0.01, 0.0), (0.01, 0.1)], ids=["latency", "failures"]
+)
+def test_load_datasets_unreliable(benchmark, tmp_path, latency, failure_rate):
+    """Cold discovery of 100 datasites answering in 10ms, some of which fail."""
+    federation = Federation.at_scale(tmp_path, "1k", latency=latency, failure_rate=failure_rate)
+    with federation.patched():
+        collection = benchmark.pedantic(DatasetCollection, kwargs={"use_cache": False}, rounds=3)
+    assert len(collection) == len(federation) - sum(
+        len(federation.names[email]) for email in federation.failing
+    )
+
+
+@pytest.mark.parametrize("keyword", ["crop", "alice", "zz"])
+def test_search(benchmark, collection, keyword):
+    collection.search(keyword)  # build the search index outside the timing
+    benchmark(collection.search, keyword)
+
+
+@pytest.mark.parametrize("keyword", ["crop", "wether records"])
+def test_ranked_search(benchmark, collection, keyword):
+    collection.search(keyword, ranked=True, limit=10)  # build the ranked index outside the timing
+    benchmark(collection.search, keyword, ranked=True, limit=10)
+
+
+def test_filter_by_email(benchmark, collection):
+    collection.filter_by_email("alice")
+    benchmark(collection.filter_by_email, "alice")
+
+
+def test_filter_by_tag(benchmark, collection):
+    collection.filter_by_tag("agriculture")  # tag the catalog outside the timing
+    benchmark(collection.filter_by_tag, "agriculture")
+
+
+def test_get_many_by_url(benchmark, collection):
+    urls = [dataset.syft_url for dataset in collection[:: max(1, len(collection) // 1000)]]
+    collection.get_many(urls[:1])  # build the lookup index outside the timing
+    found = benchmark(collection.get_many, urls)
+    assert None not in found
+
+
+def test_repr_html(benchmark, collection):
+    benchmark(collection._repr_html_)
+
+
+def test_str(benchmark, collection):
+    benchmark(str, collection)
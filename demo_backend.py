@@ -45,12 +45,11 @@ def demo_backend_structure():
         print(f"   Syft URL: {sample_dataset.syft_url}")
         print(f"   Tags: {sample_dataset.tags}")
         
-        # Create a response
+        # Create a response (one page; next_cursor is None on the last one)
         response = ListDatasetsResponse(
             datasets=[sample_dataset],
             total_count=1,
-            unique_emails=["farmer@example.com"],
-            unique_names=["sample_crop_data"]
+            next_cursor=None
         )
         print(f"✅ Created response with {response.total_count} dataset(s)")
         
@@ -91,7 +90,7 @@ def show_api_structure():
     print("\n🌐 API Structure Preview")
     print("=" * 30)
     print("GET  /api/health                    - Health check")
-    print("GET  /api/v1/datasets              - List all datasets")
+    print("GET  /api/v1/datasets              - List datasets, one page at a time")
     print("POST /api/v1/datasets/search       - Search datasets")
     print("POST /api/v1/datasets/filter-by-email - Filter by email")
     print("GET  /api/v1/datasets/emails       - Get unique emails")
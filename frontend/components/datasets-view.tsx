@@ -39,6 +39,8 @@ import { timeAgo } from "@/lib/utils";
 export function DatasetsView() {
   const [datasets, setDatasets] = useState<Dataset[]>([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [isModalOpen, setIsModalOpen] = useState(false);
   const [selectedDataset, setSelectedDataset] = useState<Dataset | null>(null);
   const [isActionsSheetOpen, setIsActionsSheetOpen] = useState(false);
@@ -52,6 +54,7 @@ export function DatasetsView() {
       setLoading(true);
       const response = await apiService.getDatasets();
       setDatasets(response.datasets);
+      setNextCursor(response.nextCursor);
     } catch (error) {
       console.error("Failed to load datasets:", error);
     } finally {
@@ -59,6 +62,20 @@ export function DatasetsView() {
     }
   };
 
+  const loadMoreDatasets = async () => {
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const response = await apiService.getDatasets(nextCursor, datasets.length);
+      setDatasets((loaded) => [...loaded, ...response.datasets]);
+      setNextCursor(response.nextCursor);
+    } catch (error) {
+      console.error("Failed to load more datasets:", error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleDatasetCreated = () => {
     setIsModalOpen(false);
     loadDatasets();
@@ -275,6 +292,18 @@ export function DatasetsView() {
         ))}
       </div>
 
+      {nextCursor && (
+        <div className="flex justify-center">
+          <Button
+            variant="outline"
+            onClick={loadMoreDatasets}
+            disabled={loadingMore}
+          >
+            {loadingMore ? "Loading..." : "Load more"}
+          </Button>
+        </div>
+      )}
+
       <CreateDatasetModal
         open={isModalOpen}
         onOpenChange={setIsModalOpen}
@@ -16,8 +16,14 @@ export type SyftDataset = {
 export type ListDatasetsResponse = {
   datasets: SyftDataset[];
   total_count: number;
-  unique_emails: string[];
-  unique_names: string[];
+  next_cursor: string | null;
+};
+
+export type DatasetFacets = {
+  total_count: number;
+  emails: Record<string, number>;
+  domains: Record<string, number>;
+  names: string[];
 };
 
 export interface Job {
@@ -135,9 +141,17 @@ const getBaseUrl = () => {
 const BASE_URL = getBaseUrl();
 
 export const apiService = {
-  async getDatasets(): Promise<{ datasets: Dataset[] }> {
+  // One page of datasets; pass nextCursor back to fetch the following page.
+  // offset is the number of datasets already loaded, so ids stay unique.
+  async getDatasets(
+    cursor: string | null = null,
+    offset = 0,
+    limit = 100
+  ): Promise<{ datasets: Dataset[]; totalCount: number; nextCursor: string | null }> {
     try {
-      const response = await fetch(`${BASE_URL}/api/v1/datasets`);
+      const params = new URLSearchParams({ limit: String(limit) });
+      if (cursor) params.set("cursor", cursor);
+      const response = await fetch(`${BASE_URL}/api/v1/datasets?${params}`);
       if (!response.ok) {
         throw new Error(`HTTP error! status: ${response.status}`);
       }
@@ -145,8 +159,10 @@ export const apiService = {
       
       // Convert syft-datasets format to organic-coop format for compatibility
       return {
+        totalCount: data.total_count,
+        nextCursor: data.next_cursor,
         datasets: data.datasets.map((dataset, index) => ({
-          id: index + 1,
+          id: offset + index + 1,
           name: dataset.name,
           description: dataset.description,
           size: dataset.size,
@@ -249,6 +265,19 @@ export const apiService = {
     }
   },
 
+  async getFacets(): Promise<DatasetFacets> {
+    try {
+      const response = await fetch(`${BASE_URL}/api/v1/datasets/facets`);
+      if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+      }
+      return await response.json();
+    } catch (error) {
+      console.error('Failed to fetch dataset facets:', error);
+      throw error;
+    }
+  },
+
   async getUniqueEmails(): Promise<string[]> {
     try {
       const response = await fetch(`${BASE_URL}/api/v1/datasets/emails`);
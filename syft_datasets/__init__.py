@@ -1,22 +1,92 @@
-import os
-from typing import List
+import functools
+import importlib
+import threading
 
-import pandas as pd
-from syft_core import Client
-from syft_rds import init_session
-from tabulate import tabulate
+from . import metrics
+from .cache import CatalogCache, datasite_signature
+from .discovery import DiscoveryReport, discover_datasites
+from .events import GENERATION, CatalogEvent, EventHub, datasite_events
+from .health import HealthTracker
+from .index import SearchIndex
+from .metadata import DatasetMetadata, metadata_collector, mock_dir
+from .monitor import app_monitor
+from .store import (
+    SORT_KEYS,
+    CatalogStore,
+    dataset_id,
+    dataset_url,
+    parse_dataset_url,
+    row_array,
+)
+from .tagging import catalog_tags, get_tagger, set_taxonomy, tagged_rows
 
 __version__ = "0.2.0"
 
+# Heavy dependencies are imported on first use so that `import syft_datasets` stays cheap.
+# They remain reachable as module attributes (e.g. `syft_datasets.Client`).
+_LAZY_IMPORTS = {
+    "Client": ("syft_core", "Client"),
+    "init_session": ("syft_rds", "init_session"),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _lazy(name):
+    """Resolve a lazily imported dependency, honouring any patched module attribute"""
+    return globals()[name] if name in globals() else __getattr__(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _session_for(email):
+    """Shared syft_rds session per datasite"""
+    return _lazy("init_session")(host=email)
+
+
+def _fetch_dataset_obj(email, dataset_name):
+    return _session_for(email).dataset.get(name=dataset_name)
+
+
+def _datasites_dir(known=None):
+    """``known``, or the datasites directory of the SyftBox client if that is None"""
+    return known if known is not None else _lazy("Client").load().datasites
+
 
 class Dataset:
     """Represents a dataset from a specific datasite"""
 
+    __slots__ = (
+        "email",
+        "name",
+        "_dataset_obj",
+        "_dataset_loader",
+        "_datasites_dir",
+        "__weakref__",
+    )
+
     def __init__(self, email: str, dataset_name: str, dataset_obj=None):
         self.email = email
         self.name = dataset_name
-        self.dataset_obj = dataset_obj
-        self._syft_url = f"syft://{email}/private/datasets/{dataset_name}"
+        self._dataset_obj = dataset_obj
+        self._dataset_loader = None
+        self._datasites_dir = None
+
+    @classmethod
+    def _from_store(cls, store, row):
+        """Row view over a CatalogStore; cached rows fetch their syft_rds object on demand"""
+        email, name = store.email(row), store.names[row]
+        dataset = cls(email, name, store.objs[row])
+        dataset._datasites_dir = store.datasites_dir
+        if store.lazy[row]:
+            dataset._dataset_loader = functools.partial(_fetch_dataset_obj, email, name)
+        return dataset
 
     def __str__(self):
         return f"Dataset(email='{self.email}', name='{self.name}')"
@@ -24,27 +94,209 @@ class Dataset:
     def __repr__(self):
         return self.__str__()
 
+    @property
+    def dataset_obj(self):
+        """Underlying syft_rds dataset (fetched on first access for cached entries)"""
+        if self._dataset_obj is None and self._dataset_loader is not None:
+            self._dataset_obj = self._dataset_loader()
+            self._dataset_loader = None
+        return self._dataset_obj
+
+    @dataset_obj.setter
+    def dataset_obj(self, value):
+        self._dataset_obj = value
+        self._dataset_loader = None
+
     @property
     def syft_url(self):
-        return self._syft_url
+        return dataset_url(self.email, self.name)
+
+    @property
+    def id(self):
+        """Stable identifier derived from the dataset's syft URL"""
+        return dataset_id(self.email, self.name)
+
+    @property
+    def tags(self):
+        """Tags of the dataset: its datasite's email domain, then its taxonomy tags"""
+        return get_tagger().tag(self.email, self.name)
+
+    def preview(self, n=10):
+        """First ``n`` rows of the dataset's mock data
+
+        Reads the mock CSV, Parquet or JSON files in chunks and stops as soon as it
+        has ``n`` rows, so large datasets are never loaded in full.
+
+        Returns:
+            pandas.DataFrame: Up to ``n`` rows
+
+        Raises:
+            ValueError: ``n`` is less than 1
+        """
+        from .preview import preview
+
+        return preview(self._mock_dir(), n)
+
+    def sample(self, n=10, seed=None):
+        """Uniform random sample of ``n`` rows of the dataset's mock data
+
+        Streams every row through a reservoir, so memory stays bounded whatever the
+        size of the data.
+
+        Args:
+            n: Number of rows
+            seed: Seed for a reproducible sample
+
+        Returns:
+            pandas.DataFrame: Up to ``n`` rows, in the order they appear in the data
+
+        Raises:
+            ValueError: ``n`` is less than 1
+        """
+        from .preview import sample
+
+        return sample(self._mock_dir(), n, seed=seed)
+
+    def _datasites(self):
+        """Datasites directory of the catalog this dataset is from, resolved once"""
+        if self._datasites_dir is None:
+            self._datasites_dir = _datasites_dir()
+        return self._datasites_dir
+
+    def _mock_dir(self):
+        return mock_dir(self._datasites(), self.email, self.name)
+
+    @property
+    def metadata(self) -> DatasetMetadata:
+        """Size, file count, timestamps and content types of the dataset's local files
+
+        Computed from the mock (``public/datasets``) and private (``private/datasets``)
+        directories synced to this machine; directory listings are cached by mtime.
+        """
+        return metadata_collector(self._datasites()).get(self.email, self.name)
+
+
+def _row_view(store, row):
+    """The (cached) Dataset object for ``row`` of ``store``"""
+    view = store.views.get(row)
+    if view is None:
+        view = store.views[row] = Dataset._from_store(store, row)
+    return view
+
+
+class _CollectionState:
+    """What a collection shows: ``rows`` of ``store``, and the structures derived from them
+
+    ``store`` and ``rows`` never change; the derived structures are built on first
+    use and stay valid for as long as the state exists. A collection moves to a
+    new catalog generation by swapping in a new state with a single assignment, so
+    a reader holding the previous state keeps a consistent view of it.
+    """
+
+    __slots__ = ("store", "rows", "sort", "index", "positions")
+
+    def __init__(self, store, rows=None, sort=None):
+        self.store = store
+        self.rows = range(len(store)) if rows is None else rows
+        # ``(key, descending)`` if ``rows`` are known to be in that order
+        self.sort = sort
+        # SearchIndex over ``rows``
+        self.index = None
+        # Store row -> position in ``rows``
+        self.positions = None
+
+    def covers_store(self):
+        """Whether ``rows`` are every row of the store, in store order"""
+        rows = self.rows
+        return isinstance(rows, range) and rows == range(len(self.store))
+
+
+def _row_tags(state):
+    """Tags of each dataset of ``state``, from the catalog's tag index"""
+    tags = catalog_tags(state.store).rows
+    if state.covers_store():
+        return tags
+    return [tags[row] for row in state.rows]
 
 
 class DatasetCollection:
     """Collection of datasets that can be indexed and displayed as a table"""
 
-    def __init__(self, datasets=None, search_info=None):
+    def __init__(self, datasets=None, search_info=None, use_cache=True):
+        self._discovery_report = None
+        self._client = None
+        self._cache = None
+        self._health = HealthTracker()
+        self._use_cache = use_cache
+        self._datasites = {}
+        self._signatures = {}
+        self._events = EventHub()
+        self._lock = threading.RLock()
         if datasets is None:
-            self._datasets = []
+            self._set_rows(CatalogStore())
             self._search_info = None
             self._load_datasets()
         else:
-            self._datasets = datasets
+            self._set_rows(CatalogStore.from_datasets(datasets))
             self._search_info = search_info
 
+    @classmethod
+    def _view(cls, store, rows, search_info=None, sort=None):
+        """Collection over ``rows`` of an existing store, sharing its data"""
+        collection = cls(datasets=(), search_info=search_info)
+        collection._set_rows(store, rows, sort)
+        return collection
+
+    def _set_rows(self, store, rows=None, sort=None):
+        """Point this collection at ``rows`` of ``store`` (all rows by default)
+
+        The new state replaces the previous one in a single assignment: threads
+        reading the collection meanwhile see one generation or the other, never a
+        mix of both.
+        """
+        self._state = _CollectionState(store, rows, sort)
+
+    @property
+    def _store(self):
+        return self._state.store
+
+    @property
+    def _rows(self):
+        return self._state.rows
+
+    def frozen(self):
+        """This collection as it is now, unaffected by later refreshes
+
+        ``refresh`` and ``watch`` update a collection in place. A frozen view keeps
+        the generation it was taken from, so that several reads (a page, then the
+        ``generation`` and ``last_modified`` it belongs to) always agree.
+
+        Returns:
+            DatasetCollection: View sharing this collection's data and indexes
+        """
+        collection = DatasetCollection(datasets=(), search_info=self._search_info)
+        collection._state = self._state
+        return collection
+
+    @staticmethod
+    def _select(state, positions, search_info):
+        """View over the datasets at ``positions`` of ``state``, in that order"""
+        rows = state.rows
+        if isinstance(rows, range) and rows.start == 0 and rows.step == 1:
+            selected = row_array(positions)
+        else:
+            selected = row_array(rows[p] for p in positions)
+        return DatasetCollection._view(state.store, selected, search_info=search_info)
+
+    @property
+    def _datasets(self):
+        """List of the datasets in this collection"""
+        return self.to_list()
+
     def _load_datasets(self):
         """Load all available datasets from connected datasites"""
         try:
-            client = Client.load()
+            client = _lazy("Client").load()
 
             # Check 1: Verify SyftBox filesystem is accessible (works offline)
             filesystem_ok = False
@@ -56,52 +308,265 @@ class DatasetCollection:
                 print(f"❌ SyftBox filesystem not accessible: {e}")
                 print("    Make sure SyftBox is properly installed")
 
-            # Check 2: Verify SyftBox app is actually running (HTTP endpoint check)
-            try:
-                import requests
-
-                response = requests.get(str(client.config.client_url), timeout=2)
-                if response.status_code == 200 and "go1." in response.text:
-                    print(f"✅ SyftBox app running at {client.config.client_url}")
-            except Exception:
-                print(f"❌ SyftBox app not running at {client.config.client_url}")
+            # Check 2: Whether the SyftBox app is running; probed in the background
+            # and cached, so loading does not wait on an app that is down
+            monitor = app_monitor(client.config.client_url)
+            if monitor.last is None:
+                monitor.probe_in_background(on_result=print)
+            else:
+                print(monitor.status(wait=False))
 
             # Return early if filesystem not accessible
             if not filesystem_ok:
                 return
 
-            for email in datasites:
+            self._client = client
+            if self._use_cache:
                 try:
-                    datasite_client = init_session(host=email)
-                    for ds in datasite_client.datasets:
-                        dataset = Dataset(email=email, dataset_name=ds.name, dataset_obj=ds)
-                        self._datasets.append(dataset)
-                except Exception:
-                    # Skip datasites that can't be accessed
-                    continue
+                    self._cache = CatalogCache.for_client(client)
+                    self._health = HealthTracker(cache=self._cache)
+                except Exception as e:
+                    print(f"⚠️  Dataset catalog cache unavailable, loading without it: {e}")
+
+            self._sync_datasites(datasites)
 
         except Exception as e:
             print(f"⚠️  Could not find SyftBox client: {e}")
             print("    Make sure SyftBox is installed and you're logged in")
 
-    def search(self, keyword):
+    def _sync_datasites(self, emails, force=False):
+        """Bring the per-datasite catalog in line with ``emails``
+
+        Datasites whose signature matches the catalog cache are restored from it;
+        all others (or every datasite, if ``force``) are queried through syft_rds.
+        """
+        removed = set(self._datasites) - set(emails)
+        self._update_datasites(emails, removed=removed, force=force)
+
+    def _update_datasites(self, changed, removed=(), force=False):
+        """Re-load the ``changed`` datasites and drop the ``removed`` ones, leaving the rest as is"""
+        with self._lock:
+            signatures = {
+                email: datasite_signature(self._client.datasites, email) for email in changed
+            }
+
+            stale = []
+            for email in sorted(signatures):
+                names = None
+                if self._cache is not None and not force:
+                    names = self._cache.get(email, signatures[email])
+                if names is None:
+                    stale.append(email)
+                else:
+                    self._emit_datasite(email, names)
+                    self._datasites[email] = (names, None)
+
+            # Known-bad datasites are skipped until their backoff expires
+            skipped = [e for e in stale if not self._health.should_query(e, signatures[e])]
+            if skipped:
+                stale = sorted(set(stale) - set(skipped))
+                metrics.DATASITES_SKIPPED.inc(len(skipped))
+
+            def on_result(result):
+                self._health.record(result, signatures[result.email])
+                # Publish each datasite as soon as it answers, before the slowest one does
+                if result.ok:
+                    self._emit_datasite(result.email, [ds.name for ds in result.datasets])
+
+            report = discover_datasites(
+                stale, session_factory=_lazy("init_session"), on_result=on_result
+            )
+            report.skipped = skipped
+            self._discovery_report = report
+            for result in report.results:
+                if not result.ok:
+                    # Keep serving what we knew about a datasite that is temporarily failing
+                    continue
+                names = [ds.name for ds in result.datasets]
+                self._datasites[result.email] = (names, result.datasets)
+                if self._cache is not None:
+                    self._cache.put(result.email, signatures[result.email], names)
+
+            for email in removed:
+                self._emit_datasite(email, [])
+                self._datasites.pop(email, None)
+                self._signatures.pop(email, None)
+            # Failed and skipped datasites keep their last loaded signature (if any), so
+            # the watcher retries them once their backoff expires
+            unsettled = set(skipped) | {result.email for result in report.failed}
+            self._signatures.update(
+                (email, signature)
+                for email, signature in signatures.items()
+                if email not in unsettled
+            )
+            if self._cache is not None:
+                self._cache.evict()
+
+            store = CatalogStore.from_datasites(
+                (email, *self._datasites[email]) for email in sorted(self._datasites)
+            )
+            store.generation = self._store.generation + 1
+            store.datasites_dir = self._client.datasites
+            self._set_rows(store)
+            metrics.record_catalog(self)
+            self._events.emit(
+                [CatalogEvent(GENERATION, generation=store.generation, total_count=len(store))]
+            )
+
+        if report.failed:
+            print(
+                f"⚠️  {len(report.failed)} of {len(report.results)} datasites could not be queried"
+            )
+        if report.skipped:
+            print(f"⏭️  Skipped {len(report.skipped)} datasites that failed recently")
+        if report.failed or report.slow:
+            print(report.summary())
+
+    def _emit_datasite(self, email, names):
+        if self._events:
+            previous = self._datasites.get(email, ((), None))[0]
+            self._events.emit(datasite_events(email, previous, names))
+
+    def subscribe(self, callback):
+        """Get notified of changes to this collection as they are discovered
+
+        ``callback(event)`` receives a ``CatalogEvent`` for every datasite whose
+        datasets were added or removed, as soon as that datasite has been queried
+        (so during a load or refresh, before the slowest datasite answers), and a
+        ``generation`` event once the updated collection is visible. Callbacks run
+        in the loading or watcher thread.
+
+        Args:
+            callback: Function called with each CatalogEvent
+
+        Returns:
+            Callable: Function that cancels the subscription
+        """
+        return self._events.subscribe(callback)
+
+    def refresh(self, force=False):
+        """Re-sync the collection with the datasites currently available in SyftBox
+
+        Only datasites that changed on disk since they were last queried (or whose
+        cache entry expired) are queried again.
+
+        Args:
+            force: Ignore the catalog cache and query every datasite
+
+        Returns:
+            DatasetCollection: This collection, updated in place
+        """
+        if self._client is None:
+            raise ValueError("Only collections loaded from SyftBox can be refreshed")
+
+        datasites = [path.name for path in self._client.datasites.iterdir()]
+        self._sync_datasites(datasites, force=force)
+        return self
+
+    def watch(self, interval=2.0, use_watchdog=None, on_change=None):
+        """Keep this collection up to date in the background as datasites change on disk
+
+        Uses filesystem notifications (inotify, FSEvents, ...) through ``watchdog`` when
+        it is installed and falls back to polling datasite signatures otherwise. Only
+        datasites that changed are re-queried.
+
+        Args:
+            interval: Seconds between checks for changed datasites
+            use_watchdog: Force (True) or disable (False) filesystem notifications
+            on_change: Called as ``on_change(changed, removed)`` with the emails of the
+                affected datasites after each update
+
+        Returns:
+            CatalogWatcher: The running watcher; call ``stop()`` to end it
+        """
+        if self._client is None:
+            raise ValueError("Only collections loaded from SyftBox can be watched")
+
+        from .watcher import CatalogWatcher
+
+        watcher = CatalogWatcher(
+            self, interval=interval, use_watchdog=use_watchdog, on_change=on_change
+        )
+        watcher.start()
+        return watcher
+
+    @property
+    def generation(self):
+        """Version of the catalog, incremented every time it is updated
+
+        Collections derived from the catalog (search results, slices, ...) report
+        the generation of the catalog they were taken from.
+        """
+        return self._store.generation
+
+    @property
+    def last_modified(self):
+        """Time (seconds since the epoch) at which this generation of the catalog was built"""
+        return self._store.built_at
+
+    @property
+    def discovery_report(self):
+        """Per-datasite results of the last discovery run (None for derived collections)
+
+        Returns:
+            DiscoveryReport: Which datasites failed, timed out or were slow to respond
+        """
+        return self._discovery_report
+
+    def datasite_status(self):
+        """Health of each datasite: how many datasets it serves and whether it is failing
+
+        Datasites that keep failing are skipped for an exponentially growing period
+        (their circuit is "open") instead of being queried on every refresh.
+
+        Returns:
+            List[DatasiteStatus]: One entry per datasite, sorted by email
+        """
+        counts = dict(self.facets()["emails"])
+        for email in self._datasites:
+            counts.setdefault(email, 0)
+        return self._health.report(counts)
+
+    def _search_index(self, state=None):
+        """Search index over the datasets of this collection, built on first use"""
+        state = state or self._state
+        index = state.index
+        if index is None:
+            store, rows = state.store, state.rows
+            index = state.index = SearchIndex(
+                store.row_names(rows),
+                store.row_emails(rows),
+                tags=functools.partial(_row_tags, state),
+            )
+        return index
+
+    def search(self, keyword, whole_word=False, ranked=False, limit=None, fuzzy=True):
         """Search for datasets containing the keyword in name or email
 
         Args:
             keyword: Search term to look for in dataset name or email
+            whole_word: Only match complete words (e.g. 'crop' matches 'crop_yield',
+                not 'cropland')
+            ranked: Rank the datasets by relevance (BM25 over the words of their name,
+                email and tags) instead of matching substrings; best matches first
+            limit: With ``ranked``, the number of best matches to return
+            fuzzy: With ``ranked``, also match words with a typo or two
+                (e.g. 'wether' finds 'weather')
 
         Returns:
             DatasetCollection: New collection with filtered datasets
         """
-        keyword = keyword.lower()
-        filtered_datasets = []
+        state = self._state
+        index = self._search_index(state)
+        if ranked:
+            positions = [position for position, _ in index.rank(keyword, limit, fuzzy)]
+            search_info = f"Best matches for '{keyword.lower()}'"
+            return self._select(state, positions, search_info)
 
-        for dataset in self._datasets:
-            if keyword in dataset.name.lower() or keyword in dataset.email.lower():
-                filtered_datasets.append(dataset)
+        positions = index.search_tokens(keyword) if whole_word else index.search(keyword)
 
-        search_info = f"Search results for '{keyword}'"
-        return DatasetCollection(datasets=filtered_datasets, search_info=search_info)
+        search_info = f"Search results for '{keyword.lower()}'"
+        return self._select(state, positions, search_info)
 
     def filter_by_email(self, email_pattern):
         """Filter datasets by email pattern
@@ -112,29 +577,271 @@ class DatasetCollection:
         Returns:
             DatasetCollection: New collection with filtered datasets
         """
-        pattern = email_pattern.lower()
-        filtered_datasets = []
-
-        for dataset in self._datasets:
-            if pattern in dataset.email.lower():
-                filtered_datasets.append(dataset)
+        state = self._state
+        positions = self._search_index(state).filter_by_email(email_pattern)
 
         search_info = f"Filtered by email containing '{email_pattern}'"
-        return DatasetCollection(datasets=filtered_datasets, search_info=search_info)
+        return self._select(state, positions, search_info)
+
+    def filter_by_tag(self, tags):
+        """Datasets carrying a tag (an email domain or a taxonomy tag such as "healthcare")
+
+        Tags are computed once per catalog and looked up in its tag index.
+
+        Args:
+            tags: Tag, or list of tags, of which a dataset must have at least one
+
+        Returns:
+            DatasetCollection: New collection with the tagged datasets, in the same order
+        """
+        tags = [tags] if isinstance(tags, str) else list(tags)
+        state = self._state
+        rows = tagged_rows(state.store, state.rows, tags)
+        search_info = f"Tagged {' or '.join(repr(tag) for tag in tags)}"
+        return DatasetCollection._view(state.store, rows, search_info=search_info)
+
+    def tag_counts(self):
+        """Number of datasets carrying each tag
+
+        Returns:
+            Dict[str, int]: Dataset count per tag, sorted by tag
+        """
+        state = self._state
+        if state.covers_store():
+            return catalog_tags(state.store).counts()
+        counts = {}
+        for tags in _row_tags(state):
+            for tag in tags:
+                counts[tag] = counts.get(tag, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def to_frame(self):
+        """Datasets of this collection as a pandas DataFrame
+
+        Returns:
+            pandas.DataFrame: One row per dataset with email, name, domain, syft_url
+                and tags columns
+        """
+        from .frame import collection_frame
+
+        state = self._state
+        return collection_frame(state.store, state.rows)
+
+    def query(self, email_regex=None, name_contains=None, domain=None, tags=None):
+        """Filter datasets on several criteria at once (all given criteria must match)
+
+        Filters run as vectorized operations over a cached DataFrame of the catalog.
+
+        Args:
+            email_regex: Regular expression searched in the email (case insensitive)
+            name_contains: Substring of the dataset name (case insensitive)
+            domain: Email domain, or list of domains, to keep (e.g. "openmined.org")
+            tags: Tag, or list of tags, of which a dataset must have at least one
+
+        Returns:
+            DatasetCollection: New collection with the matching datasets
+        """
+        from .frame import query_rows, to_row_array
+
+        state = self._state
+        rows = query_rows(
+            state.store,
+            state.rows,
+            email_regex=email_regex,
+            name_contains=name_contains,
+            domain=domain,
+            tags=tags,
+        )
+        criteria = {
+            "email_regex": email_regex,
+            "name_contains": name_contains,
+            "domain": domain,
+            "tags": tags,
+        }
+        description = ", ".join(f"{k}={v!r}" for k, v in criteria.items() if v is not None)
+        search_info = f"Query results for {description}" if description else self._search_info
+        return DatasetCollection._view(state.store, to_row_array(rows), search_info=search_info)
+
+    def sort_by(self, key="name", descending=False):
+        """Datasets of this collection in sorted order
+
+        Args:
+            key: "name" or "email"; ties are broken by the other field
+            descending: Sort in descending order
+
+        Returns:
+            DatasetCollection: New collection with the same datasets, sorted
+        """
+        if key not in SORT_KEYS:
+            raise ValueError(f"Cannot sort by {key!r}, expected one of {sorted(SORT_KEYS)}")
+
+        state = self._state
+        order = state.store.sort_order(key)
+        if not state.covers_store():
+            selected = bytearray(len(state.store))
+            for row in state.rows:
+                selected[row] = 1
+            order = row_array(row for row in order if selected[row])
+        if descending:
+            order = order[::-1]
+
+        return DatasetCollection._view(
+            state.store, order, search_info=self._search_info, sort=(key, descending)
+        )
+
+    def page(self, limit, after=None, sort="name", descending=False):
+        """One page of this collection in sorted order, for cursor-based pagination
+
+        Pages are positioned by the sort key of the last dataset already seen rather
+        than by offset, so they stay consistent while the catalog changes.
+
+        Args:
+            limit: Maximum number of datasets in the page
+            after: ``(name, email)`` of the last dataset of the previous page
+            sort: Sort key, "name" or "email"
+            descending: Sort in descending order
+
+        Returns:
+            Tuple[DatasetCollection, Optional[Tuple[str, str]]]: The page, and the
+                ``after`` value for the next page (None on the last page)
+        """
+        ordered = self.frozen()
+        if ordered._state.sort != (sort, descending):
+            ordered = ordered.sort_by(sort, descending)
+        store, rows = ordered._store, ordered._rows
+
+        start = 0
+        if after is not None:
+            bound = SORT_KEYS[sort](*after)
+            # First position sorting strictly after ``bound``
+            low, high = 0, len(rows)
+            while low < high:
+                middle = (low + high) // 2
+                key = store.sort_key(rows[middle], sort)
+                if (key < bound) if descending else (key > bound):
+                    high = middle
+                else:
+                    low = middle + 1
+            start = low
+
+        end = start + limit
+        page = ordered[start:end]
+        if end >= len(rows) or not len(page):
+            return page, None
+        last = rows[end - 1]
+        return page, (store.names[last], store.email(last))
+
+    def facets(self):
+        """Aggregates over this collection, cached for the whole catalog
+
+        Returns:
+            dict: ``total_count``, dataset counts per ``emails`` and ``domains``,
+                and the sorted distinct ``names``
+        """
+        state = self._state
+        store = state.store
+        if state.covers_store():
+            return store.facets()
+        return CatalogStore.from_datasites(
+            (store.email(row), [store.names[row]], None) for row in state.rows
+        ).facets()
 
     def list_unique_emails(self):
         """Get list of unique email addresses"""
-        emails = set(dataset.email for dataset in self._datasets)
-        return sorted(list(emails))
+        state = self._state
+        return sorted(state.store.unique_emails(state.rows))
 
     def list_unique_names(self):
         """Get list of unique dataset names"""
-        names = set(dataset.name for dataset in self._datasets)
-        return sorted(list(names))
+        state = self._state
+        if state.covers_store():
+            return list(state.store.facets()["names"])
+        return sorted(set(state.store.row_names(state.rows)))
+
+    def metadata(self, max_workers=None):
+        """Filesystem metadata of every dataset, collected concurrently
+
+        Args:
+            max_workers: Threads walking dataset directories (default: the collector's)
+
+        Returns:
+            List[DatasetMetadata]: One entry per dataset, in collection order
+        """
+        state = self._state
+        store = state.store
+        collector = metadata_collector(_datasites_dir(store.datasites_dir))
+        pairs = ((store.email(row), store.names[row]) for row in state.rows)
+        return collector.collect(pairs, max_workers=max_workers)
 
     def to_list(self):
         """Convert to a simple list of datasets for model parameter"""
-        return list(self._datasets)
+        return list(self)
+
+    @staticmethod
+    def _position_of(state, row):
+        """Position of store ``row`` in ``state``, or None if it is not part of it"""
+        if row is None or state.covers_store():
+            return row
+        positions = state.positions
+        if positions is None:
+            positions = {}
+            for position, collection_row in enumerate(state.rows):
+                positions.setdefault(collection_row, position)
+            state.positions = positions
+        return positions.get(row)
+
+    @staticmethod
+    def _row_for(store, key):
+        """Store row of a dataset URL, dataset id or ``(email, name)`` pair (None if unknown)"""
+        if isinstance(key, tuple):
+            return store.key_index().get(key)
+        if isinstance(key, Dataset):
+            return store.key_index().get((key.email, key.name))
+        if not isinstance(key, str):
+            raise TypeError(
+                "Datasets are looked up by syft URL, id, (email, name) or Dataset, "
+                f"not {type(key).__name__}"
+            )
+        if key.startswith("syft://"):
+            parsed = parse_dataset_url(key)
+            return None if parsed is None else store.key_index().get(parsed)
+        return store.id_index().get(key)
+
+    def _lookup(self, key):
+        state = self._state
+        position = self._position_of(state, self._row_for(state.store, key))
+        return None if position is None else _row_view(state.store, state.rows[position])
+
+    def get(self, email, name):
+        """Dataset ``name`` of datasite ``email``
+
+        Unlike positions, which shift whenever the catalog reloads, ``(email, name)``,
+        ``syft_url`` and ``id`` keep identifying the same dataset. Lookups use hash
+        indexes built once per catalog.
+
+        Returns:
+            Dataset: The dataset, or None if it is not in this collection
+        """
+        return self._lookup((email, name))
+
+    def get_by_url(self, syft_url):
+        """Dataset with the given ``syft://<email>/private/datasets/<name>`` URL, or None"""
+        return self._lookup(syft_url)
+
+    def get_by_id(self, dataset_id):
+        """Dataset with the given ``id``, or None"""
+        return self._lookup(dataset_id)
+
+    def get_many(self, keys):
+        """Resolve many dataset references at once
+
+        Args:
+            keys: syft URLs, dataset ids or ``(email, name)`` pairs, in any mix
+
+        Returns:
+            List[Optional[Dataset]]: The dataset of each key, None for unknown keys
+        """
+        return [self._lookup(key) for key in keys]
 
     def get_by_indices(self, indices):
         """Get datasets by list of indices
@@ -145,7 +852,8 @@ class DatasetCollection:
         Returns:
             List[Dataset]: Selected datasets
         """
-        return [self._datasets[i] for i in indices if 0 <= i < len(self._datasets)]
+        count = len(self)
+        return [self[i] for i in indices if 0 <= i < count]
 
     def help(self):
         """Show help and examples for using the dataset collection"""
@@ -168,12 +876,26 @@ Programmatic Usage:
 
 Search & Filter:
   syd.datasets.search("crop")           # Search for 'crop' in names/emails
+  syd.datasets.search("wether", ranked=True, limit=10)  # Best 10 matches, typos allowed
   syd.datasets.filter_by_email("andrew") # Filter by email containing 'andrew'
+  syd.datasets.filter_by_tag("healthcare")  # Datasets with a taxonomy or domain tag
   syd.datasets.get_by_indices([0,1,5])  # Get specific datasets by index
+  syd.datasets.get("andrew@openmined.org", "crop_yield")  # Stable lookups, also
+  syd.datasets.get_by_url(url)          # by syft URL or id, and in batch with
+  syd.datasets.get_many([url, ...])     # get_many
+  syd.stream(lambda ds: "crop" in ds.name, limit=3)  # First matches, no full scan
+  syd.datasets.query(domain="openmined.org", name_contains="crop")  # Combined filters
+  syd.datasets.to_frame()               # pandas DataFrame of the datasets
+  syd.datasets.sort_by("email")         # Sorted by email (or "name")
   
 Utility Methods:
   syd.datasets.list_unique_emails()     # List all unique emails
   syd.datasets.list_unique_names()      # List all unique dataset names
+  syd.datasets.facets()                 # Dataset counts per email and domain
+  syd.datasets.to_string(max_rows=20)   # Plain-text table (max_rows=None for all)
+  syd.datasets.refresh()                # Re-query datasites that changed on disk
+  syd.datasets.datasite_status()        # Which datasites are failing or skipped
+  syd.stats()                           # Discovery latency, cache hits, catalog size
   
 Example Usage:
   import syft_datasets as syd
@@ -181,8 +903,11 @@ Example Usage:
   # Browse and select datasets interactively
   syd.datasets
   
-  # Selected datasets:
-  datasets = [syd.datasets[i] for i in [0, 1, 16, 20, 23]]
+  # Selected datasets (as copied by "Generate Code"):
+  datasets = syd.datasets.get_many([
+      "syft://andrew@openmined.org/private/datasets/crop_yield",
+      "syft://irina@openmined.org/private/datasets/census",
+  ])
   
   # Use with OpenAI-compatible chat (requires syft_nsai):
   # import syft_nsai as nsai
@@ -195,345 +920,189 @@ Example Usage:
 
     def __getitem__(self, index):
         """Allow indexing like datasets[0] or slicing like datasets[:3]"""
+        state = self._state
         if isinstance(index, slice):
             slice_info = f"{self._search_info} (slice {index})" if self._search_info else None
-            return DatasetCollection(datasets=self._datasets[index], search_info=slice_info)
-        return self._datasets[index]
+            return DatasetCollection._view(state.store, state.rows[index], search_info=slice_info)
+        return _row_view(state.store, state.rows[index])
 
     def __len__(self):
-        return len(self._datasets)
+        return len(self._state.rows)
 
     def __iter__(self):
-        return iter(self._datasets)
+        state = self._state
+        store = state.store
+        return (_row_view(store, row) for row in state.rows)
 
     def _repr_html_(self):
-        """HTML representation for Jupyter notebooks"""
-        if not self._datasets:
+        """HTML representation for Jupyter notebooks (a virtualized table)"""
+        state = self._state
+        if not len(state.rows):
             return "<p><em>No datasets available</em></p>"
 
-        title = self._search_info if self._search_info else "Available Datasets"
-        count = len(self._datasets)
-        search_indicator = (
-            f"<p style='color: #28a745; font-style: italic;'>🔍 {self._search_info}</p>"
-            if self._search_info
-            else ""
-        )
+        from .notebook import collection_html
 
-        container_id = f"nsai-container-{hash(str(self._datasets)) % 10000}"
-
-        html = f"""
-        <style>
-        .nsai-container {{
-            max-height: 500px;
-            border: 1px solid #dee2e6;
-            border-radius: 6px;
-            margin: 10px 0;
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-        }}
-        .nsai-header {{
-            background-color: #f8f9fa;
-            padding: 10px 15px;
-            border-bottom: 1px solid #dee2e6;
-            margin: 0;
-        }}
-        .nsai-controls {{
-            padding: 10px 15px;
-            background-color: #fff;
-            border-bottom: 1px solid #dee2e6;
-            display: flex;
-            gap: 10px;
-            align-items: center;
-        }}
-        .nsai-search-box {{
-            flex: 1;
-            padding: 6px 10px;
-            border: 1px solid #ced4da;
-            border-radius: 4px;
-            font-size: 12px;
-        }}
-        .nsai-btn {{
-            padding: 6px 12px;
-            background-color: #007bff;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 11px;
-            text-decoration: none;
-        }}
-        .nsai-btn:hover {{
-            background-color: #0056b3;
-        }}
-        .nsai-btn-secondary {{
-            background-color: #6c757d;
-        }}
-        .nsai-btn-secondary:hover {{
-            background-color: #545b62;
-        }}
-        .nsai-table-container {{
-            max-height: 320px;
-            overflow-y: auto;
-        }}
-        .nsai-datasets-table {{
-            border-collapse: collapse;
-            width: 100%;
-            font-size: 11px;
-            margin: 0;
-        }}
-        .nsai-datasets-table th {{
-            background-color: #f8f9fa;
-            border-bottom: 2px solid #dee2e6;
-            padding: 6px 8px;
-            text-align: left;
-            font-weight: 600;
-            color: #495057;
-            position: sticky;
-            top: 0;
-            z-index: 10;
-        }}
-        .nsai-datasets-table td {{
-            border-bottom: 1px solid #f1f3f4;
-            padding: 4px 8px;
-            vertical-align: top;
-        }}
-        .nsai-datasets-table tr:hover {{
-            background-color: #f8f9fa;
-        }}
-        .nsai-datasets-table tr.nsai-selected {{
-            background-color: #e3f2fd;
-        }}
-        .nsai-email {{
-            color: #0066cc;
-            font-weight: 500;
-            font-size: 10px;
-        }}
-        .nsai-dataset-name {{
-            color: #28a745;
-            font-weight: 500;
-            max-width: 180px;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            white-space: nowrap;
-        }}
-        .nsai-syft-url {{
-            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
-            font-size: 9px;
-            color: #6c757d;
-            max-width: 250px;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            white-space: nowrap;
-        }}
-        .nsai-index {{
-            text-align: center;
-            font-weight: 600;
-            color: #495057;
-            background-color: #f8f9fa;
-            width: 30px;
-        }}
-        .nsai-checkbox {{
-            width: 30px;
-            text-align: center;
-        }}
-        .nsai-output {{
-            padding: 10px 15px;
-            background-color: #f8f9fa;
-            border-top: 1px solid #dee2e6;
-            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
-            font-size: 10px;
-            color: #495057;
-            white-space: pre-wrap;
-            overflow-x: auto;
-        }}
-        .nsai-status {{
-            padding: 5px 15px;
-            background-color: #e9ecef;
-            font-size: 10px;
-            color: #6c757d;
-        }}
-        </style>
-        <div class="nsai-container" id="{container_id}">
-            <div class="nsai-header">
-                <strong>📊 {title} ({count} total)</strong>
-                {search_indicator}
-            </div>
-            <div class="nsai-controls">
-                <input type="text" class="nsai-search-box" placeholder="🔍 Search datasets..." 
-                       onkeyup="filterDatasets('{container_id}')">
-                <button class="nsai-btn" onclick="selectAll('{container_id}')">Select All</button>
-                <button class="nsai-btn nsai-btn-secondary" onclick="clearAll('{container_id}')">Clear</button>
-                <button class="nsai-btn" onclick="generateCode('{container_id}')">Generate Code</button>
-            </div>
-            <div class="nsai-table-container">
-                <table class="nsai-datasets-table">
-                    <thead>
-                        <tr>
-                            <th>☑</th>
-                            <th>#</th>
-                            <th>Email</th>
-                            <th>Dataset Name</th>
-                            <th>Syft URL</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-        """
+        return collection_html(state.store, state.rows, search_info=self._search_info)
 
-        for i, dataset in enumerate(self._datasets):
-            html += f"""
-            <tr data-email="{dataset.email.lower()}" data-name="{dataset.name.lower()}" data-index="{i}">
-                <td class="nsai-checkbox">
-                    <input type="checkbox" onchange="updateSelection('{container_id}')">
-                </td>
-                <td class="nsai-index">{i}</td>
-                <td class="nsai-email">{dataset.email}</td>
-                <td class="nsai-dataset-name" title="{dataset.name}">{dataset.name}</td>
-                <td class="nsai-syft-url" title="{dataset.syft_url}">{dataset.syft_url}</td>
-            </tr>
-            """
-
-        html += f"""
-                    </tbody>
-                </table>
-            </div>
-            <div class="nsai-status" id="{container_id}-status">
-                0 datasets selected • Use checkboxes to select datasets
-            </div>
-            <div class="nsai-output" id="{container_id}-output" style="display: none;">
-                # Copy this code to your notebook:
-            </div>
-        </div>
-        
-        <script>
-        function filterDatasets(containerId) {{
-            const searchBox = document.querySelector(`#${{containerId}} .nsai-search-box`);
-            const table = document.querySelector(`#${{containerId}} .nsai-datasets-table tbody`);
-            const rows = table.querySelectorAll('tr');
-            const searchTerm = searchBox.value.toLowerCase();
-            
-            let visibleCount = 0;
-            rows.forEach(row => {{
-                const email = row.dataset.email || '';
-                const name = row.dataset.name || '';
-                const isVisible = email.includes(searchTerm) || name.includes(searchTerm);
-                row.style.display = isVisible ? '' : 'none';
-                if (isVisible) visibleCount++;
-            }});
-            
-            updateSelection(containerId);
-        }}
-        
-        function selectAll(containerId) {{
-            const table = document.querySelector(`#${{containerId}} .nsai-datasets-table tbody`);
-            const checkboxes = table.querySelectorAll('input[type="checkbox"]');
-            const visibleCheckboxes = Array.from(checkboxes).filter(cb => 
-                cb.closest('tr').style.display !== 'none'
-            );
-            
-            const allChecked = visibleCheckboxes.every(cb => cb.checked);
-            visibleCheckboxes.forEach(cb => cb.checked = !allChecked);
-            
-            updateSelection(containerId);
-        }}
-        
-        function clearAll(containerId) {{
-            const table = document.querySelector(`#${{containerId}} .nsai-datasets-table tbody`);
-            const checkboxes = table.querySelectorAll('input[type="checkbox"]');
-            checkboxes.forEach(cb => cb.checked = false);
-            updateSelection(containerId);
-        }}
-        
-        function updateSelection(containerId) {{
-            const table = document.querySelector(`#${{containerId}} .nsai-datasets-table tbody`);
-            const rows = table.querySelectorAll('tr');
-            const status = document.querySelector(`#${{containerId}}-status`);
-            
-            let selectedCount = 0;
-            rows.forEach(row => {{
-                const checkbox = row.querySelector('input[type="checkbox"]');
-                if (checkbox && checkbox.checked) {{
-                    row.classList.add('nsai-selected');
-                    selectedCount++;
-                }} else {{
-                    row.classList.remove('nsai-selected');
-                }}
-            }});
-            
-            const visibleRows = Array.from(rows).filter(row => row.style.display !== 'none');
-            status.textContent = `${{selectedCount}} dataset(s) selected • ${{visibleRows.length}} visible`;
-        }}
-        
-        function generateCode(containerId) {{
-            const table = document.querySelector(`#${{containerId}} .nsai-datasets-table tbody`);
-            const rows = table.querySelectorAll('tr');
-            const output = document.querySelector(`#${{containerId}}-output`);
-            
-            const selectedIndices = [];
-            rows.forEach(row => {{
-                const checkbox = row.querySelector('input[type="checkbox"]');
-                if (checkbox && checkbox.checked) {{
-                    selectedIndices.push(row.dataset.index);
-                }}
-            }});
-            
-            if (selectedIndices.length === 0) {{
-                output.style.display = 'none';
-                return;
-            }}
-            
-            let code;
-            if (selectedIndices.length === 1) {{
-                code = `# Selected dataset:
-dataset = syd.datasets[${{selectedIndices[0]}}]`;
-            }} else {{
-                const indicesStr = selectedIndices.join(', ');
-                code = `# Selected datasets:
-datasets = [syd.datasets[i] for i in [${{indicesStr}}]]`;
-            }}
-            
-            // Copy to clipboard
-            navigator.clipboard.writeText(code).then(() => {{
-                // Update button text to show success
-                const button = document.querySelector(`#${{containerId}} button[onclick="generateCode('${{containerId}}')"]`);
-                const originalText = button.textContent;
-                button.textContent = '✅ Copied!';
-                button.style.backgroundColor = '#28a745';
-                
-                // Reset button after 2 seconds
-                setTimeout(() => {{
-                    button.textContent = originalText;
-                    button.style.backgroundColor = '#007bff';
-                }}, 2000);
-            }}).catch(err => {{
-                console.warn('Could not copy to clipboard:', err);
-                // Fallback: still show the code for manual copying
-            }});
-            
-            output.textContent = code;
-            output.style.display = 'block';
-        }}
-        </script>
-        """
+    def to_string(self, max_rows=None, buf=None):
+        """Plain-text table of the datasets
 
-        return html
+        Args:
+            max_rows: Show only the first and last rows, ``max_rows`` in total
+                (None shows every dataset)
+            buf: File-like object to write the table to, line by line, instead
+                of returning it
 
-    def __str__(self):
-        """Display datasets as a nice table"""
-        if not self._datasets:
+        Returns:
+            str: The table, or None if written to ``buf``
+        """
+        from .table import format_table, write_table
+
+        state = self._state
+        if buf is not None:
+            if not len(state.rows):
+                buf.write("No datasets available")
+            else:
+                write_table(state.store, state.rows, buf, max_rows)
+            return None
+        if not len(state.rows):
             return "No datasets available"
+        return format_table(state.store, state.rows, max_rows)
 
-        table_data = []
-        for i, dataset in enumerate(self._datasets):
-            table_data.append([i, dataset.email, dataset.name, dataset.syft_url])
+    def __str__(self):
+        """Display datasets as a table, truncated to its head and tail if long"""
+        from .table import DEFAULT_MAX_ROWS
 
-        headers = ["Index", "Email", "Dataset Name", "Syft URL"]
-        return tabulate(table_data, headers=headers, tablefmt="grid")
+        return self.to_string(max_rows=DEFAULT_MAX_ROWS)
 
     def __repr__(self):
         return self.__str__()
 
 
-# Create global instance
-datasets = DatasetCollection()
+class _LazyDatasetCollection:
+    """Proxy for the global collection that discovers datasets on first access"""
+
+    def __init__(self):
+        self._collection = None
+        self._pending = None
+        self._lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+
+    def _target(self):
+        """The global collection object, created empty (without discovery) if needed"""
+        with self._pending_lock:
+            if self._pending is None:
+                self._pending = DatasetCollection(datasets=())
+            return self._pending
+
+    def _load(self):
+        if self._collection is None:
+            with self._lock:
+                if self._collection is None:
+                    collection = self._target()
+                    collection._load_datasets()
+                    self._collection = collection
+        return self._collection
+
+    @property
+    def loaded(self):
+        """Whether the initial discovery has completed"""
+        return self._collection is not None
+
+    def current(self):
+        """The global collection as it is now, without triggering or waiting for discovery
+
+        Empty until the initial discovery completes.
+        """
+        return self._collection or self._target()
+
+    def subscribe(self, callback):
+        """Subscribe to catalog events, including those of the initial discovery
+
+        Does not trigger discovery; see ``DatasetCollection.subscribe``.
+        """
+        return self._target().subscribe(callback)
+
+    def __getattr__(self, name):
+        # Don't trigger discovery for protocol probes (copy, pickle, inspect, ...)
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+    def __getitem__(self, index):
+        return self._load()[index]
+
+    def __len__(self):
+        return len(self._load())
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def _repr_html_(self):
+        return self._load()._repr_html_()
+
+    def __str__(self):
+        return str(self._load())
+
+    def __repr__(self):
+        return repr(self._load())
+
+
+def iter_datasets(predicate=None, limit=None, use_cache=True):
+    """Yield datasets as datasites are discovered, without waiting for a full scan
+
+    Args:
+        predicate: Only yield datasets for which ``predicate(dataset)`` is true
+        limit: Stop after this many matching datasets
+        use_cache: Serve datasites that did not change from the catalog cache
+
+    Yields:
+        Dataset: Matching datasets, fastest datasites first
+    """
+    from .streaming import iter_datasets as _iter_datasets
+
+    return _iter_datasets(predicate=predicate, limit=limit, use_cache=use_cache)
+
+
+def aiter_datasets(predicate=None, limit=None, use_cache=True):
+    """Async variant of ``iter_datasets``, for use with ``async for``"""
+    from .streaming import aiter_datasets as _aiter_datasets
+
+    return _aiter_datasets(predicate=predicate, limit=limit, use_cache=use_cache)
+
+
+def stats():
+    """Metrics recorded by this process
+
+    Covers per-datasite discovery latency, catalog cache hits and misses, and the
+    size of the catalog. Recording can be turned off with ``syd.metrics.disable()``
+    or ``SYFT_DATASETS_METRICS=0``.
+
+    Returns:
+        dict: Value of each metric by name; labelled metrics map ``"label=value"``
+            to their values, and histograms report their count, sum and mean
+    """
+    return metrics.stats()
+
+
+# Short aliases: syd.stream(...) and syd.astream(...)
+stream = iter_datasets
+astream = aiter_datasets
+
+# Global instance, loaded lazily on first use
+datasets = _LazyDatasetCollection()
 
 # Export classes and instance
-__all__ = ["Dataset", "DatasetCollection", "datasets"]
+__all__ = [
+    "Dataset",
+    "DatasetCollection",
+    "DatasetMetadata",
+    "DiscoveryReport",
+    "aiter_datasets",
+    "astream",
+    "datasets",
+    "iter_datasets",
+    "set_taxonomy",
+    "stats",
+    "stream",
+]
@@ -0,0 +1,190 @@
+"""Persistent on-disk cache of the dataset names published by each datasite"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .metrics import CACHE_LOOKUPS
+
+DEFAULT_TTL = 6 * 60 * 60  # seconds
+DEFAULT_MAX_ENTRIES = 10_000
+CACHE_DIR_NAME = ".syft_datasets"
+CACHE_FILE_NAME = "catalog.sqlite3"
+
+# Where syft_rds keeps the dataset records of a datasite, relative to the datasite directory
+RDS_DATASET_STORE = Path("app_data") / "RDS" / "store" / "dataset"
+
+# Bump when the table layout changes; older cache files are discarded
+_SCHEMA_VERSION = 1
+
+
+def datasite_signature(datasites_dir: Union[str, Path], email: str) -> str:
+    """Cheap fingerprint of a datasite that changes whenever its datasets may have changed
+
+    Combines the mtime of the datasite directory with the mtimes of the syft_rds
+    dataset store (the manifest) and of the records inside it. Only stats a handful
+    of entries, so it is far cheaper than opening a session.
+    """
+    datasite_dir = Path(datasites_dir) / email
+    parts = []
+    try:
+        parts.append(datasite_dir.stat().st_mtime_ns)
+    except OSError:
+        return "missing"
+
+    manifest_dir = datasite_dir / RDS_DATASET_STORE
+    try:
+        parts.append(manifest_dir.stat().st_mtime_ns)
+        with os.scandir(manifest_dir) as entries:
+            parts.append(max((entry.stat().st_mtime_ns for entry in entries), default=0))
+    except OSError:
+        parts.append(0)
+
+    return ":".join(str(part) for part in parts)
+
+
+class CatalogCache:
+    """SQLite-backed cache mapping datasite email -> dataset names
+
+    Entries are keyed by a datasite signature (see ``datasite_signature``); a lookup
+    with a different signature, or for an entry older than ``ttl``, is a miss.
+    The cache holds at most ``max_entries`` datasites, evicting the least recently used.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._init_schema()
+
+    @classmethod
+    def for_client(cls, client, **kwargs) -> "CatalogCache":
+        """Open the cache stored under the SyftBox data directory of ``client``"""
+        data_dir = Path(client.config.data_dir)
+        return cls(data_dir / CACHE_DIR_NAME / CACHE_FILE_NAME, **kwargs)
+
+    def _init_schema(self):
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS datasites")
+                self._conn.execute("DROP TABLE IF EXISTS datasite_health")
+                self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS datasites (
+                    email TEXT PRIMARY KEY,
+                    signature TEXT NOT NULL,
+                    datasets TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS datasite_health (
+                    email TEXT PRIMARY KEY,
+                    health TEXT NOT NULL
+                )
+                """
+            )
+
+    def get(self, email: str, signature: str) -> Optional[List[str]]:
+        """Cached dataset names for ``email``, or None if missing, stale or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT signature, datasets, fetched_at FROM datasites WHERE email = ?",
+                (email,),
+            ).fetchone()
+            if row is None:
+                CACHE_LOOKUPS.inc(result="miss")
+                return None
+
+            cached_signature, datasets, fetched_at = row
+            now = time.time()
+            if cached_signature != signature or now - fetched_at > self.ttl:
+                CACHE_LOOKUPS.inc(result="stale")
+                return None
+
+            CACHE_LOOKUPS.inc(result="hit")
+
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE datasites SET last_used = ? WHERE email = ?", (now, email)
+                )
+            return json.loads(datasets)
+
+    def put(self, email: str, signature: str, names: List[str]):
+        """Store the dataset names of ``email`` under ``signature``"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO datasites VALUES (?, ?, ?, ?, ?)",
+                (email, signature, json.dumps(list(names)), now, now),
+            )
+
+    def invalidate(self, email: Optional[str] = None):
+        """Drop the entry for ``email``, or every entry if no email is given"""
+        with self._lock, self._conn:
+            if email is None:
+                self._conn.execute("DELETE FROM datasites")
+            else:
+                self._conn.execute("DELETE FROM datasites WHERE email = ?", (email,))
+
+    def get_health(self) -> Dict[str, dict]:
+        """Persisted health entries of failing datasites (see ``HealthTracker``)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT email, health FROM datasite_health").fetchall()
+        return {email: json.loads(health) for email, health in rows}
+
+    def put_health(self, email: str, health: dict):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO datasite_health VALUES (?, ?)", (email, json.dumps(health))
+            )
+
+    def delete_health(self, email: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM datasite_health WHERE email = ?", (email,))
+
+    def evict(self) -> int:
+        """Remove expired entries and trim the cache to ``max_entries``
+
+        Returns:
+            int: Number of evicted entries
+        """
+        with self._lock, self._conn:
+            expired = self._conn.execute(
+                "DELETE FROM datasites WHERE fetched_at < ?", (time.time() - self.ttl,)
+            ).rowcount
+            overflow = self._conn.execute(
+                """
+                DELETE FROM datasites WHERE email IN (
+                    SELECT email FROM datasites ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            ).rowcount
+        return expired + overflow
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM datasites").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,183 @@
+"""Concurrent discovery of datasets across SyftBox datasites"""
+
+import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .metrics import DATASITE_LAST_QUERY_SECONDS, DATASITE_QUERY_SECONDS, DISCOVERY_SECONDS
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_SLOW_THRESHOLD = 2.0
+
+# How often the coordinator wakes up to check for datasites that overran their budget
+_POLL_INTERVAL = 0.05
+
+
+@dataclass
+class DatasiteResult:
+    """Outcome of querying a single datasite"""
+
+    email: str
+    datasets: List[Any] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out
+
+    @property
+    def outcome(self) -> str:
+        return "timeout" if self.timed_out else "error" if self.error is not None else "ok"
+
+
+@dataclass
+class DiscoveryReport:
+    """Per-datasite results of a discovery run, ordered by datasite email"""
+
+    results: List[DatasiteResult] = field(default_factory=list)
+    slow_threshold: float = DEFAULT_SLOW_THRESHOLD
+    elapsed: float = 0.0
+    # Datasites not queried because they are known to be failing (see ``HealthTracker``)
+    skipped: List[str] = field(default_factory=list)
+
+    @property
+    def failed(self) -> List[DatasiteResult]:
+        """Datasites that raised or did not answer within their timeout"""
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def slow(self) -> List[DatasiteResult]:
+        """Datasites that answered, but took longer than ``slow_threshold``"""
+        return [r for r in self.results if r.ok and r.elapsed >= self.slow_threshold]
+
+    def summary(self) -> str:
+        """Human readable summary of failed and slow datasites"""
+        lines = []
+        for result in self.failed:
+            reason = f"timed out after {result.elapsed:.1f}s" if result.timed_out else result.error
+            lines.append(f"❌ {result.email}: {reason}")
+        for result in self.slow:
+            lines.append(f"🐢 {result.email}: slow response ({result.elapsed:.1f}s)")
+        for email in self.skipped:
+            lines.append(f"⏭️  {email}: skipped, failing recently")
+        return "\n".join(lines)
+
+
+def _observed(result: DatasiteResult) -> DatasiteResult:
+    DATASITE_QUERY_SECONDS.observe(result.elapsed, outcome=result.outcome)
+    DATASITE_LAST_QUERY_SECONDS.set(result.elapsed, datasite=result.email)
+    return result
+
+
+def iter_datasites(
+    emails: Iterable[str],
+    session_factory: Callable[..., Any],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Iterator[DatasiteResult]:
+    """Query datasites concurrently and yield each result as soon as it is known
+
+    Results come in completion order. Closing the generator early (e.g. breaking
+    out of the loop) cancels the datasites that have not been started yet.
+
+    Args:
+        emails: Datasite emails to query
+        session_factory: Callable returning a session for ``host=email``, e.g. ``init_session``
+        max_workers: Maximum number of datasites queried at the same time
+        timeout: Seconds a single datasite may take before it is reported as timed out
+    """
+    emails = sorted(set(emails))
+    if not emails:
+        return
+
+    started_at: Dict[str, float] = {}
+    lock = threading.Lock()
+
+    def query(email: str) -> List[Any]:
+        with lock:
+            started_at[email] = time.monotonic()
+        session = session_factory(host=email)
+        return list(session.datasets)
+
+    workers = max(1, min(max_workers, len(emails)))
+    # Worst case every datasite uses its full budget; nothing may run longer than that
+    deadline = time.monotonic() + timeout * math.ceil(len(emails) / workers)
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="syd-discovery")
+    try:
+        pending = {executor.submit(query, email): email for email in emails}
+        while pending:
+            done, _ = wait(pending, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+
+            for future in done:
+                email = pending.pop(future)
+                elapsed = now - started_at.get(email, now)
+                try:
+                    datasets = future.result()
+                    result = DatasiteResult(email, datasets, elapsed)
+                except Exception as e:
+                    result = DatasiteResult(email, elapsed=elapsed, error=str(e) or repr(e))
+                yield _observed(result)
+
+            with lock:
+                overdue = [
+                    (future, email)
+                    for future, email in pending.items()
+                    if email in started_at and now - started_at[email] >= timeout
+                ]
+            if now >= deadline:
+                overdue = list(pending.items())
+
+            for future, email in overdue:
+                # Running threads cannot be interrupted; abandon their result instead
+                future.cancel()
+                pending.pop(future)
+                elapsed = now - started_at.get(email, now)
+                yield _observed(DatasiteResult(email, elapsed=elapsed, timed_out=True))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def discover_datasites(
+    emails: Iterable[str],
+    session_factory: Callable[..., Any],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float = DEFAULT_TIMEOUT,
+    slow_threshold: float = DEFAULT_SLOW_THRESHOLD,
+    on_result: Optional[Callable[[DatasiteResult], Any]] = None,
+) -> DiscoveryReport:
+    """Query every datasite for its datasets using a bounded thread pool
+
+    Args:
+        emails: Datasite emails to query
+        session_factory: Callable returning a session for ``host=email``, e.g. ``init_session``
+        max_workers: Maximum number of datasites queried at the same time
+        timeout: Seconds a single datasite may take before it is reported as timed out
+        slow_threshold: Seconds after which a successful datasite is reported as slow
+        on_result: Called with each datasite's result as soon as it is known, in
+            completion order, from the calling thread
+
+    Returns:
+        DiscoveryReport: Results sorted by email, so dataset order is stable between runs
+    """
+    emails = sorted(set(emails))
+    report = DiscoveryReport(slow_threshold=slow_threshold)
+    start = time.monotonic()
+
+    results: Dict[str, DatasiteResult] = {}
+    for result in iter_datasites(emails, session_factory, max_workers, timeout):
+        results[result.email] = result
+        if on_result is not None:
+            on_result(result)
+
+    report.results = [results[email] for email in emails]
+    report.elapsed = time.monotonic() - start
+    DISCOVERY_SECONDS.observe(report.elapsed)
+    return report
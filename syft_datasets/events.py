@@ -0,0 +1,93 @@
+"""Change events emitted as a dataset catalog is loaded and updated"""
+
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+ADD = "add"
+REMOVE = "remove"
+GENERATION = "generation"
+
+
+@dataclass(frozen=True)
+class CatalogEvent:
+    """A change to the catalog
+
+    ``add`` and ``remove`` events list dataset names of one datasite and are
+    idempotent, so replaying an event that is already reflected in a copy of
+    the catalog leaves it unchanged. A ``generation`` event follows each
+    completed update, once the new catalog is visible.
+    """
+
+    kind: str
+    email: Optional[str] = None
+    names: Tuple[str, ...] = ()
+    generation: Optional[int] = None
+    total_count: Optional[int] = None
+
+
+def datasite_events(email: str, old: Sequence[str], new: Sequence[str]) -> List[CatalogEvent]:
+    """``add``/``remove`` events turning datasite ``email``'s ``old`` names into ``new``"""
+    old_names, new_names = set(old), set(new)
+    events = []
+    added = tuple(name for name in new if name not in old_names)
+    if added:
+        events.append(CatalogEvent(ADD, email, added))
+    removed = tuple(name for name in old if name not in new_names)
+    if removed:
+        events.append(CatalogEvent(REMOVE, email, removed))
+    return events
+
+
+def group_by_datasite(pairs: Iterable[Tuple[str, str]]) -> Dict[str, List[str]]:
+    """Dataset names per datasite from ``(email, name)`` pairs"""
+    datasites = defaultdict(list)
+    for email, name in pairs:
+        datasites[email].append(name)
+    return datasites
+
+
+def catalog_events(old: Dict[str, List[str]], new: Dict[str, List[str]]) -> List[CatalogEvent]:
+    """Events turning one catalog (names per datasite) into another"""
+    events = []
+    for email in sorted(set(old) | set(new)):
+        events.extend(datasite_events(email, old.get(email, ()), new.get(email, ())))
+    return events
+
+
+class EventHub:
+    """Thread-safe list of subscribers to catalog events
+
+    Callbacks run synchronously in the thread that emits the event (the loading
+    or watcher thread), so they should hand events off quickly.
+    """
+
+    def __init__(self):
+        self._subscribers: List[Callable[[CatalogEvent], object]] = []
+        self._lock = threading.Lock()
+
+    def __bool__(self):
+        return bool(self._subscribers)
+
+    def subscribe(self, callback: Callable[[CatalogEvent], object]) -> Callable[[], None]:
+        """Call ``callback(event)`` for every event; returns a function that unsubscribes"""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def emit(self, events: Iterable[CatalogEvent]):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for event in events:
+            for callback in subscribers:
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"⚠️  Catalog event subscriber failed: {e}")
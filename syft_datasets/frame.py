@@ -0,0 +1,136 @@
+"""Vectorized catalog queries on top of pandas/NumPy"""
+
+import re
+import warnings
+from array import array
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .store import CatalogStore
+from .tagging import catalog_tags
+
+
+def email_domain(email: str) -> str:
+    return email.split("@", 1)[1] if "@" in email else email
+
+
+def _as_list(value: Union[str, Iterable[str]]):
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _codes(store: CatalogStore) -> np.ndarray:
+    return np.frombuffer(store.email_codes, dtype=np.uint32) if len(store) else np.empty(0, int)
+
+
+def _positions(store: CatalogStore, rows) -> Optional[np.ndarray]:
+    """Row numbers as an index array, or None for "every row of the store, in order\""""
+    if isinstance(rows, range) and rows == range(len(store)):
+        return None
+    if isinstance(rows, range):
+        return np.arange(rows.start, rows.stop, rows.step)
+    return np.frombuffer(rows, dtype=np.int64) if len(rows) else np.empty(0, np.int64)
+
+
+def email_table(store: CatalogStore) -> pd.DataFrame:
+    """Per-datasite columns (domain), one row per distinct email, cached on the store"""
+    table = store.derived.get("email_table")
+    if table is None:
+        emails = pd.Series(store.emails, dtype=object)
+        table = pd.DataFrame({"email": emails, "domain": emails.map(email_domain).str.lower()})
+        store.derived["email_table"] = table
+    return table
+
+
+def store_frame(store: CatalogStore) -> pd.DataFrame:
+    """DataFrame over every row of ``store``, indexed by row number and cached on the store"""
+    frame = store.derived.get("frame")
+    if frame is None:
+        table = email_table(store)
+        codes = _codes(store)
+        email = pd.Categorical.from_codes(codes, categories=pd.Index(store.emails, dtype=object))
+        names = pd.Series(store.names, dtype=object)
+        emails = pd.Series(email).astype(object)
+        frame = pd.DataFrame(
+            {
+                "email": email,
+                "name": names,
+                "domain": table["domain"].to_numpy()[codes],
+                "syft_url": "syft://" + emails + "/private/datasets/" + names,
+                "tags": pd.Series(catalog_tags(store).rows, dtype=object).map(list),
+            }
+        )
+        store.derived["frame"] = frame
+    return frame
+
+
+def _lower_names(store: CatalogStore) -> pd.Series:
+    names = store.derived.get("lower_names")
+    if names is None:
+        names = store.derived["lower_names"] = store_frame(store)["name"].str.lower()
+    return names
+
+
+def collection_frame(store: CatalogStore, rows) -> pd.DataFrame:
+    """DataFrame of the given rows of ``store``, indexed by position in the collection"""
+    frame = store_frame(store)
+    positions = _positions(store, rows)
+    if positions is not None:
+        frame = frame.take(positions)
+    return frame.reset_index(drop=True)
+
+
+def query_rows(
+    store: CatalogStore,
+    rows,
+    email_regex: Optional[str] = None,
+    name_contains: Optional[str] = None,
+    domain: Union[str, Iterable[str], None] = None,
+    tags: Union[str, Iterable[str], None] = None,
+) -> np.ndarray:
+    """Store row numbers among ``rows`` matching every given filter
+
+    Email-based filters (regex, domain) are evaluated once per distinct datasite
+    and broadcast to rows through the email codes; tags are looked up in the
+    catalog's tag index and name filters are a single vectorized string
+    operation. All masks are combined in one pass.
+    """
+    positions = _positions(store, rows)
+    codes = _codes(store) if positions is None else _codes(store)[positions]
+    mask = np.ones(len(codes), dtype=bool)
+
+    table = email_table(store)
+    email_mask = np.ones(len(table), dtype=bool)
+    if email_regex is not None:
+        with warnings.catch_warnings():
+            # Groups in the pattern are fine: only whether it matches is used
+            warnings.filterwarnings(
+                "ignore", "This pattern is interpreted as a regular expression", UserWarning
+            )
+            matches = table["email"].str.contains(email_regex, flags=re.IGNORECASE, regex=True)
+        email_mask &= matches.to_numpy(dtype=bool)
+    if domain is not None:
+        email_mask &= table["domain"].isin([d.lower() for d in _as_list(domain)]).to_numpy()
+    if not email_mask.all():
+        mask &= email_mask[codes]
+    if tags is not None:
+        tagged = np.zeros(len(store), dtype=bool)
+        tagged[np.asarray(catalog_tags(store).rows_with(_as_list(tags)), dtype=np.int64)] = True
+        mask &= tagged if positions is None else tagged[positions]
+
+    if name_contains is not None:
+        names = _lower_names(store)
+        if positions is not None:
+            names = names.take(positions)
+        mask &= names.str.contains(name_contains.lower(), regex=False).to_numpy(dtype=bool)
+
+    selected = np.flatnonzero(mask)
+    return selected if positions is None else positions[selected]
+
+
+def to_row_array(rows: np.ndarray) -> array:
+    """Row numbers from a NumPy array, in the compact form used by collection views"""
+    result = array("q")
+    result.frombytes(np.ascontiguousarray(rows, dtype=np.int64).tobytes())
+    return result
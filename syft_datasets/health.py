@@ -0,0 +1,159 @@
+"""Per-datasite health tracking with a circuit breaker for failing datasites"""
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from .discovery import DatasiteResult
+
+# Consecutive failures after which a datasite is skipped (its circuit opens)
+DEFAULT_FAILURE_THRESHOLD = 2
+# Time a datasite is skipped after its circuit opens; doubles with each failed retry
+DEFAULT_BASE_BACKOFF = 60.0
+DEFAULT_MAX_BACKOFF = 6 * 60 * 60
+
+OK = "ok"
+DEGRADED = "degraded"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class DatasiteHealth:
+    """What is known about the recent queries of one datasite"""
+
+    email: str
+    failures: int = 0
+    last_error: Optional[str] = None
+    timed_out: bool = False
+    signature: Optional[str] = None
+    failed_at: Optional[float] = None
+    retry_at: Optional[float] = None
+    succeeded_at: Optional[float] = None
+    elapsed: Optional[float] = None
+
+
+@dataclass
+class DatasiteStatus:
+    """Row of ``DatasetCollection.datasite_status()``"""
+
+    email: str
+    state: str
+    datasets: int
+    failures: int
+    last_error: Optional[str]
+    retry_in: Optional[float]
+    last_success: Optional[float]
+    elapsed: Optional[float]
+
+    def __str__(self):
+        icon = {OK: "✅", DEGRADED: "⚠️ ", OPEN: "⛔", HALF_OPEN: "🔁"}[self.state]
+        line = f"{icon} {self.email}: {self.state}, {self.datasets} datasets"
+        if self.failures:
+            line += f", {self.failures} consecutive failures ({self.last_error})"
+        if self.retry_in:
+            line += f", retry in {self.retry_in:.0f}s"
+        return line
+
+
+class HealthTracker:
+    """Circuit breaker over datasite queries, with exponential backoff
+
+    Every datasite starts closed and is queried normally. After
+    ``failure_threshold`` consecutive failures its circuit opens: the datasite is
+    skipped (a negative cache hit) until its backoff expires, then half-opens and
+    is probed once. A successful probe closes the circuit; a failed one reopens it
+    with twice the backoff, up to ``max_backoff``. A datasite whose signature
+    changes on disk is probed right away, since it may have been fixed.
+
+    With a ``CatalogCache``, health entries are persisted so that known-bad
+    datasites are also skipped by the next process.
+    """
+
+    def __init__(
+        self,
+        cache=None,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        base_backoff: float = DEFAULT_BASE_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+    ):
+        self.cache = cache
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._entries: Dict[str, DatasiteHealth] = {}
+        self._lock = threading.Lock()
+        if cache is not None:
+            for email, data in cache.get_health().items():
+                self._entries[email] = DatasiteHealth(**data)
+
+    def get(self, email: str) -> Optional[DatasiteHealth]:
+        return self._entries.get(email)
+
+    def state(self, email: str, now: Optional[float] = None) -> str:
+        entry = self._entries.get(email)
+        if entry is None or entry.failures == 0:
+            return OK
+        if entry.failures < self.failure_threshold:
+            return DEGRADED
+        now = time.time() if now is None else now
+        return OPEN if now < entry.retry_at else HALF_OPEN
+
+    def should_query(self, email: str, signature: Optional[str] = None) -> bool:
+        """False while the datasite's circuit is open and it has not changed on disk"""
+        if self.state(email) != OPEN:
+            return True
+        entry = self._entries[email]
+        return signature is not None and signature != entry.signature
+
+    def record(self, result: DatasiteResult, signature: Optional[str] = None):
+        """Update the datasite's health with the outcome of a query"""
+        now = time.time()
+        with self._lock:
+            previous = self._entries.get(result.email)
+            if result.ok:
+                entry = DatasiteHealth(result.email, succeeded_at=now, elapsed=result.elapsed)
+                changed = previous is not None and previous.failures > 0
+            else:
+                entry = previous or DatasiteHealth(result.email)
+                entry.failures += 1
+                entry.last_error = "timed out" if result.timed_out else result.error
+                entry.timed_out = result.timed_out
+                entry.signature = signature
+                entry.failed_at = now
+                entry.elapsed = result.elapsed
+                opened = max(0, entry.failures - self.failure_threshold)
+                entry.retry_at = now + min(self.max_backoff, self.base_backoff * 2**opened)
+                changed = True
+            self._entries[result.email] = entry
+
+        if self.cache is not None and changed:
+            try:
+                if entry.failures:
+                    self.cache.put_health(entry.email, asdict(entry))
+                else:
+                    self.cache.delete_health(entry.email)
+            except Exception as e:
+                print(f"⚠️  Could not persist the health of {entry.email}: {e}")
+
+    def report(self, datasets: Dict[str, int]) -> List[DatasiteStatus]:
+        """Status of every datasite in ``datasets`` (email -> dataset count) or with failures"""
+        now = time.time()
+        statuses = []
+        for email in sorted(set(datasets) | set(self._entries)):
+            entry = self._entries.get(email) or DatasiteHealth(email)
+            state = self.state(email, now)
+            statuses.append(
+                DatasiteStatus(
+                    email=email,
+                    state=state,
+                    datasets=datasets.get(email, 0),
+                    failures=entry.failures,
+                    last_error=entry.last_error,
+                    retry_in=max(0.0, entry.retry_at - now) if state == OPEN else None,
+                    last_success=entry.succeeded_at,
+                    elapsed=entry.elapsed,
+                )
+            )
+        return statuses
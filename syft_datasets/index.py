@@ -0,0 +1,289 @@
+"""In-memory search indexes over a list of datasets"""
+
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Length of the indexed substrings (trigrams)
+NGRAM_SIZE = 3
+
+# BM25 term frequency saturation and document length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Largest edit distance tolerated by fuzzy matching (for tokens of 8+ characters)
+MAX_EDIT_DISTANCE = 2
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _ngrams(text: str, n: int) -> Iterable[str]:
+    return (text[i : i + n] for i in range(len(text) - n + 1))
+
+
+def max_edits(token: str) -> int:
+    """Typos tolerated in ``token``: none up to 3 characters, 1 up to 7, then 2"""
+    if len(token) <= 3:
+        return 0
+    return 1 if len(token) <= 7 else MAX_EDIT_DISTANCE
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance of ``a`` and ``b``, or ``limit + 1`` if it exceeds ``limit``"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        current = [i]
+        for j, other in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != other))
+            )
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+def _deletes(token: str, distance: int) -> Set[str]:
+    """``token`` and every string obtained by deleting up to ``distance`` characters"""
+    variants = {token}
+    frontier = {token}
+    for _ in range(distance):
+        frontier = {v[:i] + v[i + 1 :] for v in frontier if len(v) > 1 for i in range(len(v))}
+        variants.update(frontier)
+    return variants
+
+
+class FieldIndex:
+    """Substring index over one field (e.g. the dataset names) of a list of rows
+
+    Values are lowercased and deduplicated once, and every n-gram of each distinct
+    value gets a posting list. Queries intersect the postings of their n-grams and
+    verify the survivors, so a lookup only touches values that share all n-grams
+    with the query. Queries shorter than an n-gram scan the distinct values.
+    """
+
+    def __init__(self, values: Sequence[str]):
+        self.size = len(values)
+        value_ids: Dict[str, int] = {}
+        self.values: List[str] = []
+        self.rows: List[List[int]] = []
+        for row, value in enumerate(values):
+            value = value.lower()
+            value_id = value_ids.get(value)
+            if value_id is None:
+                value_id = value_ids[value] = len(self.values)
+                self.values.append(value)
+                self.rows.append([])
+            self.rows[value_id].append(row)
+
+        postings: Dict[str, List[int]] = {}
+        for value_id, value in enumerate(self.values):
+            for gram in set(_ngrams(value, NGRAM_SIZE)):
+                posting = postings.get(gram)
+                if posting is None:
+                    postings[gram] = [value_id]
+                else:
+                    posting.append(value_id)
+        self.postings = postings
+
+    def matching_values(self, query: str) -> List[int]:
+        """Ids of the distinct values containing ``query`` (already lowercased)"""
+        if not query:
+            return list(range(len(self.values)))
+        if len(query) < NGRAM_SIZE:
+            # Too short to index; these match a large share of the values anyway
+            return [i for i, value in enumerate(self.values) if query in value]
+        if len(query) == NGRAM_SIZE:
+            return self.postings.get(query, [])
+
+        lists = []
+        for gram in set(_ngrams(query, NGRAM_SIZE)):
+            posting = self.postings.get(gram)
+            if posting is None:
+                return []
+            lists.append(posting)
+        lists.sort(key=len)
+
+        candidates = set(lists[0])
+        for posting in lists[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+        return [value_id for value_id in candidates if query in self.values[value_id]]
+
+    def match(self, query: str) -> List[int]:
+        """Rows whose value contains ``query`` (case insensitive), in row order"""
+        value_ids = self.matching_values(query.lower())
+        if len(value_ids) == len(self.values):
+            return list(range(self.size))
+        rows = [row for value_id in value_ids for row in self.rows[value_id]]
+        rows.sort()
+        return rows
+
+
+class RankedIndex:
+    """BM25 ranking over the tokens of each row, tolerant of typos
+
+    Every token gets a posting list of ``(row, term frequency)``. Query tokens
+    also match indexed tokens within ``max_edits`` of them, found through a
+    SymSpell-style index of the tokens' deletions (built on the first fuzzy
+    query), and scored lower the more edits they need. Only rows sharing a
+    token with the query are scored, and the best ``limit`` come from a heap.
+    """
+
+    def __init__(self, documents: Sequence[Sequence[str]]):
+        self.size = len(documents)
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        lengths = []
+        for row, tokens in enumerate(documents):
+            lengths.append(len(tokens))
+            for token, count in Counter(tokens).items():
+                posting = postings.get(token)
+                if posting is None:
+                    postings[token] = [(row, count)]
+                else:
+                    posting.append((row, count))
+        self.postings = postings
+        self.lengths = lengths
+        self.average_length = (sum(lengths) / len(lengths)) if lengths else 1.0
+        self._deletions: Optional[Dict[str, List[str]]] = None
+
+    def _deletion_index(self) -> Dict[str, List[str]]:
+        deletions = self._deletions
+        if deletions is None:
+            deletions = defaultdict(list)
+            for token in self.postings:
+                for variant in _deletes(token, MAX_EDIT_DISTANCE):
+                    deletions[variant].append(token)
+            self._deletions = deletions = dict(deletions)
+        return deletions
+
+    def expand(self, token: str, fuzzy: bool = True) -> Dict[str, int]:
+        """Indexed tokens matching ``token``, with the number of edits each needs"""
+        matches = {token: 0} if token in self.postings else {}
+        limit = max_edits(token) if fuzzy else 0
+        if limit:
+            deletions = self._deletion_index()
+            for variant in _deletes(token, limit):
+                for candidate in deletions.get(variant, ()):
+                    if candidate not in matches:
+                        distance = edit_distance(token, candidate, limit)
+                        if distance <= limit:
+                            matches[candidate] = distance
+        return matches
+
+    def _term_scores(self, term: str, weight: float) -> Iterable[Tuple[int, float]]:
+        posting = self.postings[term]
+        idf = math.log(1 + (self.size - len(posting) + 0.5) / (len(posting) + 0.5))
+        lengths, average = self.lengths, self.average_length
+        for row, count in posting:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[row] / average)
+            yield row, weight * idf * count * (BM25_K1 + 1) / (count + norm)
+
+    def rank(
+        self, query: str, limit: Optional[int] = None, fuzzy: bool = True
+    ) -> List[Tuple[int, float]]:
+        """``(row, score)`` of the best matches of ``query``, best first
+
+        A query token matched through ``d`` edits counts ``1 / (1 + d)`` as much
+        as an exact match; each query token counts once per row, through its
+        best matching term.
+        """
+        scores: Dict[int, float] = defaultdict(float)
+        for token in set(tokenize(query)):
+            best: Dict[int, float] = {}
+            for term, distance in self.expand(token, fuzzy).items():
+                for row, score in self._term_scores(term, 1 / (1 + distance)):
+                    if score > best.get(row, 0.0):
+                        best[row] = score
+            for row, score in best.items():
+                scores[row] += score
+
+        # Ties keep row order
+        key = lambda item: (item[1], -item[0])  # noqa: E731
+        if limit is None:
+            return sorted(scores.items(), key=key, reverse=True)
+        return heapq.nlargest(limit, scores.items(), key=key)
+
+
+class SearchIndex:
+    """Name/email indexes backing ``DatasetCollection.search`` and ``filter_by_email``
+
+    Built once per collection from its dataset names and emails (one per row);
+    all lookups return row positions within that collection. ``tags`` returns the
+    tags of each row; it is only called when the ranked index is built.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        emails: Sequence[str],
+        tags: Optional[Callable[[], Sequence[Sequence[str]]]] = None,
+    ):
+        self.names = FieldIndex(names)
+        self.emails = FieldIndex(emails)
+        self._fields = (names, emails, tags)
+        self._ranked: Optional[RankedIndex] = None
+
+        tokens = defaultdict(set)
+        for field in (self.names, self.emails):
+            for value, rows in zip(field.values, field.rows):
+                for token in tokenize(value):
+                    tokens[token].update(rows)
+        self.tokens: Dict[str, List[int]] = {t: sorted(rows) for t, rows in tokens.items()}
+
+    def search(self, keyword: str) -> List[int]:
+        """Rows whose name or email contains ``keyword``"""
+        rows = set(self.names.match(keyword))
+        rows.update(self.emails.match(keyword))
+        return sorted(rows)
+
+    def filter_by_email(self, pattern: str) -> List[int]:
+        """Rows whose email contains ``pattern``"""
+        return self.emails.match(pattern)
+
+    def search_tokens(self, keyword: str) -> List[int]:
+        """Rows containing every word of ``keyword`` as a whole token"""
+        query = tokenize(keyword)
+        if not query:
+            return []
+        lists = sorted((self.tokens.get(token, []) for token in set(query)), key=len)
+        rows = set(lists[0])
+        for posting in lists[1:]:
+            rows.intersection_update(posting)
+        return sorted(rows)
+
+    def ranked(self) -> RankedIndex:
+        """BM25 index over the tokens of each row's name, email and tags, built on first use"""
+        ranked = self._ranked
+        if ranked is None:
+            names, emails, row_tags = self._fields
+            tags = row_tags() if row_tags is not None else None
+            email_tokens: Dict[str, List[str]] = {}
+            documents = []
+            for row, (name, email) in enumerate(zip(names, emails)):
+                tokens = email_tokens.get(email)
+                if tokens is None:
+                    tokens = email_tokens[email] = tokenize(email)
+                document = tokenize(name) + tokens
+                if tags is not None:
+                    # Tags repeating a token of the name or email (e.g. the domain) add nothing
+                    seen = set(document)
+                    document += [t for tag in tags[row] for t in tokenize(tag) if t not in seen]
+                documents.append(document)
+            ranked = self._ranked = RankedIndex(documents)
+        return ranked
+
+    def rank(
+        self, keyword: str, limit: Optional[int] = None, fuzzy: bool = True
+    ) -> List[Tuple[int, float]]:
+        """``(row, score)`` of the rows best matching ``keyword``, best first"""
+        return self.ranked().rank(keyword, limit, fuzzy)
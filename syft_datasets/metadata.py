@@ -0,0 +1,247 @@
+"""Dataset metadata (size, file count, timestamps, content types) from the filesystem
+
+syft_rds keeps a dataset's mock data under ``<datasite>/public/datasets/<name>``
+and its private data under ``<datasite>/private/datasets/<name>``. Both trees are
+walked with ``os.scandir``; each directory's listing is summarized and cached
+by its mtime, so repeated walks only stat the directories of unchanged trees
+instead of listing and stat-ing every file again.
+"""
+
+import mimetypes
+import os
+import stat
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+DEFAULT_MAX_WORKERS = 8
+
+PUBLIC_DATASETS = Path("public") / "datasets"
+PRIVATE_DATASETS = Path("private") / "datasets"
+
+_DEFAULT_CONTENT_TYPE = "application/octet-stream"
+# Common dataset formats that ``mimetypes`` does not know about
+_DATA_CONTENT_TYPES = {
+    ".parquet": "application/vnd.apache.parquet",
+    ".arrow": "application/vnd.apache.arrow.file",
+    ".feather": "application/vnd.apache.arrow.file",
+    ".jsonl": "application/jsonl",
+    ".ndjson": "application/x-ndjson",
+    ".npy": "application/x-npy",
+}
+
+
+@dataclass(frozen=True)
+class PathStats:
+    """Totals over the files of one directory tree (or a single file)"""
+
+    path: str
+    size: int
+    files: int
+    # Creation times are not available on every platform; the oldest mtime stands in
+    created_at: Optional[float]
+    modified_at: float
+    # Content types of the files, largest share of bytes first
+    content_types: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class DatasetMetadata:
+    """What the filesystem says about a dataset's mock and private data"""
+
+    email: str
+    name: str
+    mock: Optional[PathStats] = None
+    private: Optional[PathStats] = None
+
+    @property
+    def _parts(self) -> List[PathStats]:
+        return [part for part in (self.mock, self.private) if part is not None]
+
+    @property
+    def available(self) -> bool:
+        """Whether any of the dataset's data is on this machine"""
+        return bool(self._parts)
+
+    @property
+    def size(self) -> int:
+        return sum(part.size for part in self._parts)
+
+    @property
+    def files(self) -> int:
+        return sum(part.files for part in self._parts)
+
+    @property
+    def created_at(self) -> Optional[float]:
+        times = [part.created_at for part in self._parts if part.created_at is not None]
+        return min(times) if times else None
+
+    @property
+    def modified_at(self) -> Optional[float]:
+        return max((part.modified_at for part in self._parts), default=None)
+
+    @property
+    def content_type(self) -> Optional[str]:
+        """Main content type of the data (of the mock data, if both are present)"""
+        for part in self._parts:
+            if part.content_types:
+                return part.content_types[0]
+        return None
+
+
+@dataclass(frozen=True)
+class _DirStats:
+    """Summary of the files directly inside one directory, valid while its mtime holds"""
+
+    mtime_ns: int
+    size: int
+    files: int
+    oldest: Optional[float]
+    newest: float
+    types: Dict[str, int]
+    subdirs: Tuple[str, ...]
+
+
+def _content_type(filename: str) -> str:
+    content_type = _DATA_CONTENT_TYPES.get(os.path.splitext(filename)[1].lower())
+    return content_type or mimetypes.guess_type(filename, strict=False)[0] or _DEFAULT_CONTENT_TYPE
+
+
+def mock_dir(datasites_dir: Union[str, Path], email: str, name: str) -> Path:
+    """Where the mock data of dataset ``name`` of datasite ``email`` is synced to"""
+    return Path(datasites_dir) / email / PUBLIC_DATASETS / name
+
+
+def format_size(size: int) -> str:
+    """Human readable size, e.g. ``"1.5 MB"``"""
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if value < 1024 or unit == "TB":
+            return f"{int(value)} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{size} B"
+
+
+class MetadataCollector:
+    """Collects ``DatasetMetadata`` for the datasets under ``datasites_dir``
+
+    Directory summaries are cached by directory mtime. A file rewritten in place
+    does not change its directory's mtime, so its new size is picked up once an
+    entry is added, removed or renamed in that directory.
+    """
+
+    def __init__(self, datasites_dir: Union[str, Path], max_workers: int = DEFAULT_MAX_WORKERS):
+        self.datasites_dir = Path(datasites_dir)
+        self.max_workers = max_workers
+        self._dirs: Dict[str, _DirStats] = {}
+        self._lock = threading.Lock()
+
+    def _scan_dir(self, path: str, st: os.stat_result) -> _DirStats:
+        cached = self._dirs.get(path)
+        if cached is not None and cached.mtime_ns == st.st_mtime_ns:
+            return cached
+
+        size = files = 0
+        oldest, newest = None, st.st_mtime
+        types: Counter = Counter()
+        subdirs = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    file_stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                size += file_stat.st_size
+                files += 1
+                mtime = file_stat.st_mtime
+                oldest = mtime if oldest is None else min(oldest, mtime)
+                newest = max(newest, mtime)
+                types[_content_type(entry.name)] += file_stat.st_size
+
+        summary = _DirStats(
+            st.st_mtime_ns, size, files, oldest, newest, dict(types), tuple(subdirs)
+        )
+        with self._lock:
+            self._dirs[path] = summary
+        return summary
+
+    def path_stats(self, path: Union[str, Path]) -> Optional[PathStats]:
+        """Totals over the tree at ``path``, or None if it does not exist"""
+        path = str(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if stat.S_ISREG(st.st_mode):
+            content_type = _content_type(os.path.basename(path))
+            return PathStats(path, st.st_size, 1, st.st_mtime, st.st_mtime, (content_type,))
+        if not stat.S_ISDIR(st.st_mode):
+            return None
+
+        size = files = 0
+        oldest, newest = None, st.st_mtime
+        types: Counter = Counter()
+        pending = [(path, st)]
+        while pending:
+            directory, dir_stat = pending.pop()
+            try:
+                summary = self._scan_dir(directory, dir_stat)
+            except OSError:
+                continue
+            size += summary.size
+            files += summary.files
+            if summary.oldest is not None:
+                oldest = summary.oldest if oldest is None else min(oldest, summary.oldest)
+            newest = max(newest, summary.newest)
+            types.update(summary.types)
+            for subdir in summary.subdirs:
+                try:
+                    pending.append((subdir, os.stat(subdir)))
+                except OSError:
+                    continue
+
+        content_types = tuple(content_type for content_type, _ in types.most_common())
+        return PathStats(path, size, files, oldest, newest, content_types)
+
+    def get(self, email: str, name: str) -> DatasetMetadata:
+        """Metadata of dataset ``name`` of datasite ``email``"""
+        datasite = self.datasites_dir / email
+        return DatasetMetadata(
+            email,
+            name,
+            mock=self.path_stats(mock_dir(self.datasites_dir, email, name)),
+            private=self.path_stats(datasite / PRIVATE_DATASETS / name),
+        )
+
+    def collect(
+        self, datasets: Iterable[Tuple[str, str]], max_workers: Optional[int] = None
+    ) -> List[DatasetMetadata]:
+        """Metadata of each ``(email, name)``, walked concurrently in a thread pool"""
+        datasets = list(datasets)
+        workers = min(max_workers or self.max_workers, len(datasets))
+        if workers <= 1:
+            return [self.get(email, name) for email, name in datasets]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="syd-metadata") as pool:
+            return list(pool.map(lambda dataset: self.get(*dataset), datasets))
+
+
+_collectors: Dict[str, MetadataCollector] = {}
+_collectors_lock = threading.Lock()
+
+
+def metadata_collector(datasites_dir: Union[str, Path]) -> MetadataCollector:
+    """Process-wide collector (and directory cache) for ``datasites_dir``"""
+    key = str(datasites_dir)
+    with _collectors_lock:
+        collector = _collectors.get(key)
+        if collector is None:
+            collector = _collectors[key] = MetadataCollector(datasites_dir)
+        return collector
@@ -0,0 +1,232 @@
+"""In-process metrics for discovery, the catalog cache and the catalog itself
+
+Counters, gauges and histograms are kept in a process-wide registry and can be
+read as a dict (``syd.stats()``) or in the Prometheus text format (the backend's
+``/metrics``). Recording is a dict update under a lock; with metrics disabled
+(``disable()``, or ``SYFT_DATASETS_METRICS=0`` in the environment) it returns
+before doing any work.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Upper bounds of latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Upper bounds of payload size histogram buckets, in bytes
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+_enabled = os.environ.get("SYFT_DATASETS_METRICS", "1") != "0"
+_registry: Dict[str, "Metric"] = {}
+_registry_lock = threading.Lock()
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording; metrics keep the values recorded so far"""
+    global _enabled
+    _enabled = False
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+class Metric:
+    """Named metric with a value per combination of label values"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, description: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        with _registry_lock:
+            _registry[name] = self
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels[label]) for label in self.labels)
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+    def _label_text(self, key: Tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{label}="{_escape(value)}"' for label, value in zip(self.labels, key)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def _snapshot_value(self, value):
+        return value
+
+    def snapshot(self):
+        """The value, or a dict of values keyed by ``"label=value,..."`` for labelled metrics"""
+        with self._lock:
+            values = dict(self._values)
+        if not self.labels:
+            return self._snapshot_value(values[()]) if () in values else None
+        snapshot = {}
+        for key, value in sorted(values.items()):
+            name = ",".join(f"{label}={v}" for label, v in zip(self.labels, key))
+            snapshot[name] = self._snapshot_value(value)
+        return snapshot
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            lines.append(f"{self.name}{self._label_text(key)} {_number(value)}")
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        if not _enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        if not _enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(Metric):
+    """Distribution of observed values over fixed buckets (plus their count and sum)"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, description, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels):
+        if not _enabled:
+            return
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                # Per-bucket counts (the last one is +Inf), then sum
+                series = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the ``with`` block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _snapshot_value(self, series):
+        count = sum(series[:-1])
+        return {"count": count, "sum": series[-1], "mean": series[-1] / count if count else None}
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            values = sorted((key, list(series)) for key, series in self._values.items())
+        for key, series in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                labels = self._label_text(key, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{self._label_text(key)} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{self._label_text(key)} {cumulative}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def stats() -> Dict[str, Any]:
+    """Current value of every metric, by name"""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    return {metric.name: metric.snapshot() for metric in metrics}
+
+
+def render_prometheus() -> str:
+    """Every metric in the Prometheus text exposition format"""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+
+def reset():
+    """Clear the values of every metric"""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    for metric in metrics:
+        metric.reset()
+
+
+DATASITE_QUERY_SECONDS = Histogram(
+    "syd_datasite_query_seconds",
+    "Time to query one datasite for its datasets, by outcome (ok, error, timeout)",
+    labels=["outcome"],
+)
+DATASITE_LAST_QUERY_SECONDS = Gauge(
+    "syd_datasite_last_query_seconds",
+    "Duration of the latest query of each datasite",
+    labels=["datasite"],
+)
+DISCOVERY_SECONDS = Histogram("syd_discovery_seconds", "Duration of discovery runs")
+DATASITES_SKIPPED = Counter(
+    "syd_datasites_skipped_total", "Datasite queries skipped because the datasite failed recently"
+)
+CACHE_LOOKUPS = Counter(
+    "syd_catalog_cache_lookups_total",
+    "Catalog cache lookups by result (hit, miss, stale)",
+    labels=["result"],
+)
+CATALOG_DATASETS = Gauge("syd_catalog_datasets", "Datasets in the catalog")
+CATALOG_DATASITES = Gauge("syd_catalog_datasites", "Datasites publishing datasets in the catalog")
+CATALOG_GENERATION = Gauge("syd_catalog_generation", "Generation of the catalog")
+
+
+def record_catalog(collection):
+    """Set the catalog gauges from ``collection``"""
+    if not _enabled:
+        return
+    CATALOG_DATASETS.set(len(collection))
+    CATALOG_DATASITES.set(len(collection.facets()["emails"]))
+    CATALOG_GENERATION.set(collection.generation)
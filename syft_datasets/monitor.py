@@ -0,0 +1,139 @@
+"""Cached liveness checks of the local SyftBox app"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+# Seconds a probe result is served before the app is checked again
+DEFAULT_TTL = 30.0
+DEFAULT_TIMEOUT = 2.0
+
+
+@dataclass(frozen=True)
+class AppStatus:
+    """Outcome of one probe of the SyftBox app"""
+
+    url: str
+    running: bool
+    checked_at: float
+    latency: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.checked_at
+
+    def __str__(self):
+        if self.running:
+            return f"✅ SyftBox app running at {self.url}"
+        return f"❌ SyftBox app not running at {self.url}"
+
+
+class AppMonitor:
+    """Probes the SyftBox app's HTTP endpoint and caches the result for ``ttl`` seconds
+
+    Probes share one pooled ``requests.Session``. ``status(wait=False)`` never
+    blocks: it returns the last result (None before the first probe completes)
+    and, once that is older than ``ttl``, refreshes it in a background thread.
+    Concurrent refreshes are coalesced into a single probe.
+    """
+
+    def __init__(self, url: str, ttl: float = DEFAULT_TTL, timeout: float = DEFAULT_TIMEOUT):
+        self.url = str(url)
+        self.ttl = ttl
+        self.timeout = timeout
+        self._status: Optional[AppStatus] = None
+        self._session = None
+        self._lock = threading.Lock()
+        self._probing: Optional[threading.Event] = None
+
+    @property
+    def last(self) -> Optional[AppStatus]:
+        """Result of the latest probe, however old"""
+        return self._status
+
+    @property
+    def session(self):
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            self._session = session
+        return self._session
+
+    def _request(self) -> bool:
+        response = self.session.get(self.url, timeout=self.timeout)
+        # The app is a Go server; its index page reports the Go version
+        return response.status_code == 200 and "go1." in response.text
+
+    def probe(self) -> AppStatus:
+        """Check the app now, caching and returning the result"""
+        with self._lock:
+            probing = self._probing
+            if probing is None:
+                probing = self._probing = threading.Event()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            probing.wait()
+            return self._status
+
+        start = time.perf_counter()
+        try:
+            running, error = self._request(), None
+        except Exception as e:
+            running, error = False, str(e)
+        status = AppStatus(
+            self.url, running, time.time(), latency=time.perf_counter() - start, error=error
+        )
+        with self._lock:
+            self._status, self._probing = status, None
+        probing.set()
+        return status
+
+    def probe_in_background(self, on_result: Optional[Callable[[AppStatus], None]] = None):
+        """Start a probe in a daemon thread, calling ``on_result`` with its outcome"""
+
+        def run():
+            status = self.probe()
+            if on_result is not None:
+                on_result(status)
+
+        thread = threading.Thread(target=run, name="syd-app-monitor", daemon=True)
+        thread.start()
+        return thread
+
+    def status(self, wait: bool = True) -> Optional[AppStatus]:
+        """Cached app status, refreshed once it is older than ``ttl``
+
+        Args:
+            wait: Probe in this thread if the status is stale; otherwise return the
+                stale status (or None) right away and refresh it in the background
+        """
+        status = self._status
+        if status is not None and status.age < self.ttl:
+            return status
+        if wait:
+            return self.probe()
+        if self._probing is None:
+            self.probe_in_background()
+        return status
+
+
+_monitors: Dict[str, AppMonitor] = {}
+_monitors_lock = threading.Lock()
+
+
+def app_monitor(url) -> AppMonitor:
+    """Process-wide monitor of the SyftBox app at ``url``"""
+    url = str(url)
+    with _monitors_lock:
+        monitor = _monitors.get(url)
+        if monitor is None:
+            monitor = _monitors[url] = AppMonitor(url)
+        return monitor
@@ -0,0 +1,234 @@
+"""Jupyter rendering of dataset collections
+
+The table is virtualized: the rows are embedded once as a compact JSON payload
+(names, plus one email code per row into a list of distinct emails) and a small
+script renders only the rows scrolled into view. Searching, selection and code
+generation run client-side over the payload.
+"""
+
+import json
+import uuid
+from html import escape
+from typing import Optional
+
+# Rows embedded in a notebook output; larger collections are truncated
+HTML_MAX_ROWS = 10_000
+
+_CSS = """
+<style>
+.nsai-container { border: 1px solid #dee2e6; border-radius: 6px; margin: 10px 0;
+  font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }
+.nsai-header { background-color: #f8f9fa; padding: 10px 15px; border-bottom: 1px solid #dee2e6; margin: 0; }
+.nsai-controls { padding: 10px 15px; background-color: #fff; border-bottom: 1px solid #dee2e6;
+  display: flex; gap: 10px; align-items: center; }
+.nsai-search-box { flex: 1; padding: 6px 10px; border: 1px solid #ced4da; border-radius: 4px; font-size: 12px; }
+.nsai-btn { padding: 6px 12px; background-color: #007bff; color: white; border: none; border-radius: 4px;
+  cursor: pointer; font-size: 11px; text-decoration: none; }
+.nsai-btn:hover { background-color: #0056b3; }
+.nsai-btn-secondary { background-color: #6c757d; }
+.nsai-btn-secondary:hover { background-color: #545b62; }
+.nsai-table-container { height: 320px; overflow-y: auto; }
+.nsai-datasets-table { border-collapse: collapse; width: 100%; font-size: 11px; margin: 0; table-layout: fixed; }
+.nsai-datasets-table th { background-color: #f8f9fa; border-bottom: 2px solid #dee2e6; padding: 6px 8px;
+  text-align: left; font-weight: 600; color: #495057; position: sticky; top: 0; z-index: 10; }
+.nsai-datasets-table td { border-bottom: 1px solid #f1f3f4; padding: 0 8px; height: 23px;
+  overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }
+.nsai-datasets-table tr:hover { background-color: #f8f9fa; }
+.nsai-datasets-table tr.nsai-selected { background-color: #e3f2fd; }
+.nsai-email { color: #0066cc; font-weight: 500; font-size: 10px; }
+.nsai-dataset-name { color: #28a745; font-weight: 500; }
+.nsai-syft-url { font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace; font-size: 9px; color: #6c757d; }
+.nsai-index { text-align: center; font-weight: 600; color: #495057; background-color: #f8f9fa; }
+.nsai-checkbox { text-align: center; }
+.nsai-output { padding: 10px 15px; background-color: #f8f9fa; border-top: 1px solid #dee2e6;
+  font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace; font-size: 10px; color: #495057;
+  white-space: pre-wrap; overflow-x: auto; }
+.nsai-status { padding: 5px 15px; background-color: #e9ecef; font-size: 10px; color: #6c757d; }
+</style>
+"""
+
+_SCRIPT = """
+function sydRenderTable(id) {
+  const root = document.getElementById(id);
+  if (!root || root.dataset.rendered) return;
+  root.dataset.rendered = '1';
+  const data = JSON.parse(document.getElementById(id + '-data').textContent);
+  const emails = data.emails, codes = data.codes, names = data.names;
+  const ROW = 24, OVERSCAN = 10;
+  const scroller = root.querySelector('.nsai-table-container');
+  const tbody = root.querySelector('tbody');
+  const status = root.querySelector('.nsai-status');
+  const output = root.querySelector('.nsai-output');
+  const selected = new Set();
+  let visible = names.map((_, i) => i);
+  let lowerNames = null;
+  const lowerEmails = emails.map(e => e.toLowerCase());
+  const entities = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+  const esc = s => s.replace(/[&<>"']/g, c => entities[c]);
+
+  function render() {
+    const height = Math.max(scroller.clientHeight, 320);
+    const first = Math.max(0, Math.floor(scroller.scrollTop / ROW) - OVERSCAN);
+    const last = Math.min(visible.length, first + Math.ceil(height / ROW) + 2 * OVERSCAN);
+    const html = [`<tr style="height:${first * ROW}px"></tr>`];
+    for (let k = first; k < last; k++) {
+      const i = visible[k], checked = selected.has(i);
+      const email = esc(emails[codes[i]]), name = esc(names[i]);
+      const url = `syft://${email}/private/datasets/${name}`;
+      html.push(`<tr data-index="${i}"${checked ? ' class="nsai-selected"' : ''}>` +
+        `<td class="nsai-checkbox"><input type="checkbox"${checked ? ' checked' : ''}></td>` +
+        `<td class="nsai-index">${i}</td><td class="nsai-email">${email}</td>` +
+        `<td class="nsai-dataset-name" title="${name}">${name}</td>` +
+        `<td class="nsai-syft-url" title="${url}">${url}</td></tr>`);
+    }
+    html.push(`<tr style="height:${(visible.length - last) * ROW}px"></tr>`);
+    tbody.innerHTML = html.join('');
+  }
+
+  function update() {
+    status.textContent = `${selected.size} dataset(s) selected • ${visible.length} visible` + data.note;
+  }
+
+  function search(term) {
+    term = term.toLowerCase();
+    if (!term) {
+      visible = names.map((_, i) => i);
+    } else {
+      lowerNames = lowerNames || names.map(n => n.toLowerCase());
+      const emailMatches = lowerEmails.map(e => e.includes(term));
+      visible = [];
+      for (let i = 0; i < names.length; i++) {
+        if (emailMatches[codes[i]] || lowerNames[i].includes(term)) visible.push(i);
+      }
+    }
+    scroller.scrollTop = 0;
+    render();
+    update();
+  }
+
+  function generateCode(button) {
+    const indices = Array.from(selected).sort((a, b) => a - b);
+    if (indices.length === 0) {
+      output.style.display = 'none';
+      return;
+    }
+    // Datasets are referenced by URL, which (unlike positions) survives catalog reloads
+    const urls = indices.map(i => JSON.stringify(`syft://${emails[codes[i]]}/private/datasets/${names[i]}`));
+    const code = urls.length === 1
+      ? `# Selected dataset:\\ndataset = syd.datasets.get_by_url(${urls[0]})`
+      : `# Selected datasets:\\ndatasets = syd.datasets.get_many([\\n${urls.map(u => `    ${u},`).join('\\n')}\\n])`;
+    navigator.clipboard.writeText(code).then(() => {
+      const text = button.textContent;
+      button.textContent = '✅ Copied!';
+      button.style.backgroundColor = '#28a745';
+      setTimeout(() => {
+        button.textContent = text;
+        button.style.backgroundColor = '#007bff';
+      }, 2000);
+    }).catch(err => console.warn('Could not copy to clipboard:', err));
+    output.textContent = code;
+    output.style.display = 'block';
+  }
+
+  let scheduled = false;
+  scroller.addEventListener('scroll', () => {
+    if (scheduled) return;
+    scheduled = true;
+    requestAnimationFrame(() => { scheduled = false; render(); });
+  });
+  tbody.addEventListener('change', event => {
+    const row = event.target.closest('tr'), index = Number(row.dataset.index);
+    if (event.target.checked) selected.add(index); else selected.delete(index);
+    row.classList.toggle('nsai-selected', event.target.checked);
+    update();
+  });
+  root.querySelector('.nsai-search-box').addEventListener('input', event => search(event.target.value));
+  root.querySelector('.nsai-controls').addEventListener('click', event => {
+    const action = event.target.dataset.action;
+    if (action === 'select-all') {
+      const all = visible.every(i => selected.has(i));
+      visible.forEach(i => all ? selected.delete(i) : selected.add(i));
+    } else if (action === 'clear') {
+      selected.clear();
+    } else if (action === 'generate') {
+      return generateCode(event.target);
+    } else {
+      return;
+    }
+    render();
+    update();
+  });
+
+  render();
+  update();
+}
+"""
+
+
+def _payload(store, rows, note: str = "") -> str:
+    """Compact JSON of the given rows, safe to embed in a ``<script>`` element"""
+    email_codes, remap = store.email_codes, {}
+    codes = [remap.setdefault(email_codes[row], len(remap)) for row in rows]
+    payload = {
+        "emails": [store.emails[code] for code in remap],
+        "codes": codes,
+        # A list even for snapshot-backed stores, whose columns are mapped sequences
+        "names": list(store.row_names(rows)),
+        "note": note,
+    }
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    # "<" only occurs inside JSON strings, where the escape is equivalent
+    return data.replace("<", "\\u003c")
+
+
+def collection_html(
+    store, rows, search_info: Optional[str] = None, max_rows: int = HTML_MAX_ROWS
+) -> str:
+    """Virtualized HTML table of ``rows`` of ``store``, embedding at most ``max_rows`` rows
+
+    The output's size is linear in the number of embedded rows and independent
+    of how many of them are on screen.
+    """
+    count = len(rows)
+    shown = rows[:max_rows]
+    note = ""
+    if count > len(shown):
+        note = (
+            f" • showing the first {len(shown)} of {count}; "
+            "narrow down with .search(), .filter_by_email(), .filter_by_tag() or .query()"
+        )
+
+    title = escape(search_info) if search_info else "Available Datasets"
+    search_indicator = (
+        f"<p style='color: #28a745; font-style: italic;'>🔍 {escape(search_info)}</p>"
+        if search_info
+        else ""
+    )
+    container_id = f"nsai-container-{uuid.uuid4().hex[:8]}"
+    payload = _payload(store, shown, note)
+
+    parts = [
+        _CSS,
+        f'<div class="nsai-container" id="{container_id}">',
+        f'<div class="nsai-header"><strong>📊 {title} ({count} total)</strong>{search_indicator}</div>',
+        '<div class="nsai-controls">',
+        '<input type="text" class="nsai-search-box" placeholder="🔍 Search datasets...">',
+        '<button class="nsai-btn" data-action="select-all">Select All</button>',
+        '<button class="nsai-btn nsai-btn-secondary" data-action="clear">Clear</button>',
+        '<button class="nsai-btn" data-action="generate">Generate Code</button>',
+        "</div>",
+        '<div class="nsai-table-container"><table class="nsai-datasets-table">',
+        '<colgroup><col style="width: 30px"><col style="width: 45px"><col style="width: 25%">'
+        '<col style="width: 25%"><col></colgroup>',
+        "<thead><tr><th>☑</th><th>#</th><th>Email</th><th>Dataset Name</th><th>Syft URL</th></tr></thead>",
+        "<tbody></tbody></table></div>",
+        f'<div class="nsai-status">{count} datasets{escape(note)}</div>',
+        '<div class="nsai-output" style="display: none;"></div>',
+        "</div>",
+        f'<script type="application/json" id="{container_id}-data">{payload}</script>',
+        "<script>",
+        _SCRIPT,
+        f"sydRenderTable('{container_id}');",
+        "</script>",
+    ]
+    return "\n".join(parts)
@@ -0,0 +1,173 @@
+"""Bounded-memory previews and uniform samples of a dataset's mock data
+
+Mock files (``<datasite>/public/datasets/<name>``) are read in chunks: CSV and
+JSON lines through pandas' chunked readers over a memory-mapped file, Parquet
+batch by batch through pyarrow (with ``memory_map``). A preview stops reading
+once it has its rows; a sample reads every row but keeps only a reservoir of
+``n`` rows (Algorithm R), so memory stays at one chunk plus the sample.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Rows read at a time
+CHUNK_ROWS = 10_000
+# JSON documents (as opposed to JSON lines) cannot be streamed; larger ones are not read
+MAX_JSON_DOCUMENT_BYTES = 64 * 1024 * 1024
+# Bytes read at a time while looking for the start of a JSON file
+_SNIFF_BYTES = 4096
+
+READERS = {
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+
+def data_files(directory: Union[str, Path]) -> List[Path]:
+    """Readable data files under ``directory``, in a stable (sorted path) order"""
+    files = []
+    for root, dirs, names in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(names):
+            if not name.startswith(".") and Path(name).suffix.lower() in READERS:
+                files.append(Path(root) / name)
+    return files
+
+
+def _is_json_document(path: Path, size: int) -> bool:
+    """Whether ``path`` (of ``size`` bytes) holds a single JSON array rather than JSON lines
+
+    Reads small blocks up to the first non-whitespace byte only, however long the
+    first line is.
+    """
+    if not size:
+        return False
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(_SNIFF_BYTES)
+            if not block:
+                return False
+            stripped = block.lstrip()
+            if stripped:
+                return stripped.startswith(b"[")
+
+
+def iter_chunks(path: Union[str, Path], chunk_rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """DataFrames of at most ``chunk_rows`` rows, covering the file in order"""
+    path = Path(path)
+    kind = READERS.get(path.suffix.lower())
+    if kind == "csv":
+        sep = "\t" if path.suffix.lower() == ".tsv" else ","
+        with pd.read_csv(path, sep=sep, chunksize=chunk_rows, memory_map=True) as reader:
+            yield from reader
+    elif kind == "parquet":
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required to read Parquet files")
+        parquet = pq.ParquetFile(path, memory_map=True)
+        for batch in parquet.iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    elif kind in ("json", "jsonl"):
+        size = path.stat().st_size
+        if kind == "json" and _is_json_document(path, size):
+            if size > MAX_JSON_DOCUMENT_BYTES:
+                raise ValueError(f"{path.name} is a JSON document too large to read in chunks")
+            frame = pd.read_json(path)
+            for start in range(0, len(frame), chunk_rows):
+                yield frame.iloc[start : start + chunk_rows]
+        else:
+            with pd.read_json(path, lines=True, chunksize=chunk_rows) as reader:
+                yield from reader
+    else:
+        raise ValueError(f"Cannot read {path.name}: unsupported file type")
+
+
+def _check_rows(n: int):
+    if n < 1:
+        raise ValueError(f"n must be at least 1, got {n}")
+
+
+def _mock_files(directory: Union[str, Path]) -> List[Path]:
+    directory = Path(directory)
+    if not directory.exists():
+        raise FileNotFoundError(f"No mock data at {directory}")
+    files = [directory] if directory.is_file() else data_files(directory)
+    if not files:
+        raise ValueError(f"No CSV, Parquet or JSON files in {directory}")
+    return files
+
+
+def preview(directory: Union[str, Path], n: int = 10) -> pd.DataFrame:
+    """First ``n`` rows of the data files in ``directory``, reading no further"""
+    _check_rows(n)
+    chunks = []
+    remaining = n
+    for path in _mock_files(directory):
+        for chunk in iter_chunks(path, min(CHUNK_ROWS, n)):
+            chunks.append(chunk.iloc[:remaining])
+            remaining -= len(chunks[-1])
+            if remaining <= 0:
+                break
+        if remaining <= 0:
+            break
+    return _concat(chunks)
+
+
+def sample(directory: Union[str, Path], n: int = 10, seed: Optional[int] = None) -> pd.DataFrame:
+    """Uniform random sample of ``n`` rows of the data files in ``directory``
+
+    Every row is read once, in chunks, and has the same chance of ending up in
+    the sample; rows are returned in the order they were read.
+    """
+    _check_rows(n)
+    rng = np.random.default_rng(seed)
+    reservoir: List[dict] = []
+    # Row number (across files) of each reservoir slot, to restore reading order
+    positions: List[int] = []
+    seen = 0
+    for path in _mock_files(directory):
+        for chunk in iter_chunks(path, CHUNK_ROWS):
+            size = len(chunk)
+            start = 0
+            if len(reservoir) < n:
+                start = min(n - len(reservoir), size)
+                reservoir.extend(chunk.iloc[:start].to_dict("records"))
+                positions.extend(range(seen, seen + start))
+            if start < size:
+                # Row i (0-based, across files) replaces a random slot with probability n / (i + 1)
+                indices = np.arange(seen + start, seen + size)
+                slots = rng.integers(0, indices + 1)
+                accepted = np.flatnonzero(slots < n)
+                if len(accepted):
+                    records = chunk.iloc[accepted + start].to_dict("records")
+                    for offset, record in zip(accepted, records):
+                        slot = slots[offset]
+                        reservoir[slot] = record
+                        positions[slot] = seen + start + offset
+            seen += size
+
+    order = sorted(range(len(reservoir)), key=positions.__getitem__)
+    return pd.DataFrame.from_records([reservoir[i] for i in order])
+
+
+def _concat(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0].reset_index(drop=True)
+    return pd.concat(chunks, ignore_index=True)
@@ -0,0 +1,284 @@
+"""Immutable, memory-mapped catalog snapshots shared between processes
+
+One process (the builder) discovers datasets and publishes the catalog as a
+snapshot file; any number of other processes (e.g. uvicorn workers) attach to
+it with ``mmap`` instead of running discovery themselves. Names and emails are
+decoded straight from the shared pages on access, so attaching is O(datasites)
+and the catalog's memory is shared by every worker through the page cache.
+
+Every publish writes a new generation file and then atomically repoints the
+``CURRENT`` file at it; readers notice the new generation and swap over.
+
+File layout (little endian, sections 8-byte aligned)::
+
+    header        magic, format version, generation, row count, email count
+    email offsets (emails + 1) x u64, into the email blob
+    name offsets  (rows + 1) x u64, into the name blob
+    email codes   rows x u32, index of each row's email
+    email blob    UTF-8
+    name blob     UTF-8
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from array import array
+from collections.abc import Sequence
+from itertools import accumulate
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from .events import GENERATION, CatalogEvent, EventHub, catalog_events, group_by_datasite
+from .store import CatalogStore, ConstantColumn
+
+MAGIC = b"SYDSNAP1"
+FORMAT_VERSION = 1
+POINTER_FILE = "CURRENT"
+# Generations kept on disk besides the current one, for readers still attached to them
+KEEP_GENERATIONS = 2
+
+_HEADER = struct.Struct("<8sIQQQ")
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _snapshot_name(generation: int) -> str:
+    return f"catalog-{generation:012d}.snap"
+
+
+class MappedStrings(Sequence):
+    """Read-only sequence of strings decoded on access from a shared buffer"""
+
+    def __init__(self, buffer: memoryview, offsets: memoryview, blob_start: int):
+        self._buffer = buffer
+        self._offsets = offsets
+        self._blob_start = blob_start
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("snapshot index out of range")
+        start = self._blob_start + self._offsets[index]
+        end = self._blob_start + self._offsets[index + 1]
+        return str(self._buffer[start:end], "utf-8")
+
+    def __iter__(self):
+        buffer, base, offsets = self._buffer, self._blob_start, self._offsets
+        for i in range(len(self)):
+            yield str(buffer[base + offsets[i] : base + offsets[i + 1]], "utf-8")
+
+
+def write_snapshot(store: CatalogStore, directory: Union[str, Path], generation: int) -> Path:
+    """Publish ``store`` as snapshot ``generation`` in ``directory``
+
+    The file is written under a temporary name, flushed to disk and renamed into
+    place before ``CURRENT`` is atomically replaced, so readers only ever see
+    complete snapshots.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    emails = [email.encode("utf-8") for email in store.emails]
+    names = [name.encode("utf-8") for name in store.names]
+    email_offsets = array("Q", accumulate((len(e) for e in emails), initial=0))
+    name_offsets = array("Q", accumulate((len(n) for n in names), initial=0))
+    email_codes = array("I", store.email_codes)
+
+    sections = [email_offsets.tobytes(), name_offsets.tobytes(), email_codes.tobytes()]
+    sections += [b"".join(emails), b"".join(names)]
+
+    path = directory / _snapshot_name(generation)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".catalog-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, generation, len(names), len(emails)))
+            for section in sections:
+                f.write(b"\0" * (_align(f.tell()) - f.tell()))
+                f.write(section)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+    _write_pointer(directory, path.name)
+    _remove_old_generations(directory, generation)
+    return path
+
+
+def _write_pointer(directory: Path, name: str):
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".current-", suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        f.write(name)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, directory / POINTER_FILE)
+
+
+def _remove_old_generations(directory: Path, generation: int):
+    for path in directory.glob("catalog-*.snap"):
+        try:
+            if int(path.stem.split("-")[1]) < generation - KEEP_GENERATIONS:
+                path.unlink()
+        except (ValueError, OSError):
+            # Malformed names, or files still mapped by a reader on Windows
+            continue
+
+
+def current_generation(directory: Union[str, Path]) -> Optional[int]:
+    """Generation ``CURRENT`` points at, or None if nothing has been published yet"""
+    try:
+        name = (Path(directory) / POINTER_FILE).read_text().strip()
+        return int(name.split("-")[1].split(".")[0])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def open_snapshot(path: Union[str, Path]) -> Tuple[CatalogStore, int]:
+    """Map a snapshot file into a read-only CatalogStore
+
+    Returns:
+        Tuple[CatalogStore, int]: The store and its generation
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        built_at = os.fstat(f.fileno()).st_mtime
+    buffer = memoryview(mapped)
+
+    magic, version, generation, rows, emails = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a catalog snapshot (format {FORMAT_VERSION})")
+
+    offset = _align(_HEADER.size)
+    email_offsets = buffer[offset : offset + 8 * (emails + 1)].cast("Q")
+    offset = _align(offset + 8 * (emails + 1))
+    name_offsets = buffer[offset : offset + 8 * (rows + 1)].cast("Q")
+    offset = _align(offset + 8 * (rows + 1))
+    email_codes = buffer[offset : offset + 4 * rows].cast("I")
+    email_blob = _align(offset + 4 * rows)
+    name_blob = _align(email_blob + email_offsets[emails])
+
+    store = CatalogStore()
+    # There are few emails; decode them once so lookups by email stay cheap
+    store.emails = list(MappedStrings(buffer, email_offsets, email_blob))
+    store.email_codes = email_codes
+    store.names = MappedStrings(buffer, name_offsets, name_blob)
+    store.objs = ConstantColumn(None, rows)
+    store.lazy = ConstantColumn(1, rows)
+    store.generation = generation
+    store.built_at = built_at
+    store.derived["snapshot"] = (path, generation)
+    return store, generation
+
+
+def _datasites(collection):
+    if collection is None:
+        return {}
+    state = collection._state
+    store, rows = state.store, state.rows
+    return group_by_datasite(zip(store.row_emails(rows), store.row_names(rows)))
+
+
+def load_current(directory: Union[str, Path]) -> Tuple[CatalogStore, int]:
+    """Map the snapshot ``CURRENT`` points at"""
+    name = (Path(directory) / POINTER_FILE).read_text().strip()
+    return open_snapshot(Path(directory) / name)
+
+
+class SnapshotCatalog:
+    """Reader side: serves the latest published snapshot and swaps to newer generations
+
+    ``collection`` checks ``CURRENT`` at most every ``check_interval`` seconds;
+    requests already holding the previous collection keep using it until they
+    finish, after which its mapping is released.
+    """
+
+    def __init__(self, directory: Union[str, Path], check_interval: float = 1.0):
+        self.directory = Path(directory)
+        self.check_interval = check_interval
+        self.generation: Optional[int] = None
+        self._collection = None
+        self._checked_at = 0.0
+        self._events = EventHub()
+        self._lock = threading.Lock()
+
+    def wait_until_published(self, timeout: Optional[float] = None, poll: float = 0.1) -> bool:
+        """Block until a builder has published a first snapshot"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while current_generation(self.directory) is None:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(poll)
+        return True
+
+    def reload(self) -> bool:
+        """Attach to the current generation if it is newer than ours
+
+        Returns:
+            bool: True if a new generation was attached
+        """
+        from . import DatasetCollection
+
+        with self._lock:
+            self._checked_at = time.monotonic()
+            generation = current_generation(self.directory)
+            if generation is None or generation == self.generation:
+                return False
+            store, generation = load_current(self.directory)
+            collection = DatasetCollection._view(store, range(len(store)))
+            previous, self._collection, self.generation = self._collection, collection, generation
+
+        if self._events:
+            events = catalog_events(_datasites(previous), _datasites(collection))
+            events.append(CatalogEvent(GENERATION, generation=generation, total_count=len(store)))
+            self._events.emit(events)
+        return True
+
+    def subscribe(self, callback):
+        """Get ``CatalogEvent``s for the changes between successive generations
+
+        Generations are only checked when ``collection`` is accessed (or ``reload``
+        called), so subscribers should access it periodically.
+        """
+        return self._events.subscribe(callback)
+
+    @property
+    def collection(self):
+        """DatasetCollection over the newest snapshot"""
+        if self._collection is None or time.monotonic() - self._checked_at >= self.check_interval:
+            self.reload()
+        if self._collection is None:
+            raise LookupError(f"No catalog snapshot published in {self.directory}")
+        return self._collection
+
+
+class SnapshotPublisher:
+    """Builder side: publishes a collection's catalog as successive generations"""
+
+    def __init__(self, collection, directory: Union[str, Path]):
+        self.collection = collection
+        self.directory = Path(directory)
+        self.generation = current_generation(self.directory) or 0
+        self._lock = threading.Lock()
+
+    def publish(self, *_) -> Path:
+        """Write the collection's current catalog as the next generation
+
+        Accepts (and ignores) arguments so it can be used as a watcher callback.
+        """
+        with self._lock:
+            self.generation += 1
+            return write_snapshot(self.collection._store, self.directory, self.generation)
@@ -0,0 +1,221 @@
+"""Column-oriented storage for dataset catalogs"""
+
+import sys
+import time
+import uuid
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+SYFT_URL_PREFIX = "syft://"
+_DATASETS_PATH = "/private/datasets/"
+
+
+def dataset_url(email: str, name: str) -> str:
+    """``syft://`` URL of dataset ``name`` of datasite ``email``"""
+    return f"{SYFT_URL_PREFIX}{email}{_DATASETS_PATH}{name}"
+
+
+def parse_dataset_url(url: str) -> Optional[Tuple[str, str]]:
+    """``(email, name)`` of a dataset URL, or None if ``url`` is not one"""
+    if not url.startswith(SYFT_URL_PREFIX):
+        return None
+    email, sep, name = url[len(SYFT_URL_PREFIX) :].partition(_DATASETS_PATH)
+    if not sep or not email or not name or "/" in email:
+        return None
+    return email, name
+
+
+def dataset_id(email: str, name: str) -> str:
+    """Stable identifier of a dataset, derived from its URL"""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, dataset_url(email, name)))
+
+
+# Sort keys of a row, from its (name, email); ties are broken so the order is total
+SORT_KEYS: Dict[str, Callable[[str, str], Tuple[str, ...]]] = {
+    "name": lambda name, email: (name.lower(), email.lower(), name, email),
+    "email": lambda name, email: (email.lower(), name.lower(), email, name),
+}
+
+
+class CatalogStore:
+    """Immutable, column-oriented table of datasets
+
+    Each row is a dataset. Emails are interned and stored once per datasite, with
+    an array of email codes per row; names, syft_rds objects and "fetch on demand"
+    flags are kept in parallel columns. Collections hold a store plus an array of
+    row numbers, so filtering and slicing never copy the data itself.
+
+    ``generation`` numbers successive catalogs of a collection and ``built_at`` is the
+    time the store was built; together they identify a version of the catalog.
+    ``datasites_dir`` is the SyftBox datasites directory the catalog was loaded
+    from, if any.
+
+    ``Dataset`` objects for rows are only created when a row is accessed, and are
+    cached in ``views`` (row -> Dataset) so that repeated access returns the same object. Structures
+    derived from the columns (DataFrames, lookup tables, ...) are cached in ``derived``.
+    """
+
+    def __init__(self):
+        self.emails: List[str] = []
+        self.email_codes = array("I")
+        self.names: List[str] = []
+        self.objs: List[Any] = []
+        self.lazy = bytearray()
+        self.views: Dict[int, Any] = {}
+        self.derived: Dict[str, Any] = {}
+        self.generation = 0
+        self.built_at = time.time()
+        self.datasites_dir: Optional[Any] = None
+        self._email_ids: Dict[str, int] = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def _email_code(self, email: str) -> int:
+        code = self._email_ids.get(email)
+        if code is None:
+            code = self._email_ids[email] = len(self.emails)
+            self.emails.append(sys.intern(email))
+        return code
+
+    def append(self, email: str, name: str, obj: Any = None, lazy: bool = False, view: Any = None):
+        """Add a row; ``lazy`` rows fetch their syft_rds object on first access"""
+        if view is not None:
+            self.views[len(self.names)] = view
+        self.email_codes.append(self._email_code(email))
+        self.names.append(name)
+        self.objs.append(obj)
+        self.lazy.append(1 if lazy else 0)
+
+    @classmethod
+    def from_datasets(cls, datasets: Iterable) -> "CatalogStore":
+        """Store wrapping existing ``Dataset`` objects (they are reused as row views)"""
+        store = cls()
+        for ds in datasets:
+            store.append(ds.email, ds.name, view=ds)
+        return store
+
+    @classmethod
+    def from_datasites(
+        cls, datasites: Iterable[Tuple[str, Sequence[str], Optional[Sequence[Any]]]]
+    ) -> "CatalogStore":
+        """Store built from ``(email, names, objs)`` chunks, one per datasite
+
+        ``objs`` is None for datasites restored from the catalog cache, whose
+        syft_rds objects are fetched on demand.
+        """
+        store = cls()
+        for email, names, objs in datasites:
+            count = len(names)
+            if not count:
+                # Only emails with rows are listed, see ``unique_emails``
+                continue
+            store.email_codes.extend(repeat(store._email_code(email), count))
+            store.names.extend(names)
+            store.objs.extend(repeat(None, count) if objs is None else objs)
+            store.lazy.extend(repeat(1 if objs is None else 0, count))
+        return store
+
+    def email(self, row: int) -> str:
+        return self.emails[self.email_codes[row]]
+
+    def row_emails(self, rows: Sequence[int]) -> List[str]:
+        """Email of each row in ``rows``"""
+        emails, codes = self.emails, self.email_codes
+        return [emails[codes[row]] for row in rows]
+
+    def row_names(self, rows: Sequence[int]) -> List[str]:
+        """Name of each row in ``rows``"""
+        if isinstance(rows, range) and rows == range(len(self.names)):
+            return self.names
+        names = self.names
+        return [names[row] for row in rows]
+
+    def unique_emails(self, rows: Sequence[int]) -> List[str]:
+        """Distinct emails among ``rows``, in first-seen order"""
+        if isinstance(rows, range) and rows == range(len(self.names)):
+            return list(self.emails)
+        codes = self.email_codes
+        return [self.emails[code] for code in dict.fromkeys(codes[row] for row in rows)]
+
+    def sort_key(self, row: int, key: str) -> Tuple[str, ...]:
+        """Value of sort ``key`` (see ``SORT_KEYS``) for ``row``"""
+        return SORT_KEYS[key](self.names[row], self.email(row))
+
+    def sort_order(self, key: str) -> array:
+        """Every row number, ordered by sort ``key``; computed once per store"""
+        order = self.derived.get(("order", key))
+        if order is None:
+            make_key, names, emails, codes = (
+                SORT_KEYS[key],
+                self.names,
+                self.emails,
+                self.email_codes,
+            )
+            order = row_array(
+                sorted(range(len(names)), key=lambda r: make_key(names[r], emails[codes[r]]))
+            )
+            self.derived[("order", key)] = order
+        return order
+
+    def key_index(self) -> Dict[Tuple[str, str], int]:
+        """Row of each ``(email, name)``; computed once per store"""
+        index = self.derived.get("keys")
+        if index is None:
+            emails, codes = self.emails, self.email_codes
+            index = {}
+            for row, name in enumerate(self.names):
+                index.setdefault((emails[codes[row]], name), row)
+            self.derived["keys"] = index
+        return index
+
+    def id_index(self) -> Dict[str, int]:
+        """Row of each dataset id (see ``dataset_id``); computed once per store"""
+        index = self.derived.get("ids")
+        if index is None:
+            index = {dataset_id(*key): row for key, row in self.key_index().items()}
+            self.derived["ids"] = index
+        return index
+
+    def facets(self) -> Dict[str, Any]:
+        """Dataset counts per email and domain, and the distinct names; computed once per store"""
+        facets = self.derived.get("facets")
+        if facets is None:
+            counts = Counter(self.email_codes)
+            emails = {email: counts[code] for code, email in enumerate(self.emails) if counts[code]}
+            domains = Counter()
+            for email, count in emails.items():
+                domains[email.split("@", 1)[-1].lower()] += count
+            facets = self.derived["facets"] = {
+                "total_count": len(self),
+                "emails": dict(sorted(emails.items())),
+                "domains": dict(sorted(domains.items())),
+                "names": sorted(set(self.names)),
+            }
+        return facets
+
+
+class ConstantColumn(Sequence):
+    """Read-only column holding the same value in every row, without per-row storage"""
+
+    def __init__(self, value: Any, length: int):
+        self.value = value
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.value] * len(range(*index.indices(self.length)))
+        if not -self.length <= index < self.length:
+            raise IndexError("column index out of range")
+        return self.value
+
+
+def row_array(rows: Iterable[int]) -> array:
+    """Compact array of row numbers, used for views over a store"""
+    return array("q", rows)
@@ -0,0 +1,161 @@
+"""Incremental iteration over the datasets of a SyftBox federation"""
+
+import asyncio
+import functools
+import threading
+from typing import AsyncIterator, Callable, Iterator, Optional
+
+from .discovery import DEFAULT_MAX_WORKERS, DEFAULT_TIMEOUT, iter_datasites
+from .health import HealthTracker
+from .metrics import DATASITES_SKIPPED
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def _candidates(use_cache: bool, max_workers: int, timeout: float) -> Iterator:
+    """Datasets of every datasite, one datasite at a time, fastest first
+
+    Datasites whose catalog cache entry is current are yielded straight away;
+    the others are queried concurrently and yielded as they answer, except those
+    whose circuit is open because they failed recently.
+    """
+    from . import CatalogCache, Dataset, _fetch_dataset_obj, _lazy, datasets, datasite_signature
+
+    if datasets.loaded:
+        yield from datasets.current()
+        return
+
+    client = _lazy("Client").load()
+    emails = sorted(path.name for path in client.datasites.iterdir())
+
+    cache = None
+    if use_cache:
+        try:
+            cache = CatalogCache.for_client(client)
+        except Exception as e:
+            print(f"⚠️  Dataset catalog cache unavailable, streaming without it: {e}")
+
+    health = HealthTracker(cache=cache)
+    signatures, stale = {}, []
+    for email in emails:
+        signatures[email] = datasite_signature(client.datasites, email)
+        names = cache.get(email, signatures[email]) if cache is not None else None
+        if names is None:
+            if health.should_query(email, signatures[email]):
+                stale.append(email)
+            else:
+                DATASITES_SKIPPED.inc()
+            continue
+        for name in names:
+            dataset = Dataset(email, name)
+            dataset._dataset_loader = functools.partial(_fetch_dataset_obj, email, name)
+            yield dataset
+
+    results = iter_datasites(stale, _lazy("init_session"), max_workers=max_workers, timeout=timeout)
+    try:
+        for result in results:
+            health.record(result, signatures[result.email])
+            if not result.ok:
+                continue
+            if cache is not None:
+                cache.put(
+                    result.email, signatures[result.email], [ds.name for ds in result.datasets]
+                )
+            for obj in result.datasets:
+                yield Dataset(result.email, obj.name, obj)
+    finally:
+        results.close()
+
+
+def iter_datasets(
+    predicate: Optional[Callable] = None,
+    limit: Optional[int] = None,
+    use_cache: bool = True,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Iterator:
+    """Yield datasets as their datasites are discovered, without waiting for a full scan
+
+    Datasets restored from the catalog cache come first, then those of each
+    queried datasite as soon as it answers. If ``syd.datasets`` is already loaded,
+    its datasets are yielded instead. Stopping early (``limit``, ``break``)
+    cancels the datasites that have not been queried yet.
+
+    Args:
+        predicate: Only yield datasets for which ``predicate(dataset)`` is true
+        limit: Stop after this many datasets
+        use_cache: Serve datasites that did not change from the catalog cache
+        max_workers: Maximum number of datasites queried at the same time
+        timeout: Seconds a single datasite may take before it is skipped
+
+    Yields:
+        Dataset: Matching datasets, in discovery order
+    """
+    if limit is not None and limit <= 0:
+        return
+    count = 0
+    candidates = _candidates(use_cache, max_workers, timeout)
+    try:
+        for dataset in candidates:
+            if predicate is not None and not predicate(dataset):
+                continue
+            yield dataset
+            count += 1
+            if limit is not None and count >= limit:
+                return
+    finally:
+        candidates.close()
+
+
+async def aiter_datasets(
+    predicate: Optional[Callable] = None,
+    limit: Optional[int] = None,
+    use_cache: bool = True,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> AsyncIterator:
+    """Async variant of ``iter_datasets``; discovery runs in a worker thread
+
+    Breaking out of the ``async for`` loop stops discovery once the datasite
+    currently being waited on answers.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+
+    def put(item):
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            # The event loop is gone; nobody is listening any more
+            stop.set()
+
+    def produce():
+        datasets = iter_datasets(predicate, limit, use_cache, max_workers, timeout)
+        try:
+            for dataset in datasets:
+                if stop.is_set():
+                    break
+                put(dataset)
+        except BaseException as e:
+            put(_Failure(e))
+        finally:
+            datasets.close()
+            put(_DONE)
+
+    threading.Thread(target=produce, name="syd-stream", daemon=True).start()
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
@@ -0,0 +1,191 @@
+"""Plain-text tables of dataset collections
+
+Renders the same grid layout as ``tabulate(..., tablefmt="grid")`` straight from
+the catalog columns: column widths are computed from string lengths up front,
+so rows can be written one at a time and long collections can be truncated to
+their head and tail without formatting the rows in between.
+
+Like tabulate, a Dataset Name column made only of numbers (e.g. ``"2023"`` or
+``"1.5"``) is formatted as numbers and right-aligned on the decimal point.
+"""
+
+import io
+import math
+import re
+from typing import Dict, Iterator, List, Optional, TextIO
+
+HEADERS = ("Index", "Email", "Dataset Name", "Syft URL")
+# Rows shown when a collection is echoed in a REPL
+DEFAULT_MAX_ROWS = 60
+
+_URL_PREFIX = "syft://"
+_URL_PATH = "/private/datasets/"
+_ELLIPSIS = "..."
+# Extra room tabulate leaves around headers
+_HEADER_PADDING = 2
+# Lines buffered between writes when streaming a table to a file
+_CHUNK_LINES = 1024
+
+# Kinds of cell values, from least to most generic, as tabulate tells column types apart
+_EMPTY, _BOOL, _INT, _FLOAT, _TEXT = range(5)
+_THOUSANDS = re.compile(r"^(([+-]?[0-9]{1,3})(?:,([0-9]{3}))*)?(?(1)\.[0-9]*|\.[0-9]+)?$")
+
+
+def _converts(kind, text: str) -> bool:
+    try:
+        kind(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_number(text: str) -> bool:
+    """Whether ``text`` parses as a float that is not an overflow to inf"""
+    if not _converts(float, text):
+        return False
+    value = float(text)
+    return not (math.isinf(value) or math.isnan(value)) or text.lower() in ("inf", "-inf", "nan")
+
+
+def _kind(text: str) -> int:
+    if not text:
+        return _EMPTY
+    if text in ("True", "False"):
+        return _BOOL
+    separated = _THOUSANDS.match(text) is not None
+    if _converts(int, text) or (separated and "." not in text):
+        return _INT
+    if _is_number(text) or separated:
+        return _FLOAT
+    return _TEXT
+
+
+def _afterpoint(text: str) -> int:
+    """Characters after the decimal point (or exponent) of a number, -1 if it has none"""
+    if _converts(int, text) or not (_is_number(text) or _THOUSANDS.match(text)):
+        return -1
+    point = text.rfind(".")
+    if point < 0:
+        point = text.lower().rfind("e")
+    return len(text) - point - 1 if point >= 0 else -1
+
+
+def _format_float(text: str) -> str:
+    try:
+        return format(float(text.replace(",", "")), "g")
+    except ValueError:
+        return text
+
+
+def _numeric_names(store, rows, parts: List[range]) -> Optional[Dict[int, str]]:
+    """Dataset name cells by position, if the names shown are all numbers
+
+    Returns None (a text column) as soon as a name is not a number, so usually
+    after the first row. Otherwise cells are formatted and padded to line up on
+    their decimal points.
+    """
+    names = store.names
+    kind = _BOOL
+    for part in parts:
+        for position in part:
+            kind = max(kind, _kind(names[rows[position]]))
+            if kind == _TEXT:
+                return None
+    if kind < _INT:
+        return None
+
+    cells = {}
+    for part in parts:
+        for position in part:
+            name = names[rows[position]]
+            cells[position] = _format_float(name) if kind == _FLOAT and name else name
+    decimals = {position: _afterpoint(cell) for position, cell in cells.items()}
+    most = max(decimals.values(), default=-1)
+    return {position: cell + " " * (most - decimals[position]) for position, cell in cells.items()}
+
+
+def _shown(count: int, max_rows: Optional[int]) -> List[range]:
+    """Position ranges to render: every row, or the head and tail around an ellipsis"""
+    if max_rows is None or count <= max_rows:
+        return [range(count)]
+    head = (max_rows + 1) // 2
+    return [range(head), range(count - (max_rows - head), count)]
+
+
+def _widths(
+    store, rows, parts: List[range], numeric_names: Optional[Dict[int, str]] = None
+) -> List[int]:
+    """Width of each column over the rows at the given positions"""
+    email_lengths = [len(email) for email in store.emails]
+    codes, names = store.email_codes, store.names
+    index = email = name = url = 0
+    for part in parts:
+        for position in part:
+            row = rows[position]
+            email_length, name_length = email_lengths[codes[row]], len(names[row])
+            email = max(email, email_length)
+            name = max(name, name_length)
+            url = max(url, email_length + name_length)
+        if part:
+            index = max(index, len(str(part[-1])))
+    url += len(_URL_PREFIX) + len(_URL_PATH)
+    if numeric_names is not None:
+        name = max(map(len, numeric_names.values()), default=0)
+    if len(parts) > 1:
+        index, email, name, url = (max(w, len(_ELLIPSIS)) for w in (index, email, name, url))
+    return [max(w, len(h) + _HEADER_PADDING) for w, h in zip((index, email, name, url), HEADERS)]
+
+
+def iter_lines(store, rows, max_rows: Optional[int] = DEFAULT_MAX_ROWS) -> Iterator[str]:
+    """Lines of the grid table of ``rows`` of ``store``"""
+    parts = _shown(len(rows), max_rows)
+    numeric_names = _numeric_names(store, rows, parts)
+    wi, we, wn, wu = widths = _widths(store, rows, parts, numeric_names)
+    # Names are aligned left, or right if they are numbers
+    na = "<" if numeric_names is None else ">"
+    rule = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+
+    yield rule
+    yield f"| {HEADERS[0]:>{wi}} | {HEADERS[1]:<{we}} | {HEADERS[2]:{na}{wn}} | {HEADERS[3]:<{wu}} |"
+    yield "+" + "+".join("=" * (w + 2) for w in widths) + "+"
+
+    emails, codes, names = store.emails, store.email_codes, store.names
+    for i, part in enumerate(parts):
+        if i:
+            dots = _ELLIPSIS
+            yield f"| {dots:>{wi}} | {dots:<{we}} | {dots:{na}{wn}} | {dots:<{wu}} |"
+            yield rule
+        for position in part:
+            row = rows[position]
+            email, name = emails[codes[row]], names[row]
+            url = f"{_URL_PREFIX}{email}{_URL_PATH}{name}"
+            if numeric_names is not None:
+                name = numeric_names[position]
+            yield f"| {position:>{wi}} | {email:<{we}} | {name:{na}{wn}} | {url:<{wu}} |"
+            yield rule
+
+    if len(parts) > 1:
+        yield (
+            f"{len(rows)} datasets, showing the first {len(parts[0])} and last "
+            f"{len(parts[1])}; use .to_string(max_rows=None) to show all"
+        )
+
+
+def write_table(
+    store, rows, file: TextIO, max_rows: Optional[int] = DEFAULT_MAX_ROWS, chunk: int = _CHUNK_LINES
+):
+    """Write the grid table of ``rows`` to ``file``, a chunk of lines at a time"""
+    lines = []
+    for line in iter_lines(store, rows, max_rows):
+        lines.append(line)
+        if len(lines) >= chunk:
+            file.write("\n".join(lines) + "\n")
+            lines = []
+    file.write("\n".join(lines))
+
+
+def format_table(store, rows, max_rows: Optional[int] = DEFAULT_MAX_ROWS) -> str:
+    """Grid table of ``rows`` of ``store`` as a string"""
+    buffer = io.StringIO()
+    write_table(store, rows, buffer, max_rows)
+    return buffer.getvalue()
@@ -0,0 +1,201 @@
+"""Taxonomy tags of datasets, matched with an Aho-Corasick automaton
+
+A taxonomy maps each tag to keywords; a dataset gets a tag when its name contains
+one of the tag's keywords (case insensitive), plus its datasite's email domain.
+All keywords are compiled into one automaton, so a name is scanned once however
+many keywords the taxonomy has.
+
+The taxonomy can be replaced with ``set_taxonomy``, or read from the JSON file
+named by ``SYFT_DATASETS_TAXONOMY`` (``{"tag": ["keyword", ...], ...}``).
+"""
+
+import json
+import os
+import threading
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .store import CatalogStore, row_array
+
+DEFAULT_TAXONOMY: Dict[str, Tuple[str, ...]] = {
+    "agriculture": ("crop", "agriculture", "farming"),
+    "finance": ("financial", "finance", "money"),
+    "healthcare": ("health", "medical", "patient"),
+    "education": ("education", "student", "school"),
+}
+
+# Distinct names whose tags a Tagger remembers across catalog generations
+MEMO_SIZE = 200_000
+
+
+def domain_tag(email: str) -> str:
+    """Tag naming the email domain of a datasite"""
+    return (email.split("@", 1)[1] if "@" in email else email).lower()
+
+
+class Tagger:
+    """Tags names with the taxonomy entries whose keywords they contain
+
+    Tags of a name are remembered, so rebuilding the catalog after a refresh
+    only scans names that were not seen before.
+    """
+
+    def __init__(self, taxonomy: Mapping[str, Iterable[str]]):
+        # Tags are lowercased like keywords, as tag filters are case insensitive
+        self.taxonomy: Dict[str, Tuple[str, ...]] = {}
+        for tag, keywords in taxonomy.items():
+            tag = tag.lower()
+            self.taxonomy[tag] = self.taxonomy.get(tag, ()) + tuple(k.lower() for k in keywords)
+        self._order = {tag: position for position, tag in enumerate(self.taxonomy)}
+        self._memo: Dict[str, Tuple[str, ...]] = {}
+        self._build()
+
+    def _build(self):
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[set] = [set()]
+        for tag, keywords in self.taxonomy.items():
+            for keyword in keywords:
+                if not keyword:
+                    continue
+                state = 0
+                for char in keyword:
+                    following = goto[state].get(char)
+                    if following is None:
+                        following = goto[state][char] = len(goto)
+                        goto.append({})
+                        outputs.append(set())
+                    state = following
+                outputs[state].add(tag)
+
+        # Breadth-first, so the failure state of every shorter suffix is known first
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, following in goto[state].items():
+                queue.append(following)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[following] = goto[fallback].get(char, 0)
+                outputs[following] |= outputs[fail[following]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [frozenset(tags) for tags in outputs]
+
+    def keyword_tags(self, text: str) -> Tuple[str, ...]:
+        """Tags whose keywords occur in ``text``, in taxonomy order"""
+        tags = self._memo.get(text)
+        if tags is not None:
+            return tags
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        found = set()
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        tags = tuple(sorted(found, key=self._order.__getitem__))
+
+        if len(self._memo) >= MEMO_SIZE:
+            self._memo.clear()
+        self._memo[text] = tags
+        return tags
+
+    def tag(self, email: str, name: str) -> Tuple[str, ...]:
+        """Tags of dataset ``name`` of datasite ``email``: its domain, then its keyword tags"""
+        return (domain_tag(email),) + self.keyword_tags(name)
+
+
+_tagger: Optional[Tagger] = None
+_tagger_lock = threading.Lock()
+
+
+def _load_taxonomy() -> Mapping[str, Iterable[str]]:
+    path = os.environ.get("SYFT_DATASETS_TAXONOMY")
+    if not path:
+        return DEFAULT_TAXONOMY
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def get_tagger() -> Tagger:
+    """The tagger of the configured taxonomy"""
+    global _tagger
+    if _tagger is None:
+        with _tagger_lock:
+            if _tagger is None:
+                _tagger = Tagger(_load_taxonomy())
+    return _tagger
+
+
+def set_taxonomy(taxonomy: Optional[Mapping[str, Iterable[str]]]):
+    """Tag datasets with ``taxonomy`` (``{tag: keywords}``), or the default one if None
+
+    Catalogs tagged with the previous taxonomy are re-tagged on their next use.
+    """
+    global _tagger
+    with _tagger_lock:
+        _tagger = Tagger(taxonomy) if taxonomy is not None else None
+
+
+class CatalogTags:
+    """Tags of every row of a store, and the rows carrying each tag
+
+    Rows share one tuple per distinct combination of tags.
+    """
+
+    def __init__(self, store: CatalogStore, tagger: Tagger):
+        self.tagger = tagger
+        domains = [domain_tag(email) for email in store.emails]
+        combinations: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        row_tags: List[Tuple[str, ...]] = []
+        postings: Dict[str, array] = {}
+        codes = store.email_codes
+        for row, name in enumerate(store.names):
+            tags = (domains[codes[row]],) + tagger.keyword_tags(name)
+            tags = combinations.setdefault(tags, tags)
+            row_tags.append(tags)
+            for tag in tags:
+                posting = postings.get(tag)
+                if posting is None:
+                    posting = postings[tag] = row_array(())
+                posting.append(row)
+        self.rows = row_tags
+        self.index = postings
+
+    def counts(self) -> Dict[str, int]:
+        """Number of rows carrying each tag"""
+        return {tag: len(rows) for tag, rows in sorted(self.index.items())}
+
+    def rows_with(self, tags: Sequence[str]) -> array:
+        """Rows (ascending) carrying at least one of ``tags``"""
+        postings = [self.index[tag] for tag in {t.lower() for t in tags} if tag in self.index]
+        if len(postings) == 1:
+            return postings[0]
+        return row_array(sorted({row for posting in postings for row in posting}))
+
+
+def catalog_tags(store: CatalogStore) -> CatalogTags:
+    """Tags of ``store``, computed once per store (and taxonomy)"""
+    tagger = get_tagger()
+    tags = store.derived.get("tags")
+    if tags is None or tags.tagger is not tagger:
+        tags = store.derived["tags"] = CatalogTags(store, tagger)
+    return tags
+
+
+def tagged_rows(store: CatalogStore, rows, tags: Sequence[str]) -> array:
+    """Rows among ``rows`` (in their order) carrying at least one of ``tags``"""
+    matches = catalog_tags(store).rows_with(tags)
+    if isinstance(rows, range) and rows == range(len(store)):
+        return matches
+    selected = bytearray(len(store))
+    for row in matches:
+        selected[row] = 1
+    return row_array(row for row in rows if selected[row])
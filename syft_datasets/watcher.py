@@ -0,0 +1,197 @@
+"""Background refresh of a DatasetCollection as datasites change on disk"""
+
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional, Set, Tuple
+
+from .cache import RDS_DATASET_STORE, datasite_signature
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+DEFAULT_INTERVAL = 2.0
+# Full signature scan in watchdog mode, to catch events that were dropped or never emitted
+DEFAULT_RESCAN_INTERVAL = 60.0
+
+
+class CatalogWatcher:
+    """Watches ``client.datasites`` and patches the changed datasites into a collection
+
+    With ``watchdog`` installed, filesystem notifications on the datasites directory and
+    on each datasite's dataset store mark datasites as dirty. Without it, datasite
+    signatures are polled every ``interval`` seconds. Either way, only the affected
+    datasites are re-queried through ``DatasetCollection._update_datasites``, after
+    which ``on_change(changed, removed)`` is called if given.
+    """
+
+    def __init__(
+        self,
+        collection,
+        interval: float = DEFAULT_INTERVAL,
+        rescan_interval: float = DEFAULT_RESCAN_INTERVAL,
+        use_watchdog=None,
+        on_change: Optional[Callable[[Set[str], Set[str]], Any]] = None,
+    ):
+        self.collection = collection
+        self.on_change = on_change
+        self.datasites_dir = Path(collection._client.datasites)
+        self.interval = interval
+        self.rescan_interval = rescan_interval
+        if use_watchdog and not WATCHDOG_AVAILABLE:
+            raise ImportError("watchdog is required for filesystem notifications")
+        self.use_watchdog = WATCHDOG_AVAILABLE if use_watchdog is None else use_watchdog
+
+        self._dirty: Set[str] = set()
+        self._dirty_lock = threading.Lock()
+        self._watched: Set[Path] = set()
+        self._observer = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def mode(self) -> str:
+        return "watchdog" if self.use_watchdog else "polling"
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start watching in a background thread"""
+        if self.running:
+            return self
+        self._stop.clear()
+        if self.use_watchdog:
+            self._start_observer()
+        self._thread = threading.Thread(target=self._run, name="syd-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop watching and wait for the background thread to finish"""
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+            self._watched.clear()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def check(self, full: bool = False) -> Tuple[Set[str], Set[str]]:
+        """Apply pending changes to the collection once
+
+        Args:
+            full: Compare the signature of every datasite, not only notified ones
+
+        Returns:
+            Tuple[Set[str], Set[str]]: Emails of the changed and the removed datasites
+        """
+        if full or not self.use_watchdog:
+            changed, removed = self._scan()
+        else:
+            changed, removed = self._drain()
+
+        if changed or removed:
+            self.collection._update_datasites(sorted(changed), removed=removed)
+            if self.on_change is not None:
+                self.on_change(changed, removed)
+        if self._observer is not None:
+            self._watch_manifests(changed)
+        return changed, removed
+
+    def _run(self):
+        elapsed = 0.0
+        while not self._stop.wait(self.interval):
+            elapsed += self.interval
+            full = elapsed >= self.rescan_interval
+            if full:
+                elapsed = 0.0
+            try:
+                self.check(full=full)
+            except Exception as e:
+                print(f"⚠️  Dataset catalog refresh failed: {e}")
+
+    def _scan(self) -> Tuple[Set[str], Set[str]]:
+        """Diff the signature of every datasite on disk against the collection
+
+        Datasites that failed to load never match their signature on disk; they are
+        picked up again as soon as their circuit breaker lets them be queried.
+        """
+        known = self.collection._signatures
+        health = self.collection._health
+        try:
+            emails = {path.name for path in self.datasites_dir.iterdir() if path.is_dir()}
+        except OSError:
+            return set(), set()
+
+        changed = set()
+        for email in emails:
+            signature = datasite_signature(self.datasites_dir, email)
+            if known.get(email) != signature and health.should_query(email, signature):
+                changed.add(email)
+        removed = set(known) - emails
+        with self._dirty_lock:
+            self._dirty.clear()
+        return changed, removed
+
+    def _drain(self) -> Tuple[Set[str], Set[str]]:
+        """Turn the datasites flagged by filesystem events into changed/removed sets"""
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+
+        changed, removed = set(), set()
+        for email in dirty:
+            if (self.datasites_dir / email).is_dir():
+                changed.add(email)
+            elif email in self.collection._signatures:
+                removed.add(email)
+        return changed, removed
+
+    def _mark_dirty(self, path):
+        try:
+            relative = Path(path).relative_to(self.datasites_dir)
+        except ValueError:
+            return
+        if relative.parts:
+            with self._dirty_lock:
+                self._dirty.add(relative.parts[0])
+
+    def _start_observer(self):
+        watcher = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                watcher._mark_dirty(event.src_path)
+                if getattr(event, "dest_path", None):
+                    watcher._mark_dirty(event.dest_path)
+
+        self._handler = _Handler()
+        self._observer = Observer()
+        self._observer.schedule(self._handler, str(self.datasites_dir), recursive=False)
+        self._observer.start()
+        self._watch_manifests(self.collection._signatures)
+
+    def _watch_manifests(self, emails):
+        """Subscribe to the dataset store of each datasite (it may appear later)"""
+        for email in emails:
+            manifest = self.datasites_dir / email / RDS_DATASET_STORE
+            if manifest in self._watched or not manifest.is_dir():
+                continue
+            try:
+                self._observer.schedule(self._handler, str(manifest), recursive=False)
+                self._watched.add(manifest)
+            except OSError:
+                continue
@@ -0,0 +1,63 @@
+"""Shared fixtures for syft_datasets tests."""
+
+import os
+from contextlib import contextmanager
+from unittest.mock import Mock, patch
+
+import pytest
+
+from syft_datasets.cache import RDS_DATASET_STORE
+from syft_datasets.monitor import AppMonitor
+
+
+class FakeSyftBox:
+    """A SyftBox workspace on disk with stubbed ``Client.load`` and ``init_session``."""
+
+    def __init__(self, root):
+        self.root = root
+        self.datasites = root / "datasites"
+        self.datasites.mkdir()
+        self.names = {}
+        self.calls = []
+
+        self.client = Mock()
+        self.client.email = "me@example.com"
+        self.client.datasites = self.datasites
+        self.client.config.data_dir = root
+        self.client.config.client_url = "http://localhost:7938"
+
+    def add_datasite(self, email, names):
+        """Create (or update) a datasite publishing ``names``."""
+        self.names[email] = list(names)
+        manifest = self.datasites / email / RDS_DATASET_STORE
+        manifest.mkdir(parents=True, exist_ok=True)
+        record = manifest / "datasets.yaml"
+        record.write_text("\n".join(names))
+        # Make sure the change is visible even on filesystems with coarse mtimes
+        stat = record.stat()
+        os.utime(record, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def init_session(self, host):
+        self.calls.append(host)
+        session = Mock()
+        session.datasets = []
+        for name in self.names[host]:
+            dataset = Mock()
+            dataset.name = name
+            session.datasets.append(dataset)
+        return session
+
+    @contextmanager
+    def patched(self):
+        """Route discovery in ``syft_datasets`` to this fake workspace."""
+        with patch("syft_datasets.Client") as mock_client:
+            mock_client.load.return_value = self.client
+            with patch.object(AppMonitor, "_request", side_effect=Exception("offline")):
+                with patch("syft_datasets.init_session", self.init_session):
+                    yield self
+
+
+@pytest.fixture
+def syftbox(tmp_path):
+    """Fake SyftBox workspace rooted in a temporary directory."""
+    return FakeSyftBox(tmp_path)
@@ -0,0 +1,325 @@
+"""Tests for the catalog HTTP API (backend/), through FastAPI's TestClient."""
+
+import asyncio
+import base64
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from syft_datasets import Dataset, DatasetCollection
+from syft_datasets.events import ADD, GENERATION, CatalogEvent
+from syft_datasets.metadata import mock_dir
+from syft_datasets.store import CatalogStore
+
+
+def publish(collection, datasets):
+    """Swap in the next generation of ``collection``, as a refresh would"""
+    store = CatalogStore.from_datasets(datasets)
+    store.generation = collection.generation + 1
+    collection._set_rows(store)
+
+
+@pytest.fixture
+def catalog():
+    collection = DatasetCollection(
+        datasets=[
+            Dataset("alice@example.com", "crop_yield"),
+            Dataset("bob@example.com", "census"),
+            Dataset("carol@uni.edu", "weather"),
+        ]
+    )
+    publish(collection, collection.to_list())
+    return collection
+
+
+@pytest.fixture
+def api(catalog, tmp_path):
+    from backend import api, main
+    from backend.preview import preview_cache
+
+    main.app.dependency_overrides[api.get_client] = lambda: None
+    client = SimpleNamespace(datasites=tmp_path)
+    with patch("backend.api.get_datasets_collection", side_effect=catalog.frozen):
+        with patch("backend.preview.load_client", return_value=client):
+            yield TestClient(main.app)
+    main.app.dependency_overrides.clear()
+    preview_cache.clear()
+
+
+def test_unseeded_samples_are_random_and_repeatable(api, catalog, tmp_path):
+    dataset = catalog.get("alice@example.com", "crop_yield")
+    directory = mock_dir(tmp_path, dataset.email, dataset.name)
+    directory.mkdir(parents=True)
+    (directory / "data.csv").write_text("x\n" + "\n".join(map(str, range(1000))))
+    url = f"/api/v1/datasets/{dataset.id}/preview"
+
+    samples = [api.get(url, params={"sample": True, "n": 5}).json() for _ in range(3)]
+    assert len({tuple(map(tuple, sample["rows"])) for sample in samples}) == 3
+    # The seed drawn for a sample reproduces it
+    again = api.get(url, params={"sample": True, "n": 5, "seed": samples[0]["seed"]}).json()
+    assert again == samples[0]
+
+    head = api.get(url, params={"n": 2}).json()
+    assert head["rows"] == [[0], [1]] and head["seed"] is None
+
+
+def listing(api, **params):
+    response = api.get("/api/v1/datasets", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_cursor_pagination_reaches_the_end(api):
+    emails, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": 2, "sort": "-email", "fields": "email"}
+        body = listing(api, **params, **({"cursor": cursor} if cursor else {}))
+        assert body["total_count"] == 3
+        emails += [dataset["email"] for dataset in body["datasets"]]
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert emails == ["carol@uni.edu", "bob@example.com", "alice@example.com"]
+    assert pages == 2
+    # A page that ends exactly on the last dataset is the last page
+    assert listing(api, limit=3)["next_cursor"] is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        base64.urlsafe_b64encode(b"[1, 2]").decode(),
+        base64.urlsafe_b64encode(json.dumps({"sort": "name"}).encode()).decode(),
+        base64.urlsafe_b64encode(json.dumps({"sort": "name", "after": [1]}).encode()).decode(),
+    ],
+)
+def test_invalid_cursors_are_rejected(api, cursor):
+    response = api.get("/api/v1/datasets", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_cursors_are_bound_to_their_sort_order(api):
+    cursor = listing(api, limit=1, sort="email")["next_cursor"]
+    response = api.get("/api/v1/datasets", params={"cursor": cursor, "sort": "-email"})
+    assert response.status_code == 400
+    assert "different sort order" in response.json()["detail"]
+
+
+def test_pages_stay_consistent_when_the_catalog_changes(api, catalog):
+    first = listing(api, limit=2, fields="name")
+    assert [dataset["name"] for dataset in first["datasets"]] == ["census", "crop_yield"]
+
+    # Datasets are added before and after the cursor, and one not yet seen is removed
+    publish(
+        catalog,
+        [
+            Dataset("dave@example.com", "airports"),
+            *catalog.to_list()[:2],
+            Dataset("erin@example.com", "dew_point"),
+        ],
+    )
+    second = listing(api, limit=2, fields="name", cursor=first["next_cursor"])
+    assert [dataset["name"] for dataset in second["datasets"]] == ["dew_point"]
+    assert second["total_count"] == 4 and second["next_cursor"] is None
+
+
+def test_conditional_requests_answer_304_without_a_body(api):
+    response = api.get("/api/v1/datasets")
+    etag, last_modified = response.headers["ETag"], response.headers["Last-Modified"]
+
+    for headers in (
+        {"If-None-Match": etag},
+        {"If-None-Match": f'"0-0", W/{etag}'},
+        {"If-Modified-Since": last_modified},
+    ):
+        cached = api.get("/api/v1/datasets", headers=headers)
+        assert cached.status_code == 304, headers
+        assert cached.content == b""
+        assert cached.headers["ETag"] == etag
+
+    assert api.get("/api/v1/datasets", headers={"If-None-Match": '"0-0"'}).status_code == 200
+    stale = "Mon, 01 Jan 2001 00:00:00 GMT"
+    assert api.get("/api/v1/datasets", headers={"If-Modified-Since": stale}).status_code == 200
+
+
+def test_etag_changes_after_a_refresh(api, catalog):
+    etag = api.get("/api/v1/datasets").headers["ETag"]
+
+    publish(catalog, catalog.to_list()[:1])
+    response = api.get("/api/v1/datasets", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["total_count"] == 1
+    assert api.get("/api/v1/datasets/facets").headers["ETag"] == response.headers["ETag"]
+
+
+def read_stream(catalog, on_ready, settings=None):
+    """Messages of an NDJSON catalog stream, calling ``on_ready()`` after the ``ready`` one"""
+    from backend import api
+
+    async def run():
+        messages = []
+        stream = api._catalog_stream(sse=False)
+        try:
+            async for message in stream:
+                messages.append(json.loads(message))
+                if messages[-1]["type"] == "ready":
+                    on_ready()
+                elif messages[-1]["type"] in ("generation", "reset"):
+                    break
+        finally:
+            await stream.aclose()
+        return messages
+
+    with patch("backend.api.subscribe_catalog", catalog.subscribe):
+        with patch("backend.api.get_datasets_collection", side_effect=catalog.frozen):
+            if settings is not None:
+                with patch("backend.api.get_settings", return_value=settings):
+                    return asyncio.run(asyncio.wait_for(run(), 10))
+            return asyncio.run(asyncio.wait_for(run(), 10))
+
+
+def test_stream_sends_the_catalog_then_live_events(catalog):
+    def on_ready():
+        catalog._events.emit(
+            [
+                CatalogEvent(ADD, "dave@example.com", ("airports",)),
+                CatalogEvent(GENERATION, generation=3, total_count=4),
+            ]
+        )
+
+    messages = read_stream(catalog, on_ready)
+
+    assert [(m["type"], m.get("email")) for m in messages] == [
+        ("add", "alice@example.com"),
+        ("add", "bob@example.com"),
+        ("add", "carol@uni.edu"),
+        ("ready", None),
+        ("add", "dave@example.com"),
+        ("generation", None),
+    ]
+    assert messages[4]["datasets"][0]["name"] == "airports"
+    assert messages[5] == {"type": "generation", "generation": 3, "total_count": 4}
+
+
+def test_slow_stream_clients_are_reset(catalog):
+    from backend.config import get_settings
+
+    settings = get_settings().model_copy(update={"stream_queue_size": 2})
+    events = [CatalogEvent(ADD, "dave@example.com", (f"d{i}",)) for i in range(5)]
+
+    messages = read_stream(catalog, lambda: catalog._events.emit(events), settings)
+
+    # Told to resync instead of silently missing events
+    live = [m["type"] for m in messages[4:]]
+    assert live[-1] == "reset" and live.count("add") < len(events)
+
+
+def test_snapshot_builder_streams_published_generations(catalog, tmp_path, monkeypatch):
+    from backend import utils
+
+    for name in ("_snapshot_catalog", "_catalog_events", "_publisher"):
+        monkeypatch.setattr(utils, name, None)
+    watcher = SimpleNamespace(stop=lambda: None)
+    monkeypatch.setattr(catalog, "watch", lambda on_change: watcher, raising=False)
+    monkeypatch.setattr(utils.syd, "datasets", catalog)
+
+    role, stop = utils.start_catalog(str(tmp_path), check_interval=0.01)
+    events = []
+    unsubscribe = utils.subscribe_catalog(events.append)
+    try:
+        assert role == "snapshot builder"
+        # Local discovery events are not streamed until they are published
+        catalog._events.emit([CatalogEvent(ADD, "dave@example.com", ("airports",))])
+        publish(catalog, [*catalog.to_list(), Dataset("erin@example.com", "dew_point")])
+        utils._publisher.publish()
+        deadline = time.monotonic() + 5
+        while not any(event.kind == GENERATION for event in events):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        unsubscribe()
+        stop()
+
+    assert [(event.kind, event.email) for event in events] == [
+        (ADD, "erin@example.com"),
+        (GENERATION, None),
+    ]
+    assert events[-1].generation == utils.get_datasets_collection().generation == 2
+
+
+def test_live_events_are_serialized_once_off_the_event_loop():
+    from backend import api
+
+    event = CatalogEvent(ADD, "dave@example.com", ("airports",))
+    threads = []
+
+    def event_json(event):
+        threads.append(threading.current_thread())
+        return b"{}"
+
+    async def run():
+        # Every stream subscribed to the catalog receives the same event object
+        return await asyncio.gather(*(api._event_message(event) for _ in range(3)))
+
+    with patch("backend.api._event_json", side_effect=event_json):
+        assert asyncio.run(run()) == [b"{}"] * 3
+    assert len(threads) == 1 and threads[0] is not threading.main_thread()
+
+
+def test_ranked_search_returns_the_best_matches(api, catalog):
+    publish(
+        catalog,
+        [*catalog.to_list(), Dataset("dave@example.com", "weather_stations")],
+    )
+
+    def search(**body):
+        response = api.post("/api/v1/datasets/search", json={"ranked": True, **body})
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    # Typo-tolerant, most relevant first, cut at the limit
+    best = search(keyword="wether", limit=1, fields=["name"])
+    assert [dataset["name"] for dataset in best["datasets"]] == ["weather"]
+    assert best["total_count"] == 1 and best["next_cursor"] is None
+    names = [dataset["name"] for dataset in search(keyword="wether")["datasets"]]
+    assert names == ["weather", "weather_stations"]
+    assert search(keyword="wether", fuzzy=False)["datasets"] == []
+
+    response = api.post(
+        "/api/v1/datasets/search", json={"keyword": "x", "ranked": True, "cursor": "abc"}
+    )
+    assert response.status_code == 400
+
+    # A POST is never answered 304, whatever the client has cached
+    etag = api.get("/api/v1/datasets").headers["ETag"]
+    response = api.post(
+        "/api/v1/datasets/search",
+        json={"keyword": "wether", "ranked": True},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 200 and response.json()["total_count"] == 2
+
+
+def test_get_dataset_by_id(api, catalog):
+    dataset = catalog.get("bob@example.com", "census")
+
+    response = api.get(f"/api/v1/datasets/{dataset.id}", params={"fields": "name,syft_url"})
+    assert response.status_code == 200
+    assert response.json()["id"] == dataset.id
+    assert response.json()["syft_url"] == dataset.syft_url
+    assert "ETag" in response.headers
+
+    missing = api.get("/api/v1/datasets/no-such-dataset")
+    assert missing.status_code == 404
+    assert "no-such-dataset" in missing.json()["detail"]
@@ -0,0 +1,100 @@
+"""Tests for the persistent dataset catalog cache."""
+
+import os
+
+import pytest
+
+from syft_datasets import DatasetCollection
+from syft_datasets.cache import RDS_DATASET_STORE, CatalogCache, datasite_signature
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CatalogCache(tmp_path / "catalog.sqlite3")
+    yield cache
+    cache.close()
+
+
+def test_get_put_roundtrip(cache):
+    """Stored names are returned for a matching signature only."""
+    cache.put("alice@example.com", "sig-1", ["a", "b"])
+
+    assert cache.get("alice@example.com", "sig-1") == ["a", "b"]
+    assert cache.get("alice@example.com", "sig-2") is None
+    assert cache.get("bob@example.com", "sig-1") is None
+
+
+def test_ttl_expiry(cache):
+    """Entries older than the TTL are misses and get evicted."""
+    cache.put("alice@example.com", "sig", ["a"])
+    cache.ttl = -1
+
+    assert cache.get("alice@example.com", "sig") is None
+    assert cache.evict() == 1
+    assert len(cache) == 0
+
+
+def test_size_bounded_eviction(cache):
+    """Only the most recently used entries survive eviction."""
+    cache.max_entries = 2
+    for email in ["a@x.com", "b@x.com", "c@x.com"]:
+        cache.put(email, "sig", [])
+    cache.get("a@x.com", "sig")
+
+    cache.evict()
+
+    assert len(cache) == 2
+    assert cache.get("a@x.com", "sig") == []
+    assert cache.get("c@x.com", "sig") == []
+
+
+def test_cache_persists_across_instances(tmp_path):
+    """A new cache object sees entries written by a previous process."""
+    CatalogCache(tmp_path / "catalog.sqlite3").put("a@x.com", "sig", ["d"])
+
+    assert CatalogCache(tmp_path / "catalog.sqlite3").get("a@x.com", "sig") == ["d"]
+
+
+def test_signature_tracks_manifest_changes(tmp_path):
+    """Adding or touching a dataset record changes the datasite signature."""
+    manifest = tmp_path / "alice@example.com" / RDS_DATASET_STORE
+    manifest.mkdir(parents=True)
+    record = manifest / "one.yaml"
+    record.write_text("name: one")
+    before = datasite_signature(tmp_path, "alice@example.com")
+
+    os.utime(record, ns=(0, record.stat().st_mtime_ns + 10**9))
+
+    assert datasite_signature(tmp_path, "alice@example.com") != before
+    assert datasite_signature(tmp_path, "missing@example.com") == "missing"
+
+
+def test_warm_start_and_refresh(syftbox):
+    """Unchanged datasites are served from the cache; refresh re-queries changed ones."""
+    syftbox.add_datasite("alice@example.com", ["a1"])
+    syftbox.add_datasite("bob@example.com", ["b1", "b2"])
+
+    with syftbox.patched():
+        cold = DatasetCollection()
+        assert [ds.name for ds in cold] == ["a1", "b1", "b2"]
+        assert sorted(syftbox.calls) == ["alice@example.com", "bob@example.com"]
+
+        syftbox.calls.clear()
+        warm = DatasetCollection()
+        assert [ds.name for ds in warm] == ["a1", "b1", "b2"]
+        assert syftbox.calls == []
+
+        syftbox.add_datasite("bob@example.com", ["b3"])
+        warm.refresh()
+        assert [ds.name for ds in warm] == ["a1", "b3"]
+        assert syftbox.calls == ["bob@example.com"]
+
+        syftbox.calls.clear()
+        warm.refresh(force=True)
+        assert sorted(syftbox.calls) == ["alice@example.com", "bob@example.com"]
+
+
+def test_refresh_requires_loaded_collection():
+    """Collections built from a list of datasets cannot be refreshed."""
+    with pytest.raises(ValueError):
+        DatasetCollection(datasets=[]).refresh()
@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from syft_datasets import Dataset, DatasetCollection
+from syft_datasets.monitor import AppMonitor
 
 
 class TestDataset:
@@ -21,6 +22,13 @@ class TestDataset:
         assert dataset.name == "test_dataset"
         assert dataset.syft_url == "syft://test@example.com/private/datasets/test_dataset"
 
+    def test_dataset_id_is_stable(self):
+        """Test Dataset ids are derived from the dataset's identity."""
+        dataset = Dataset(email="test@example.com", dataset_name="test_dataset")
+
+        assert dataset.id == Dataset("test@example.com", "test_dataset").id
+        assert dataset.id != Dataset("test@example.com", "other_dataset").id
+
     def test_dataset_str_repr(self):
         """Test Dataset string representation."""
         dataset = Dataset(
@@ -197,11 +205,9 @@ class TestDatasetCollection:
         mock_client.load.return_value = mock_client_instance
 
         # Test that it attempts to check connection
-        with patch("syft_datasets.init_session"), patch("requests.get") as mock_get:
-            mock_get.return_value.status_code = 200
-            mock_get.return_value.text = "go1.21"
-
-            DatasetCollection()
+        with patch("syft_datasets.init_session"):
+            with patch.object(AppMonitor, "_request", return_value=True):
+                DatasetCollection()
             # Should not raise an exception
 
 
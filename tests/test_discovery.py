@@ -0,0 +1,92 @@
+"""Tests for concurrent datasite discovery."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from syft_datasets.discovery import discover_datasites
+
+
+def make_session_factory(datasets_by_email, delays=None, errors=None):
+    """Build a fake ``init_session`` returning sessions with named datasets."""
+    delays = delays or {}
+    errors = errors or {}
+
+    def factory(host):
+        time.sleep(delays.get(host, 0))
+        if host in errors:
+            raise errors[host]
+        session = Mock()
+        session.datasets = []
+        for name in datasets_by_email.get(host, []):
+            dataset = Mock()
+            dataset.name = name
+            session.datasets.append(dataset)
+        return session
+
+    return factory
+
+
+def test_results_are_sorted_by_email():
+    """Results come back in email order regardless of completion order."""
+    factory = make_session_factory(
+        {"c@x.com": ["c1"], "a@x.com": ["a1", "a2"], "b@x.com": ["b1"]},
+        delays={"a@x.com": 0.1},
+    )
+
+    report = discover_datasites(["c@x.com", "a@x.com", "b@x.com"], factory, max_workers=3)
+
+    assert [r.email for r in report.results] == ["a@x.com", "b@x.com", "c@x.com"]
+    assert [ds.name for ds in report.results[0].datasets] == ["a1", "a2"]
+    assert not report.failed
+
+
+def test_failures_are_reported():
+    """Datasites raising inside init_session are reported instead of dropped."""
+    factory = make_session_factory(
+        {"ok@x.com": ["d"]}, errors={"bad@x.com": RuntimeError("no rds app")}
+    )
+
+    report = discover_datasites(["ok@x.com", "bad@x.com"], factory)
+
+    assert [r.email for r in report.failed] == ["bad@x.com"]
+    assert report.failed[0].error == "no rds app"
+    assert "bad@x.com" in report.summary()
+
+
+def test_timeouts_and_slow_datasites():
+    """Datasites overrunning the timeout are abandoned, slow ones are flagged."""
+    release = threading.Event()
+
+    def factory(host):
+        if host == "hung@x.com":
+            release.wait(5)
+        elif host == "slow@x.com":
+            time.sleep(0.15)
+        session = Mock()
+        session.datasets = []
+        return session
+
+    start = time.monotonic()
+    report = discover_datasites(
+        ["hung@x.com", "slow@x.com", "fast@x.com"],
+        factory,
+        timeout=0.5,
+        slow_threshold=0.1,
+    )
+    release.set()
+
+    assert time.monotonic() - start < 2
+    assert [r.email for r in report.failed] == ["hung@x.com"]
+    assert report.failed[0].timed_out
+    assert [r.email for r in report.slow] == ["slow@x.com"]
+
+
+def test_results_are_reported_as_they_complete():
+    """on_result sees fast datasites before slow ones."""
+    factory = make_session_factory({"a@x.com": ["a1"], "b@x.com": ["b1"]}, delays={"a@x.com": 0.2})
+    seen = []
+
+    discover_datasites(["a@x.com", "b@x.com"], factory, on_result=lambda r: seen.append(r.email))
+
+    assert seen == ["b@x.com", "a@x.com"]
@@ -0,0 +1,128 @@
+"""Tests for catalog change events."""
+
+import shutil
+import threading
+
+from syft_datasets import DatasetCollection, _LazyDatasetCollection
+from syft_datasets.events import ADD, GENERATION, REMOVE, CatalogEvent, datasite_events
+from syft_datasets.watcher import CatalogWatcher
+
+
+def test_datasite_events_diff_names():
+    events = datasite_events("a@x.com", ["a1", "a2"], ["a2", "a3"])
+
+    assert events == [
+        CatalogEvent(ADD, "a@x.com", ("a3",)),
+        CatalogEvent(REMOVE, "a@x.com", ("a1",)),
+    ]
+    assert datasite_events("a@x.com", ["a1"], ["a1"]) == []
+
+
+def test_initial_load_is_published_per_datasite(syftbox):
+    """Subscribing to the global catalog does not load it, and sees every datasite arrive."""
+    syftbox.add_datasite("alice@example.com", ["a1", "a2"])
+    syftbox.add_datasite("bob@example.com", ["b1"])
+    catalog = _LazyDatasetCollection()
+    events = []
+
+    catalog.subscribe(events.append)
+    assert not catalog.loaded and len(catalog.current()) == 0
+    with syftbox.patched():
+        assert len(catalog) == 3
+
+    assert sorted((e for e in events if e.kind == ADD), key=lambda e: e.email) == [
+        CatalogEvent(ADD, "alice@example.com", ("a1", "a2")),
+        CatalogEvent(ADD, "bob@example.com", ("b1",)),
+    ]
+    assert events[-1] == CatalogEvent(GENERATION, generation=1, total_count=3)
+
+
+def test_updates_are_published(syftbox):
+    syftbox.add_datasite("alice@example.com", ["a1"])
+    syftbox.add_datasite("bob@example.com", ["b1"])
+    with syftbox.patched():
+        collection = DatasetCollection(use_cache=False)
+        events = []
+        unsubscribe = collection.subscribe(events.append)
+
+        syftbox.add_datasite("bob@example.com", ["b2"])
+        shutil.rmtree(syftbox.datasites / "alice@example.com")
+        CatalogWatcher(collection, use_watchdog=False).check()
+
+        assert events == [
+            CatalogEvent(ADD, "bob@example.com", ("b2",)),
+            CatalogEvent(REMOVE, "bob@example.com", ("b1",)),
+            CatalogEvent(REMOVE, "alice@example.com", ("a1",)),
+            CatalogEvent(GENERATION, generation=2, total_count=1),
+        ]
+
+        unsubscribe()
+        syftbox.add_datasite("bob@example.com", ["b3"])
+        CatalogWatcher(collection, use_watchdog=False).check()
+        assert len(events) == 4
+
+
+def test_generation_last_modified_and_events_advance_together(syftbox):
+    syftbox.add_datasite("alice@example.com", ["a1"])
+    with syftbox.patched():
+        collection = DatasetCollection(use_cache=False)
+        seen = []
+
+        def on_event(event):
+            if event.kind == GENERATION:
+                # By the time the event fires, the collection shows that generation
+                seen.append((event.generation, collection.generation, collection.last_modified))
+
+        collection.subscribe(on_event)
+        for version in range(2, 5):
+            syftbox.add_datasite("alice@example.com", [f"a{version}"])
+            collection.refresh()
+
+    assert [(event, current) for event, current, _ in seen] == [(2, 2), (3, 3), (4, 4)]
+    modified = [last_modified for _, _, last_modified in seen]
+    assert modified == sorted(modified)
+    assert collection.last_modified == modified[-1]
+
+
+def test_refresh_during_a_listing_never_mixes_generations(syftbox):
+    def publish(version):
+        syftbox.add_datasite("alice@example.com", [f"v{version}_{i:02}" for i in range(40)])
+
+    publish(0)
+    with syftbox.patched():
+        collection = DatasetCollection(use_cache=False)
+
+        # A listing in progress keeps the generation it started on
+        rows = iter(collection)
+        view = collection.frozen()
+        first, after = view.page(10)
+        assert next(rows).name == "v0_00"
+        publish(1)
+        collection.refresh()
+        second, _ = view.page(10, after=after)
+        assert {ds.name[:2] for ds in [*first, *second, *rows]} == {"v0"}
+        assert view.generation == 1 and collection.generation == 2
+
+        # Readers racing the watcher only ever see one generation at a time
+        stop = threading.Event()
+        mixed = []
+
+        def read():
+            while not stop.is_set():
+                view = collection.frozen()
+                names = {ds.name.split("_")[0] for ds in view}
+                if len(names) != 1 or names != {f"v{view.generation - 1}"}:
+                    mixed.append((view.generation, names))
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for version in range(2, 12):
+            publish(version)
+            collection.refresh()
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+    assert mixed == []
+    assert collection.generation == 12
@@ -0,0 +1,74 @@
+"""Tests for the pandas-backed catalog queries."""
+
+import warnings
+
+import pytest
+
+from syft_datasets import Dataset, DatasetCollection
+
+
+@pytest.fixture
+def collection():
+    return DatasetCollection(
+        datasets=[
+            Dataset("alice@openmined.org", "crop_yield"),
+            Dataset("bob@example.com", "Crop_Census"),
+            Dataset("alice@openmined.org", "health_records"),
+            Dataset("carol@Uni.edu", "weather"),
+        ]
+    )
+
+
+def test_to_frame(collection):
+    """The frame has one row per dataset, in collection order."""
+    frame = collection.to_frame()
+
+    assert list(frame.columns) == ["email", "name", "domain", "syft_url", "tags"]
+    assert list(frame["name"]) == ["crop_yield", "Crop_Census", "health_records", "weather"]
+    assert frame["syft_url"][0] == "syft://alice@openmined.org/private/datasets/crop_yield"
+    assert list(frame["domain"]) == ["openmined.org", "example.com", "openmined.org", "uni.edu"]
+    assert list(collection[1:3].to_frame()["name"]) == ["Crop_Census", "health_records"]
+    assert list(collection[:2].to_frame()["name"]) == ["crop_yield", "Crop_Census"]
+
+
+def test_query_single_filters(collection):
+    """Each filter matches like its Python-loop equivalent."""
+    assert [ds.name for ds in collection.query(name_contains="CROP")] == [
+        "crop_yield",
+        "Crop_Census",
+    ]
+    assert len(collection.query(email_regex=r"^(alice|carol)@")) == 3
+    assert [ds.email for ds in collection.query(domain="UNI.EDU")] == ["carol@Uni.edu"]
+    assert len(collection.query(tags=["example.com", "uni.edu"])) == 2
+
+
+def test_email_regex_groups_do_not_warn(collection):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert len(collection.query(email_regex=r"(bob|carol)@")) == 2
+
+
+def test_query_combined_filters_return_existing_datasets(collection):
+    """Composite filters intersect, and results are the collection's own Dataset objects."""
+    result = collection.query(domain="openmined.org", name_contains="crop")
+
+    assert [ds.name for ds in result] == ["crop_yield"]
+    assert result[0] is collection[0]
+    assert "domain='openmined.org'" in result._search_info
+
+
+def test_query_on_a_view(collection):
+    """Queries on a filtered collection only consider that collection's rows."""
+    view = collection.filter_by_email("alice")
+
+    assert [ds.name for ds in view.query(name_contains="records")] == ["health_records"]
+    assert len(view.query(domain="example.com")) == 0
+
+
+def test_query_on_a_prefix_slice(collection):
+    """A slice starting at the first row is not mistaken for the whole catalog."""
+    prefix = collection[:2]
+
+    assert [ds.name for ds in prefix.query(name_contains="crop")] == ["crop_yield", "Crop_Census"]
+    assert len(prefix.query(domain="uni.edu")) == 0
+    assert len(prefix.query()) == 2
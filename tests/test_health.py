@@ -0,0 +1,119 @@
+"""Tests for datasite health tracking and the circuit breaker."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from syft_datasets import DatasetCollection
+from syft_datasets.cache import CatalogCache
+from syft_datasets.discovery import DatasiteResult
+from syft_datasets.health import DEGRADED, HALF_OPEN, OK, OPEN, HealthTracker
+from syft_datasets.watcher import CatalogWatcher
+
+
+def failure(email="bad@x.com"):
+    return DatasiteResult(email, elapsed=1.0, error="boom")
+
+
+def test_circuit_opens_after_threshold():
+    tracker = HealthTracker(failure_threshold=2, base_backoff=60)
+
+    tracker.record(failure(), "sig")
+    assert tracker.state("bad@x.com") == DEGRADED
+    assert tracker.should_query("bad@x.com", "sig")
+
+    tracker.record(failure(), "sig")
+    assert tracker.state("bad@x.com") == OPEN
+    assert not tracker.should_query("bad@x.com", "sig")
+    # A datasite that changed on disk may have been fixed
+    assert tracker.should_query("bad@x.com", "new-sig")
+
+
+def test_backoff_doubles_and_success_closes():
+    tracker = HealthTracker(failure_threshold=1, base_backoff=10, max_backoff=25)
+
+    with patch("syft_datasets.health.time.time", return_value=1000.0):
+        tracker.record(failure())
+        assert tracker.get("bad@x.com").retry_at == 1010.0
+        tracker.record(failure())
+        assert tracker.get("bad@x.com").retry_at == 1020.0
+        tracker.record(failure())
+        assert tracker.get("bad@x.com").retry_at == 1025.0
+
+    with patch("syft_datasets.health.time.time", return_value=2000.0):
+        assert tracker.state("bad@x.com") == HALF_OPEN
+        assert tracker.should_query("bad@x.com")
+
+    tracker.record(DatasiteResult("bad@x.com", elapsed=0.1))
+    assert tracker.state("bad@x.com") == OK
+    assert tracker.get("bad@x.com").failures == 0
+
+
+def test_health_is_persisted(tmp_path):
+    cache = CatalogCache(tmp_path / "catalog.sqlite3")
+    tracker = HealthTracker(cache=cache, failure_threshold=1)
+    tracker.record(failure())
+
+    reloaded = HealthTracker(cache=CatalogCache(tmp_path / "catalog.sqlite3"), failure_threshold=1)
+    assert reloaded.state("bad@x.com") == OPEN
+
+    reloaded.record(DatasiteResult("bad@x.com"))
+    assert cache.get_health() == {}
+
+
+@pytest.fixture
+def flaky(syftbox, monkeypatch):
+    syftbox.add_datasite("alice@example.com", ["a1"])
+    syftbox.add_datasite("bad@example.com", ["x1"])
+    healthy = syftbox.init_session
+
+    def init_session(host):
+        if host == "bad@example.com":
+            syftbox.calls.append(host)
+            raise ConnectionError("unreachable")
+        return healthy(host)
+
+    monkeypatch.setattr(syftbox, "init_session", init_session)
+    return syftbox
+
+
+def test_failing_datasites_are_skipped(flaky):
+    with flaky.patched():
+        collection = DatasetCollection()
+        collection.refresh()
+        flaky.calls.clear()
+
+        collection.refresh()
+
+    assert flaky.calls == []
+    assert collection.discovery_report.skipped == ["bad@example.com"]
+    status = {s.email: s for s in collection.datasite_status()}
+    assert status["alice@example.com"].state == OK
+    assert status["alice@example.com"].datasets == 1
+    assert status["bad@example.com"].state == OPEN
+    assert status["bad@example.com"].last_error == "unreachable"
+
+
+def test_watcher_retries_failed_datasites_once_their_backoff_expires(flaky, monkeypatch):
+    with flaky.patched():
+        collection = DatasetCollection(use_cache=False)
+        assert "bad@example.com" not in collection._signatures
+
+        watcher = CatalogWatcher(collection, use_watchdog=False)
+        # Retried while degraded; the second failure opens the circuit
+        assert watcher.check() == ({"bad@example.com"}, set())
+        flaky.calls.clear()
+        generation = collection.generation
+        assert watcher.check() == (set(), set())
+        assert flaky.calls == [] and collection.generation == generation
+
+    # The datasite recovers, and is probed once its backoff is over
+    monkeypatch.delattr(flaky, "init_session")
+    with flaky.patched():
+        with patch("syft_datasets.health.time.time", return_value=time.time() + 3600):
+            assert watcher.check() == ({"bad@example.com"}, set())
+
+    assert [ds.name for ds in collection] == ["a1", "x1"]
+    assert collection.datasite_status()[1].state == OK
+    assert watcher.check() == (set(), set())
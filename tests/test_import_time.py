@@ -0,0 +1,56 @@
+"""Import-time regression guards for syft_datasets."""
+
+import json
+import subprocess
+import sys
+from unittest.mock import patch
+
+import syft_datasets
+
+# Generous budget for slow CI runners; importing syft_core/syft_rds/pandas alone takes ~1s
+IMPORT_TIME_BUDGET = 0.5
+HEAVY_MODULES = ["syft_core", "syft_rds", "pandas", "tabulate", "requests"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import syft_datasets
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _import_in_subprocess():
+    output = subprocess.check_output([sys.executable, "-c", _PROBE], text=True)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_dependencies():
+    """Importing the package must not pull in syft_core, syft_rds, pandas, ..."""
+    result = _import_in_subprocess()
+
+    loaded = [name for name in HEAVY_MODULES if name in result["modules"]]
+    assert loaded == []
+
+
+def test_import_time_budget():
+    """Importing the package stays well below the cost of its dependencies."""
+    result = _import_in_subprocess()
+
+    assert result["elapsed"] < IMPORT_TIME_BUDGET
+
+
+def test_global_datasets_loads_on_first_access():
+    """The global collection is only discovered once, on first use."""
+    proxy = syft_datasets._LazyDatasetCollection()
+    loaded = syft_datasets.DatasetCollection(datasets=[syft_datasets.Dataset("a@x.com", "d")])
+
+    with patch("syft_datasets.DatasetCollection", return_value=loaded) as mock_collection:
+        assert mock_collection.call_count == 0
+        assert len(proxy) == 1
+        assert proxy[0].name == "d"
+        assert [ds.email for ds in proxy] == ["a@x.com"]
+        assert "a@x.com" in proxy._repr_html_()
+        assert proxy.list_unique_emails() == ["a@x.com"]
+
+    assert mock_collection.call_count == 1
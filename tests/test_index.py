@@ -0,0 +1,118 @@
+"""Tests for the dataset search indexes."""
+
+import random
+
+from syft_datasets import Dataset, DatasetCollection
+from syft_datasets.index import RankedIndex, SearchIndex, edit_distance, tokenize
+from syft_datasets.store import CatalogStore
+
+
+def linear_search(datasets, keyword):
+    keyword = keyword.lower()
+    return [
+        i
+        for i, ds in enumerate(datasets)
+        if keyword in ds.name.lower() or keyword in ds.email.lower()
+    ]
+
+
+def random_datasets(n, seed=0):
+    rng = random.Random(seed)
+    words = ["crop", "Yield", "health", "census", "x", "ab", "weather_2024", "Finance"]
+    domains = ["example.com", "openmined.org", "Uni.EDU"]
+    return [
+        Dataset(
+            f"{rng.choice(['alice', 'bob', 'Carol', 'dan'])}{rng.randint(0, 20)}@{rng.choice(domains)}",
+            "_".join(rng.sample(words, rng.randint(1, 3))),
+        )
+        for _ in range(n)
+    ]
+
+
+def test_index_matches_linear_scan():
+    """Indexed substring search returns exactly what a linear scan returns, in order."""
+    datasets = random_datasets(500)
+    index = SearchIndex([ds.name for ds in datasets], [ds.email for ds in datasets])
+    queries = ["", "c", "ab", "cro", "crop_y", "YIELD", "@uni", "alice1", "2024", "zzz", "h_w"]
+
+    for query in queries:
+        assert index.search(query) == linear_search(datasets, query), query
+        expected = [i for i, ds in enumerate(datasets) if query.lower() in ds.email.lower()]
+        assert index.filter_by_email(query) == expected, query
+
+
+def test_whole_word_search():
+    """Token search matches complete words of names and emails only."""
+    datasets = [
+        Dataset("alice@example.com", "crop_yield"),
+        Dataset("bob@example.com", "cropland"),
+        Dataset("carol@crop.org", "weather"),
+    ]
+
+    collection = DatasetCollection(datasets=datasets)
+
+    assert [ds.name for ds in collection.search("crop", whole_word=True)] == [
+        "crop_yield",
+        "weather",
+    ]
+    assert [ds.name for ds in collection.search("crop")] == ["crop_yield", "cropland", "weather"]
+    assert tokenize("Crop_Yield-2024") == ["crop", "yield", "2024"]
+
+
+def test_index_rebuilt_when_datasets_change():
+    """Replacing the datasets (e.g. on refresh) invalidates the index."""
+    collection = DatasetCollection(datasets=[Dataset("a@x.com", "one")])
+    assert len(collection.search("one")) == 1
+
+    collection._set_rows(CatalogStore.from_datasets([Dataset("a@x.com", "two")]))
+
+    assert len(collection.search("one")) == 0
+    assert len(collection.search("two")) == 1
+
+
+def test_ranked_search_orders_by_relevance_and_tolerates_typos():
+    datasets = [
+        Dataset("alice@example.com", "weather_2024"),
+        Dataset("bob@example.com", "crop_weather_daily_readings_archive"),
+        Dataset("carol@weather.org", "census"),
+        Dataset("dan@example.com", "finance"),
+    ]
+    collection = DatasetCollection(datasets=datasets)
+
+    ranked = collection.search("weather", ranked=True)
+    # Shorter documents (name and email tokens) matching the term rank higher;
+    # non-matches are dropped
+    assert [ds.name for ds in ranked] == [
+        "census",
+        "weather_2024",
+        "crop_weather_daily_readings_archive",
+    ]
+
+    assert [ds.name for ds in collection.search("wether", ranked=True, limit=2)] == [
+        "census",
+        "weather_2024",
+    ]
+    assert len(collection.search("wether", ranked=True, fuzzy=False)) == 0
+    assert [ds.name for ds in collection.search("weather crop", ranked=True, limit=1)] == [
+        "crop_weather_daily_readings_archive"
+    ]
+
+
+def test_fuzzy_expansion_is_bounded_by_token_length():
+    index = RankedIndex([["weather"], ["crop"], ["cro"], ["information"]])
+    assert index.expand("wather") == {"weather": 1}
+    assert index.expand("crp") == {}  # Too short for typos
+    assert index.expand("infromatoin") == {}  # 4 edits
+    assert index.expand("infrmation") == {"information": 1}
+    assert edit_distance("kitten", "sitting", 5) == 3
+    assert edit_distance("kitten", "sitting", 1) == 2
+
+
+def test_ranked_top_k_matches_full_ranking():
+    datasets = random_datasets(300)
+    index = SearchIndex([ds.name for ds in datasets], [ds.email for ds in datasets])
+    for query in ["crop", "yield health", "alice", "finanse"]:
+        full = index.rank(query)
+        assert index.rank(query, limit=5) == full[:5], query
+        scores = [score for _, score in full]
+        assert scores == sorted(scores, reverse=True)
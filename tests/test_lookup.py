@@ -0,0 +1,76 @@
+"""Tests for stable dataset lookups by URL, (email, name) and id."""
+
+import pytest
+
+from syft_datasets import Dataset, DatasetCollection
+from syft_datasets.store import CatalogStore, dataset_id, dataset_url, parse_dataset_url
+
+
+def catalog():
+    return DatasetCollection(
+        datasets=[
+            Dataset("alice@example.com", "crop_yield"),
+            Dataset("bob@example.com", "census"),
+            Dataset("carol@uni.edu", "crop_yield"),
+        ]
+    )
+
+
+def test_lookups_by_every_key():
+    collection = catalog()
+    carol = collection[2]
+
+    assert collection.get("carol@uni.edu", "crop_yield") is carol
+    assert collection.get_by_url(carol.syft_url) is carol
+    assert collection.get_by_id(carol.id) is carol
+    assert collection.get("carol@uni.edu", "census") is None
+    assert collection.get_by_url("syft://carol@uni.edu/public/crop_yield") is None
+    assert collection.get_by_id("not-an-id") is None
+
+
+def test_get_many_resolves_mixed_keys_in_order():
+    collection = catalog()
+    keys = [
+        dataset_url("bob@example.com", "census"),
+        ("alice@example.com", "crop_yield"),
+        dataset_id("carol@uni.edu", "crop_yield"),
+        "syft://nobody@example.com/private/datasets/x",
+    ]
+    found = collection.get_many(keys)
+    assert [ds and ds.email for ds in found] == [
+        "bob@example.com",
+        "alice@example.com",
+        "carol@uni.edu",
+        None,
+    ]
+
+
+def test_unsupported_keys_are_rejected():
+    with pytest.raises(TypeError, match="not int"):
+        catalog().get_many([0])
+
+
+def test_lookups_are_restricted_to_the_collection():
+    collection = catalog()
+    results = collection.search("crop").sort_by("email", descending=True)
+
+    assert results.get("bob@example.com", "census") is None
+    assert results.get("alice@example.com", "crop_yield") is collection[0]
+
+
+def test_keys_survive_a_reload():
+    """Positions shift when datasets are added; URLs keep pointing at the same dataset."""
+    collection = catalog()
+    url = collection[1].syft_url
+
+    collection._set_rows(
+        CatalogStore.from_datasets([Dataset("aaron@example.com", "a"), *collection.to_list()])
+    )
+    assert collection[1].name == "crop_yield"
+    assert collection.get_by_url(url).name == "census"
+
+
+def test_parse_dataset_url():
+    assert parse_dataset_url(dataset_url("a@b.org", "x_y")) == ("a@b.org", "x_y")
+    assert parse_dataset_url("https://a@b.org/private/datasets/x") is None
+    assert parse_dataset_url("syft://a@b.org/private/datasets/") is None
@@ -0,0 +1,96 @@
+"""Tests for filesystem metadata of datasets."""
+
+import os
+
+import pytest
+
+from syft_datasets import DatasetCollection
+from syft_datasets.metadata import MetadataCollector, format_size
+
+
+def write(path, data, mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def datasites(tmp_path):
+    root = tmp_path / "datasites"
+    mock = root / "alice@example.com" / "public" / "datasets" / "crops"
+    write(mock / "data.csv", b"a,b\n1,2\n", mtime=1_000)
+    write(mock / "nested" / "extra.json", b"{}", mtime=2_000)
+    private = root / "alice@example.com" / "private" / "datasets" / "crops"
+    write(private / "data.csv", b"x" * 100, mtime=3_000)
+    return root
+
+
+def test_sizes_timestamps_and_types(datasites):
+    metadata = MetadataCollector(datasites).get("alice@example.com", "crops")
+
+    assert metadata.mock.size == 10 and metadata.mock.files == 2
+    assert metadata.mock.created_at == 1_000
+    assert metadata.private.size == 100
+    assert metadata.size == 110 and metadata.files == 3
+    assert metadata.created_at == 1_000
+    assert metadata.modified_at >= 3_000
+    assert metadata.content_type == "text/csv"
+
+
+def test_missing_dataset_has_no_metadata(datasites):
+    metadata = MetadataCollector(datasites).get("bob@example.com", "crops")
+    assert not metadata.available
+    assert metadata.size == 0 and metadata.content_type is None
+
+
+def test_unchanged_directories_are_not_listed_again(datasites, monkeypatch):
+    collector = MetadataCollector(datasites)
+    collector.get("alice@example.com", "crops")
+
+    listed = []
+    scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path: listed.append(path) or scandir(path))
+    assert collector.get("alice@example.com", "crops").files == 3
+    assert listed == []
+
+    mock = datasites / "alice@example.com" / "public" / "datasets" / "crops"
+    write(mock / "more.csv", b"3,4\n")
+    os.utime(mock, ns=(0, os.stat(mock).st_mtime_ns + 10**9))
+    assert collector.get("alice@example.com", "crops").files == 4
+    assert listed == [str(mock)]
+
+
+def test_collection_metadata_in_batch(syftbox):
+    syftbox.add_datasite("alice@example.com", ["crops", "weather"])
+    write(syftbox.datasites / "alice@example.com/public/datasets/crops/data.csv", b"1234")
+
+    with syftbox.patched():
+        collection = DatasetCollection()
+        by_name = {metadata.name: metadata for metadata in collection.metadata(max_workers=2)}
+        assert collection[0].metadata.size == 4
+
+    assert by_name["crops"].size == 4
+    assert not by_name["weather"].available
+
+
+def test_datasites_dir_is_resolved_once_per_catalog(syftbox):
+    import syft_datasets
+
+    syftbox.add_datasite("alice@example.com", ["crops"])
+    write(syftbox.datasites / "alice@example.com/public/datasets/crops/data.csv", b"1234")
+
+    with syftbox.patched():
+        collection = DatasetCollection()
+        syft_datasets.Client.load.reset_mock()
+
+        assert collection[0].metadata.size == 4
+        assert collection.search("crop")[0].metadata.size == 4
+        assert collection.search("crop").metadata()[0].size == 4
+        assert syft_datasets.Client.load.call_count == 0
+
+
+def test_format_size():
+    assert format_size(512) == "512 B"
+    assert format_size(1536) == "1.5 KB"
+    assert format_size(5 * 1024**3) == "5.0 GB"
@@ -0,0 +1,60 @@
+"""Tests for metrics recording and export."""
+
+import pytest
+
+import syft_datasets as syd
+from syft_datasets import DatasetCollection, metrics
+from syft_datasets.metrics import Counter, Histogram
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+    yield
+    metrics.enable()
+    metrics.reset()
+
+
+def test_histogram_buckets_and_export():
+    histogram = Histogram("test_latency_seconds", "Test latency", labels=["op"], buckets=(0.1, 1))
+    histogram.observe(0.05, op="read")
+    histogram.observe(0.1, op="read")
+    histogram.observe(3, op="read")
+
+    assert histogram.snapshot()["op=read"]["count"] == 3
+    text = metrics.render_prometheus()
+    assert 'test_latency_seconds_bucket{op="read",le="0.1"} 2' in text
+    assert 'test_latency_seconds_bucket{op="read",le="1"} 2' in text
+    assert 'test_latency_seconds_bucket{op="read",le="+Inf"} 3' in text
+    assert 'test_latency_seconds_count{op="read"} 3' in text
+
+
+def test_disabled_metrics_record_nothing():
+    counter = Counter("test_events_total", "Test events")
+    metrics.disable()
+    counter.inc()
+    assert counter.snapshot() is None
+
+    metrics.enable()
+    counter.inc()
+    assert counter.snapshot() == 1
+
+
+def test_discovery_and_cache_are_instrumented(syftbox):
+    syftbox.add_datasite("alice@example.com", ["a1", "a2"])
+    syftbox.add_datasite("bob@example.com", ["b1"])
+
+    with syftbox.patched():
+        DatasetCollection()
+        DatasetCollection()
+
+    stats = syd.stats()
+    assert stats["syd_datasite_query_seconds"]["outcome=ok"]["count"] == 2
+    assert set(stats["syd_datasite_last_query_seconds"]) == {
+        "datasite=alice@example.com",
+        "datasite=bob@example.com",
+    }
+    # The second collection restored both datasites from the catalog cache
+    assert stats["syd_catalog_cache_lookups_total"] == {"result=hit": 2, "result=miss": 2}
+    assert stats["syd_catalog_datasets"] == 3
+    assert stats["syd_catalog_datasites"] == 2
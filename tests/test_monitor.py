@@ -0,0 +1,87 @@
+"""Tests for the cached SyftBox app liveness monitor."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from syft_datasets.monitor import AppMonitor, app_monitor
+
+
+@pytest.fixture
+def app():
+    """Local HTTP server answering like the SyftBox app, counting requests."""
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(self.path)
+            body = b"SyftBox go1.22"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.requests = requests
+    server.url = f"http://127.0.0.1:{server.server_port}/"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_status_is_cached_for_ttl(app):
+    monitor = AppMonitor(app.url, ttl=60)
+
+    first = monitor.status()
+    assert first.running and first.error is None
+    assert monitor.status() is first
+    assert len(app.requests) == 1
+
+    monitor.ttl = 0
+    assert monitor.status() is not first
+    assert len(app.requests) == 2
+
+
+def test_app_down():
+    # Nothing listens on port 9 (discard) of localhost
+    status = AppMonitor("http://127.0.0.1:9/", timeout=0.5).probe()
+
+    assert not status.running
+    assert status.error
+    assert "not running" in str(status)
+
+
+def test_status_without_wait_never_blocks(app):
+    monitor = AppMonitor(app.url)
+    slow = threading.Event()
+
+    def request():
+        slow.wait(5)
+        return True
+
+    with patch.object(monitor, "_request", side_effect=request):
+        start = time.perf_counter()
+        assert monitor.status(wait=False) is None
+        assert time.perf_counter() - start < 0.5
+
+        # A second caller joins the running probe instead of starting another
+        waiter = threading.Thread(target=monitor.probe)
+        waiter.start()
+        slow.set()
+        waiter.join()
+
+    assert monitor.last.running
+    assert monitor.status(wait=False) is monitor.last
+
+
+def test_app_monitor_is_shared_per_url(app):
+    assert app_monitor(app.url) is app_monitor(app.url)
+    assert app_monitor(app.url) is not app_monitor(app.url + "other")
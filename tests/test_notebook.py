@@ -0,0 +1,70 @@
+"""Tests for the virtualized Jupyter rendering of collections."""
+
+import json
+import re
+
+from syft_datasets import Dataset, DatasetCollection
+from syft_datasets.notebook import collection_html
+
+
+def _payload(html):
+    match = re.search(r'<script type="application/json" id="[^"]+">(.*?)</script>', html, re.S)
+    return json.loads(match.group(1))
+
+
+def collection(count, emails=3):
+    return DatasetCollection(
+        datasets=[Dataset(f"user{i % emails}@x.com", f"data_{i}") for i in range(count)]
+    )
+
+
+def test_rows_are_embedded_as_compact_payload():
+    html = collection(5)._repr_html_()
+
+    payload = _payload(html)
+    assert payload["emails"] == ["user0@x.com", "user1@x.com", "user2@x.com"]
+    assert payload["codes"] == [0, 1, 2, 0, 1]
+    assert payload["names"] == [f"data_{i}" for i in range(5)]
+    # Rows are rendered client-side, not as markup
+    assert "<tbody></tbody>" in html
+    assert "(5 total)" in html
+
+
+def test_payload_cannot_break_out_of_its_script():
+    datasets = DatasetCollection(datasets=[Dataset("a@x.com", "</script><b>x</b>")])
+
+    html = datasets._repr_html_()
+
+    assert "</script><b>" not in html
+    assert _payload(html)["names"] == ["</script><b>x</b>"]
+
+
+def test_output_is_capped():
+    datasets = collection(50)
+
+    html = collection_html(datasets._store, datasets._rows, max_rows=10)
+
+    payload = _payload(html)
+    assert len(payload["names"]) == 10
+    assert "first 10 of 50" in payload["note"]
+    # Every method the note suggests exists
+    for method in re.findall(r"\.(\w+)\(\)", payload["note"]):
+        assert callable(getattr(datasets, method)), method
+    assert "(50 total)" in html
+
+
+def test_output_grows_linearly():
+    small = len(collection(1_000)._repr_html_())
+    large = len(collection(10_000)._repr_html_())
+
+    # Only the payload depends on the row count
+    assert large < 11 * small
+
+
+def test_views_render_their_own_rows():
+    view = collection(10).search("data_1")
+
+    payload = _payload(view._repr_html_())
+
+    assert payload["names"] == ["data_1"]
+    assert "data_1" in view._repr_html_()
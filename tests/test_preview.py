@@ -0,0 +1,101 @@
+"""Tests for dataset previews and samples."""
+
+import json
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+from syft_datasets import DatasetCollection, preview
+from syft_datasets.metadata import mock_dir
+
+
+@pytest.fixture
+def mock_data(tmp_path):
+    directory = tmp_path / "mock"
+    directory.mkdir()
+    pd.DataFrame({"id": range(100), "value": [i * 2 for i in range(100)]}).to_csv(
+        directory / "a.csv", index=False
+    )
+    (directory / "b.jsonl").write_text(
+        "\n".join(json.dumps({"id": i, "value": i * 2}) for i in range(100, 150))
+    )
+    (directory / "notes.txt").write_text("not data")
+    return directory
+
+
+def test_preview_reads_only_what_it_needs(mock_data, monkeypatch):
+    read = []
+    iter_chunks = preview.iter_chunks
+    monkeypatch.setattr(
+        preview, "iter_chunks", lambda path, rows: read.append(path.name) or iter_chunks(path, rows)
+    )
+
+    head = preview.preview(mock_data, 5)
+    assert list(head["id"]) == [0, 1, 2, 3, 4]
+    assert read == ["a.csv"]
+
+    # Continues into the next file when the first one is too short
+    assert list(preview.preview(mock_data, 102)["id"][-3:]) == [99, 100, 101]
+
+
+def test_sample_is_reproducible_and_spans_every_file(mock_data, monkeypatch):
+    monkeypatch.setattr(preview, "CHUNK_ROWS", 7)
+
+    first = preview.sample(mock_data, 20, seed=1)
+    assert len(first) == 20
+    assert first.equals(preview.sample(mock_data, 20, seed=1))
+    assert list(first["id"]) == sorted(first["id"])  # reading order
+    assert (first["value"] == first["id"] * 2).all()
+
+    assert len(preview.sample(mock_data, 1000)) == 150
+
+
+def test_sample_is_uniform(tmp_path, monkeypatch):
+    monkeypatch.setattr(preview, "CHUNK_ROWS", 3)
+    pd.DataFrame({"id": range(10)}).to_csv(tmp_path / "data.csv", index=False)
+
+    counts = Counter()
+    for seed in range(2000):
+        counts.update(preview.sample(tmp_path, 2, seed=seed)["id"])
+    # Each row is picked with probability 2/10, i.e. ~400 times
+    assert all(300 < counts[i] < 500 for i in range(10)), counts
+
+
+def test_json_documents_and_errors(tmp_path, monkeypatch):
+    (tmp_path / "rows.json").write_text(json.dumps([{"x": 1}, {"x": 2}]))
+    assert list(preview.preview(tmp_path, 10)["x"]) == [1, 2]
+
+    # Only the leading whitespace is read to tell documents from JSON lines
+    (tmp_path / "rows.json").write_text(" " * 10_000 + json.dumps([{"x": 3}]))
+    assert preview._is_json_document(tmp_path / "rows.json", 10_010)
+    (tmp_path / "empty.json").write_text("")
+    assert not preview._is_json_document(tmp_path / "empty.json", 0)
+    monkeypatch.setattr(preview, "MAX_JSON_DOCUMENT_BYTES", 1000)
+    with pytest.raises(ValueError, match="too large"):
+        preview.preview(tmp_path / "rows.json")
+
+    with pytest.raises(FileNotFoundError):
+        preview.preview(tmp_path / "missing")
+    (tmp_path / "empty").mkdir()
+    with pytest.raises(ValueError):
+        preview.sample(tmp_path / "empty")
+    for read in (preview.preview, preview.sample):
+        with pytest.raises(ValueError, match="at least 1"):
+            read(tmp_path, 0)
+
+
+def test_dataset_preview_uses_mock_data(syftbox):
+    syftbox.add_datasite("alice@example.com", ["crops"])
+    directory = mock_dir(syftbox.datasites, "alice@example.com", "crops")
+    directory.mkdir(parents=True)
+    (directory / "crops.csv").write_text("crop,yield\nwheat,3\nrice,5\n")
+
+    with syftbox.patched():
+        dataset = DatasetCollection().get("alice@example.com", "crops")
+        assert list(dataset.preview(1)["crop"]) == ["wheat"]
+        assert sorted(dataset.sample(5, seed=0)["crop"]) == ["rice", "wheat"]
+        with pytest.raises(ValueError):
+            dataset.preview(-1)
+        with pytest.raises(ValueError):
+            dataset.sample(0)
@@ -0,0 +1,128 @@
+"""Tests for memory-mapped catalog snapshots shared between workers."""
+
+import pytest
+
+from syft_datasets import DatasetCollection
+from syft_datasets.snapshot import (
+    SnapshotCatalog,
+    SnapshotPublisher,
+    current_generation,
+    open_snapshot,
+    write_snapshot,
+)
+from syft_datasets.store import CatalogStore
+
+
+@pytest.fixture
+def store():
+    return CatalogStore.from_datasites(
+        [
+            ("alice@example.com", ["census", "données"], None),
+            ("bob@example.com", [], None),
+            ("carol@example.org", ["census-2020"], None),
+        ]
+    )
+
+
+def test_snapshot_roundtrip(store, tmp_path):
+    """A mapped snapshot exposes the same columns as the store it was written from."""
+    path = write_snapshot(store, tmp_path, generation=1)
+
+    mapped, generation = open_snapshot(path)
+
+    assert generation == 1
+    assert len(mapped) == 3
+    assert mapped.emails == store.emails
+    assert list(mapped.email_codes) == list(store.email_codes)
+    assert list(mapped.names) == ["census", "données", "census-2020"]
+    assert mapped.names[-1] == "census-2020"
+    assert mapped.names[:2] == ["census", "données"]
+    assert list(mapped.lazy) == [1, 1, 1]
+
+
+def test_collection_over_snapshot(store, tmp_path):
+    """Filtering, search and queries work on a collection backed by a snapshot."""
+    mapped, _ = open_snapshot(write_snapshot(store, tmp_path, generation=1))
+    collection = DatasetCollection._view(mapped, range(len(mapped)))
+
+    assert [ds.name for ds in collection.search("census")] == ["census", "census-2020"]
+    assert [ds.email for ds in collection.filter_by_email("carol")] == ["carol@example.org"]
+    assert len(collection.query(domain="example.com")) == 2
+    assert collection[2].syft_url == "syft://carol@example.org/private/datasets/census-2020"
+
+
+def test_snapshot_collection_renders(store, tmp_path):
+    """The notebook table and the text table render straight from the mapped columns."""
+    mapped, _ = open_snapshot(write_snapshot(store, tmp_path, generation=1))
+    collection = DatasetCollection._view(mapped, range(len(mapped)))
+
+    html = collection._repr_html_()
+    assert "census-2020" in html and "données" in html
+    assert "census-2020" in collection.search("census")._repr_html_()
+    assert "census-2020" in collection.to_string()
+
+
+def test_empty_snapshot(tmp_path):
+    mapped, _ = open_snapshot(write_snapshot(CatalogStore(), tmp_path, generation=1))
+
+    assert len(mapped) == 0
+    assert len(DatasetCollection._view(mapped, range(0))) == 0
+
+
+def test_reader_swaps_to_new_generations(store, tmp_path):
+    """Readers pick up newly published generations; old ones are cleaned up."""
+    publisher = SnapshotPublisher(DatasetCollection._view(store, range(len(store))), tmp_path)
+    reader = SnapshotCatalog(tmp_path, check_interval=0)
+
+    assert not reader.wait_until_published(timeout=0)
+    publisher.publish()
+    assert reader.wait_until_published(timeout=0)
+    first = reader.collection
+    assert reader.generation == 1 and len(first) == 3
+    assert first.generation == 1
+
+    for _ in range(4):
+        publisher.publish()
+
+    assert current_generation(tmp_path) == 5
+    assert reader.collection is not first
+    assert reader.generation == 5
+    assert reader.collection.generation == 5
+    assert sorted(p.name for p in tmp_path.glob("catalog-*.snap")) == [
+        "catalog-000000000003.snap",
+        "catalog-000000000004.snap",
+        "catalog-000000000005.snap",
+    ]
+    # A collection still held by a request keeps working after the swap
+    assert [ds.name for ds in first] == ["census", "données", "census-2020"]
+
+
+def test_reader_publishes_generation_diffs(store, tmp_path):
+    write_snapshot(store, tmp_path, generation=1)
+    reader = SnapshotCatalog(tmp_path, check_interval=0)
+    reader.reload()
+    events = []
+    reader.subscribe(events.append)
+
+    updated = CatalogStore.from_datasites(
+        [("alice@example.com", ["census"], None), ("dan@example.com", ["d1"], None)]
+    )
+    write_snapshot(updated, tmp_path, generation=2)
+    reader.reload()
+
+    assert [(e.kind, e.email, e.names) for e in events] == [
+        ("remove", "alice@example.com", ("données",)),
+        ("remove", "carol@example.org", ("census-2020",)),
+        ("add", "dan@example.com", ("d1",)),
+        ("generation", None, ()),
+    ]
+    assert events[-1].generation == 2
+
+
+def test_publisher_continues_existing_generations(store, tmp_path):
+    write_snapshot(store, tmp_path, generation=7)
+
+    publisher = SnapshotPublisher(DatasetCollection._view(store, range(len(store))), tmp_path)
+    publisher.publish()
+
+    assert current_generation(tmp_path) == 8
@@ -0,0 +1,132 @@
+"""Tests for the columnar catalog store and collection views."""
+
+from unittest.mock import patch
+
+import pytest
+
+from syft_datasets import Dataset, DatasetCollection
+from syft_datasets.store import CatalogStore
+
+
+@pytest.fixture
+def store():
+    return CatalogStore.from_datasites(
+        [
+            ("alice@example.com", ["a1", "a2"], ["obj-a1", "obj-a2"]),
+            ("bob@example.com", ["b1"], None),
+        ]
+    )
+
+
+def test_emails_are_stored_once(store):
+    """Each datasite email is kept once and referenced by code from every row."""
+    assert store.emails == ["alice@example.com", "bob@example.com"]
+    assert list(store.email_codes) == [0, 0, 1]
+    assert store.row_emails(range(3)) == ["alice@example.com"] * 2 + ["bob@example.com"]
+
+
+def test_empty_datasites_are_not_listed():
+    """A datasite without datasets contributes no email to the catalog."""
+    store = CatalogStore.from_datasites(
+        [("a@x.com", ["a1"], None), ("empty@x.com", [], None), ("c@x.com", ["c1"], None)]
+    )
+    collection = DatasetCollection._view(store, range(len(store)))
+
+    assert store.emails == ["a@x.com", "c@x.com"]
+    assert list(store.email_codes) == [0, 1]
+    assert collection.list_unique_emails() == ["a@x.com", "c@x.com"]
+    assert collection[1:].list_unique_emails() == ["c@x.com"]
+
+
+def test_views_share_the_store(store):
+    """Filters and slices are row views over the same store, not copies."""
+    collection = DatasetCollection._view(store, range(len(store)))
+
+    filtered = collection.filter_by_email("alice")
+    sliced = filtered[1:]
+
+    assert filtered._store is store and sliced._store is store
+    assert list(filtered._rows) == [0, 1]
+    assert [ds.name for ds in sliced] == ["a2"]
+    assert sliced[0] is collection[1]
+
+
+def test_row_views_are_created_on_demand(store):
+    """Dataset objects are only built for accessed rows, then reused."""
+    collection = DatasetCollection._view(store, range(len(store)))
+    assert store.views == {}
+
+    dataset = collection[0]
+
+    assert dataset.dataset_obj == "obj-a1"
+    assert dataset.syft_url == "syft://alice@example.com/private/datasets/a1"
+    assert store.views == {0: dataset}
+    assert not hasattr(dataset, "__dict__")
+
+
+def test_cached_rows_fetch_dataset_obj_lazily(store):
+    """Rows restored from the catalog cache resolve their syft_rds object on access."""
+    collection = DatasetCollection._view(store, range(len(store)))
+
+    with patch("syft_datasets._fetch_dataset_obj", return_value="obj-b1") as fetch:
+        dataset = collection[2]
+        fetch.assert_not_called()
+        assert dataset.dataset_obj == "obj-b1"
+        assert dataset.dataset_obj == "obj-b1"
+
+    fetch.assert_called_once_with("bob@example.com", "b1")
+
+
+def test_collection_reuses_given_datasets():
+    """Datasets passed to the constructor are returned as-is."""
+    datasets = [Dataset("a@x.com", "one"), Dataset("b@x.com", "two")]
+
+    collection = DatasetCollection(datasets=datasets)
+
+    assert collection[0] is datasets[0]
+    assert collection.search("two")[0] is datasets[1]
+    assert collection.to_list() == datasets
+
+
+def test_sort_by(store):
+    collection = DatasetCollection._view(store, range(len(store)))
+
+    assert [ds.name for ds in collection.sort_by("name", descending=True)] == ["b1", "a2", "a1"]
+    assert [ds.name for ds in collection.search("2").sort_by("email")] == ["a2"]
+    with pytest.raises(ValueError):
+        collection.sort_by("size")
+
+
+def test_page_follows_cursor_across_updates(store):
+    """Pages are keyed on the last dataset seen, so inserted rows do not shift them."""
+    collection = DatasetCollection._view(store, range(len(store)))
+
+    first, after = collection.page(2)
+    assert [ds.name for ds in first] == ["a1", "a2"]
+    assert after == ("a2", "alice@example.com")
+
+    updated = CatalogStore.from_datasites(
+        [
+            ("aaron@example.com", ["a0"], None),
+            ("alice@example.com", ["a1", "a2"], None),
+            ("bob@example.com", ["b1"], None),
+        ]
+    )
+    second, after = DatasetCollection._view(updated, range(len(updated))).page(2, after=after)
+    assert [ds.name for ds in second] == ["b1"]
+    assert after is None
+
+
+def test_facets_are_cached_on_the_store(store):
+    collection = DatasetCollection._view(store, range(len(store)))
+
+    facets = collection.facets()
+
+    assert facets == {
+        "total_count": 3,
+        "emails": {"alice@example.com": 2, "bob@example.com": 1},
+        "domains": {"example.com": 3},
+        "names": ["a1", "a2", "b1"],
+    }
+    assert collection.facets() is facets
+    assert collection.filter_by_email("bob").facets()["total_count"] == 1
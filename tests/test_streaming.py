@@ -0,0 +1,64 @@
+"""Tests for incremental iteration over the federation."""
+
+import asyncio
+import time
+
+import pytest
+
+import syft_datasets as syd
+from syft_datasets import _LazyDatasetCollection
+
+
+@pytest.fixture
+def federation(syftbox, monkeypatch):
+    syftbox.add_datasite("alice@example.com", ["a1", "a2"])
+    syftbox.add_datasite("bob@example.com", ["b1"])
+    syftbox.add_datasite("slow@example.com", ["s1"])
+
+    fast_session = syftbox.init_session
+
+    def init_session(host):
+        if host == "slow@example.com":
+            time.sleep(0.5)
+        return fast_session(host)
+
+    monkeypatch.setattr(syftbox, "init_session", init_session)
+    monkeypatch.setattr(syd, "datasets", _LazyDatasetCollection())
+    with syftbox.patched():
+        yield syftbox
+
+
+def test_stream_yields_every_dataset(federation):
+    names = sorted(ds.name for ds in syd.stream(use_cache=False))
+
+    assert names == ["a1", "a2", "b1", "s1"]
+
+
+def test_stream_stops_early(federation):
+    """The first matches arrive without waiting for the slowest datasite."""
+    start = time.monotonic()
+
+    found = list(syd.stream(lambda ds: ds.email.startswith("bob"), limit=1, use_cache=False))
+
+    assert [ds.name for ds in found] == ["b1"]
+    assert time.monotonic() - start < 0.5
+
+
+def test_stream_serves_cached_datasites_first(federation):
+    list(syd.stream())
+    federation.calls.clear()
+
+    first = next(iter(syd.stream()))
+
+    assert first.name == "a1"
+    assert federation.calls == []
+
+
+def test_astream(federation):
+    async def collect():
+        found = []
+        async for dataset in syd.astream(limit=2, use_cache=False):
+            found.append(dataset.name)
+        return found
+
+    assert len(asyncio.run(collect())) == 2
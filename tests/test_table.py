@@ -0,0 +1,111 @@
+"""Tests for the plain-text table renderer."""
+
+import io
+import time
+
+import pytest
+
+from syft_datasets import Dataset, DatasetCollection
+from syft_datasets.store import CatalogStore
+from syft_datasets.table import DEFAULT_MAX_ROWS
+
+EXPECTED = """\
++---------+-----------------+-------------------+-----------------------------------------------------------+
+|   Index | Email           | Dataset Name      | Syft URL                                                  |
++=========+=================+===================+===========================================================+
+|       0 | alice@x.com     | d                 | syft://alice@x.com/private/datasets/d                     |
++---------+-----------------+-------------------+-----------------------------------------------------------+
+|       1 | bob@example.com | long_dataset_name | syft://bob@example.com/private/datasets/long_dataset_name |
++---------+-----------------+-------------------+-----------------------------------------------------------+"""
+
+
+def large_collection(count, datasites=100):
+    store = CatalogStore.from_datasites(
+        (f"user{d}@x.com", [f"data_{d}_{i}" for i in range(count // datasites)], None)
+        for d in range(datasites)
+    )
+    return DatasetCollection._view(store, range(len(store)))
+
+
+def test_grid_layout():
+    datasets = DatasetCollection(
+        datasets=[Dataset("alice@x.com", "d"), Dataset("bob@example.com", "long_dataset_name")]
+    )
+
+    assert datasets.to_string() == EXPECTED
+    assert str(datasets) == EXPECTED
+
+
+def test_truncates_to_head_and_tail():
+    datasets = large_collection(1_000, datasites=10)
+
+    lines = datasets.to_string(max_rows=4).splitlines()
+
+    indices = [line.split("|")[1].strip() for line in lines if line.startswith("|")]
+    assert indices == ["Index", "0", "1", "...", "998", "999"]
+    assert "1000 datasets, showing the first 2 and last 2" in lines[-1]
+    # Every line of the grid has the same width
+    assert len({len(line) for line in lines[:-1]}) == 1
+
+
+def test_streams_full_dump_to_file():
+    datasets = large_collection(3_000)
+    buffer = io.StringIO()
+
+    assert datasets.to_string(buf=buffer) is None
+
+    assert buffer.getvalue() == datasets.to_string()
+    assert buffer.getvalue().count("\n") == 2 * 3_000 + 2
+
+
+def test_echoing_a_large_collection_is_instant():
+    datasets = large_collection(100_000)
+
+    start = time.perf_counter()
+    text = repr(datasets)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.1
+    assert text.count("syft://") == DEFAULT_MAX_ROWS
+    # Rendering reads the columns directly, without materializing Dataset objects
+    assert datasets._store.views == {}
+
+
+def test_empty_collection():
+    datasets = DatasetCollection(datasets=[])
+    buffer = io.StringIO()
+    datasets.to_string(buf=buffer)
+
+    assert datasets.to_string() == "No datasets available"
+    assert buffer.getvalue() == "No datasets available"
+
+
+@pytest.mark.parametrize(
+    "names",
+    [
+        ["d", "long_dataset_name"],
+        ["2023", "7", "-15"],
+        ["1.5", "10", "2e3", "0.125"],
+        ["1,000", "25"],
+        ["1,000.5", "3", "inf"],
+        ["True", "12"],
+        ["True", "False"],
+        ["42", "forty-two"],
+    ],
+)
+def test_matches_tabulate(names):
+    tabulate = pytest.importorskip("tabulate").tabulate
+    datasets = DatasetCollection(
+        datasets=[Dataset(f"user{i}@x.com", name) for i, name in enumerate(names)]
+    )
+
+    rows = [[i, ds.email, ds.name, ds.syft_url] for i, ds in enumerate(datasets)]
+    headers = ["Index", "Email", "Dataset Name", "Syft URL"]
+    assert datasets.to_string() == tabulate(rows, headers=headers, tablefmt="grid")
+
+
+def test_numeric_names_are_right_aligned():
+    datasets = DatasetCollection(datasets=[Dataset("a@x.com", "7"), Dataset("a@x.com", "2023")])
+
+    cells = [line.split("|")[3] for line in datasets.to_string().splitlines()[1::2]]
+    assert cells == ["   Dataset Name ", "              7 ", "           2023 "]
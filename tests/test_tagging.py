@@ -0,0 +1,83 @@
+"""Tests for taxonomy tagging and the tag index."""
+
+import pytest
+
+from syft_datasets import Dataset, DatasetCollection, set_taxonomy
+from syft_datasets.store import CatalogStore
+from syft_datasets.tagging import DEFAULT_TAXONOMY, Tagger, catalog_tags
+
+
+@pytest.fixture(autouse=True)
+def default_taxonomy():
+    yield
+    set_taxonomy(None)
+
+
+def linear_tags(taxonomy, name):
+    name = name.lower()
+    return tuple(tag for tag, keywords in taxonomy.items() if any(k in name for k in keywords))
+
+
+def test_automaton_matches_keyword_scan():
+    """One pass over a name finds what a scan per keyword finds, overlaps included."""
+    taxonomy = {"a": ["he", "she"], "b": ["hers", "his"], "c": ["s"], "d": ["crop_yield"]}
+    tagger = Tagger(taxonomy)
+    for name in ["ushers", "HIS", "crop_yields", "nothing", "", "shehis", "crop_yiel"]:
+        assert tagger.keyword_tags(name) == linear_tags(taxonomy, name), name
+
+    default = Tagger(DEFAULT_TAXONOMY)
+    assert default.tag("Alice@Uni.EDU", "Student_Health_Records") == (
+        "uni.edu",
+        "healthcare",
+        "education",
+    )
+
+
+def test_tag_index_filters_and_counts():
+    datasets = [
+        Dataset("alice@example.com", "crop_yield"),
+        Dataset("bob@example.com", "patient_records"),
+        Dataset("carol@uni.edu", "school_budget_finance"),
+        Dataset("dan@uni.edu", "weather"),
+    ]
+    collection = DatasetCollection(datasets=datasets)
+
+    assert [ds.name for ds in collection.filter_by_tag("healthcare")] == ["patient_records"]
+    assert [ds.name for ds in collection.filter_by_tag(["agriculture", "FINANCE"])] == [
+        "crop_yield",
+        "school_budget_finance",
+    ]
+    assert len(collection.filter_by_tag("uni.edu")) == 2
+    assert len(collection.filter_by_tag("unknown")) == 0
+    assert collection.tag_counts()["uni.edu"] == 2
+    assert collection.sort_by("name", descending=True).filter_by_tag("uni.edu")[0].name == "weather"
+
+    assert collection[2].tags == ("uni.edu", "finance", "education")
+    assert len(collection.query(tags="education")) == 1
+    assert list(collection.to_frame()["tags"][0]) == ["example.com", "agriculture"]
+
+
+def test_tags_computed_once_per_catalog_and_taxonomy():
+    store = CatalogStore.from_datasets([Dataset("a@x.org", "money_matters")])
+    tags = catalog_tags(store)
+    assert catalog_tags(store) is tags
+    assert tags.rows[0] == ("x.org", "finance")
+
+    set_taxonomy({"economics": ["money"]})
+    assert catalog_tags(store).rows[0] == ("x.org", "economics")
+
+
+def test_mixed_case_taxonomy_tags_match():
+    set_taxonomy({"Economics": ["money"], "ECONOMICS": ["Budget"]})
+    collection = DatasetCollection(
+        datasets=[Dataset("a@x.org", "money_matters"), Dataset("b@x.org", "budget_2020")]
+    )
+
+    assert collection[1].tags == ("x.org", "economics")
+    assert len(collection.filter_by_tag("Economics")) == 2
+    assert collection.tag_counts()["economics"] == 2
+
+
+def test_ranked_search_uses_tags():
+    collection = DatasetCollection(datasets=[Dataset("a@x.org", "patient_visits")])
+    assert len(collection.search("healthcare", ranked=True)) == 1
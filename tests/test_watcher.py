@@ -0,0 +1,55 @@
+"""Tests for incremental catalog refresh from filesystem changes."""
+
+import shutil
+import time
+
+import pytest
+
+from syft_datasets import DatasetCollection
+from syft_datasets.watcher import WATCHDOG_AVAILABLE, CatalogWatcher
+
+
+@pytest.fixture
+def collection(syftbox):
+    syftbox.add_datasite("alice@example.com", ["a1"])
+    syftbox.add_datasite("bob@example.com", ["b1"])
+    with syftbox.patched():
+        collection = DatasetCollection(use_cache=False)
+        syftbox.calls.clear()
+        yield collection
+
+
+def test_polling_patches_only_changed_datasites(syftbox, collection):
+    """Only added, changed and removed datasites are touched by a check."""
+    watcher = CatalogWatcher(collection, use_watchdog=False)
+    generation = collection.generation
+
+    assert watcher.check() == (set(), set())
+    assert collection.generation == generation
+
+    syftbox.add_datasite("bob@example.com", ["b1", "b2"])
+    syftbox.add_datasite("carol@example.com", ["c1"])
+    shutil.rmtree(syftbox.datasites / "alice@example.com")
+    changed, removed = watcher.check()
+
+    assert changed == {"bob@example.com", "carol@example.com"}
+    assert removed == {"alice@example.com"}
+    assert sorted(syftbox.calls) == ["bob@example.com", "carol@example.com"]
+    assert [ds.name for ds in collection] == ["b1", "b2", "c1"]
+    assert collection.generation == generation + 1
+
+
+@pytest.mark.skipif(not WATCHDOG_AVAILABLE, reason="watchdog not installed")
+def test_watchdog_notifications_refresh_collection(syftbox, collection):
+    """Filesystem events trigger a background refresh of the affected datasite."""
+    with collection.watch(interval=0.05, use_watchdog=True) as watcher:
+        assert watcher.mode == "watchdog"
+        syftbox.add_datasite("alice@example.com", ["a1", "a2"])
+
+        deadline = time.monotonic() + 5
+        while len(collection) < 3 and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    assert [ds.name for ds in collection] == ["a1", "a2", "b1"]
+    assert syftbox.calls == ["alice@example.com"]
+    assert not watcher.running